@@ -59,6 +59,7 @@ type AnimationState struct {
 	CurrentAnim AnimationType
 	Frame       int
 	Timer       float32
+	Progress    float32 // Fraction of the current frame elapsed, for pose playback
 	Queue       []AnimationType
 }
 
@@ -127,6 +128,7 @@ func (a *AnimationSystem) Update(deltaTime float32) {
 			a.onAnimationComplete()
 		}
 	}
+	a.state.Progress = min(a.state.Timer/a.frameDuration, 1)
 }
 
 // onAnimationComplete handles animation end
@@ -169,6 +171,7 @@ func (a *AnimationSystem) StartIdleSequence() {
 	}
 	a.state.Frame = 0
 	a.state.Timer = 0
+	a.state.Progress = 0
 	a.state.Queue = nil
 	a.onComplete = nil
 	a.loopMode = false
@@ -189,10 +192,16 @@ func (a *AnimationSystem) SetAnimation(anim AnimationType) {
 	a.state.CurrentAnim = anim
 	a.state.Frame = 0
 	a.state.Timer = 0
+	a.state.Progress = 0
 	a.state.Queue = nil
 	a.onComplete = nil
 }
 
+// FrameDuration returns the seconds each sprite frame is shown
+func (a *AnimationSystem) FrameDuration() float32 {
+	return a.frameDuration
+}
+
 // GetState returns the current animation state for rendering
 func (a *AnimationSystem) GetState() *AnimationState {
 	return a.state
@@ -213,6 +222,7 @@ func (a *AnimationSystem) SetFrame(frame int) {
 	}
 	a.state.Frame = frame
 	a.state.Timer = 0
+	a.state.Progress = 0
 }
 
 // StepFrame advances or rewinds by one frame (for debug stepping)
@@ -0,0 +1,61 @@
+package main
+
+import (
+	"archive/zip"
+	"bytes"
+	"fmt"
+	"io"
+	"os"
+	"sync"
+)
+
+// The asset bundle (assets/bundle.zip, embedded by assets_bundle_gen.go and
+// regenerated by `python -m devsprite build`) holds the 1x and 2x sprite
+// manifests with their sheet pages (pre-decoded blobs plus the PNGs they fall
+// back to), the pose rig and the default exercises/config, so a release
+// binary is self-contained: the npm package ships no loose asset files.
+
+var (
+	bundleOnce  sync.Once
+	bundleFiles map[string]*zip.File
+)
+
+func openBundle() map[string]*zip.File {
+	bundleOnce.Do(func() {
+		bundleFiles = make(map[string]*zip.File)
+		zr, err := zip.NewReader(bytes.NewReader(embeddedBundle), int64(len(embeddedBundle)))
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: embedded asset bundle is unreadable: %v\n", err)
+			return
+		}
+		for _, f := range zr.File {
+			bundleFiles[f.Name] = f
+		}
+	})
+	return bundleFiles
+}
+
+// bundledAsset returns a file from the embedded bundle by its assets-relative
+// name. Debug builds always miss so studio mode and hot reload use the files
+// on disk.
+func bundledAsset(name string) ([]byte, bool) {
+	if preferDiskAssets {
+		return nil, false
+	}
+	f, ok := openBundle()[name]
+	if !ok {
+		return nil, false
+	}
+	rc, err := f.Open()
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Warning: couldn't open bundled %s: %v\n", name, err)
+		return nil, false
+	}
+	defer rc.Close()
+	data, err := io.ReadAll(rc)
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Warning: couldn't read bundled %s: %v\n", name, err)
+		return nil, false
+	}
+	return data, true
+}
@@ -0,0 +1,11 @@
+// Code generated by cmd/devsprite build; DO NOT EDIT.
+
+package main
+
+import _ "embed"
+
+//go:embed assets/bundle.zip
+var embeddedBundle []byte
+
+// embeddedBundleHash is the SHA-256 of embeddedBundle
+const embeddedBundleHash = "232b2d15e8396020a0f1d02d8602a5a371747af8a0c8b1f552eaa100b46963ab"
@@ -10,6 +10,9 @@ import (
 // ============================================================================
 // BIOME: HOME OFFICE - Cozy single-person workspace
 // Animated: code on monitor, steam from mug, plant sway, cloud drift, sleeping cat
+//
+// Everything else is static: it is baked once into the biome layer (see
+// Renderer.prepareBiome) and each frame only draws the animated parts over it.
 // ============================================================================
 func (r *Renderer) drawBiomeOffice() {
 	time := r.biomeTimer
@@ -17,6 +20,35 @@ func (r *Renderer) drawBiomeOffice() {
 	// Shift character right so dual monitors are visible
 	r.ClaudeOffsetX = 20
 
+	if r.biomeLayerValid {
+		src := rl.Rectangle{X: 0, Y: float32(screenHeight), Width: float32(screenWidth), Height: -float32(screenHeight)}
+		rl.DrawTextureRec(r.biomeLayer.Texture, src, rl.Vector2{}, rl.White)
+	} else {
+		r.drawOfficeStatic()
+	}
+
+	// === ANIMATED PARTS ===
+	r.drawWindowCloud(85, 24, time)
+	r.drawWallClock(240, 40)
+	r.drawMonitorCode(116, 100, time)
+	r.drawMonitorCode(164, 100, time)
+	// The chair back covers the bottom code lines of the right monitor
+	r.drawOfficeChairBack(168, 142, officeDeskTop)
+	r.drawMugSteam(90, 131, time)
+	r.drawPlantLeaves(228, 126, time)
+
+	// === CAT on floor ===
+	if r.CatAlert && !r.CatPaused {
+		r.drawJumpingCat(265, 155, time)
+		r.drawCatAlertBanner(265, 155, r.CatAlertText)
+	} else {
+		r.drawSleepingCat(265, 155, time)
+	}
+}
+
+// drawOfficeStatic draws the parts of the office that never change, back to
+// front; this is what gets baked into the biome layer
+func (r *Renderer) drawOfficeStatic() {
 	// === CEILING (y=0-12) — warm off-white with wood trim ===
 	for y := int32(0); y < 12; y++ {
 		t := float32(y) / 12.0
@@ -45,13 +77,13 @@ func (r *Renderer) drawBiomeOffice() {
 
 	// === WALL ITEMS ===
 	r.drawBookshelf(8, 30)
-	r.drawOfficeWindow(85, 24, time)
+	r.drawOfficeWindow(85, 24)
 	r.drawWallArt(240, 40)
 
 	// === BEHIND-CHARACTER ITEMS (drawn before desk, behind Claude) ===
 	// Dual monitors — left fully visible, right partially behind character
-	r.drawMonitor(116, 100, time)
-	r.drawMonitor(164, 100, time)
+	r.drawMonitor(116, 100)
+	r.drawMonitor(164, 100)
 	r.drawOfficeChairBG(168, 142)
 
 	// === DESK SURFACE (y=138-143) — compact desk ===
@@ -65,9 +97,9 @@ func (r *Renderer) drawBiomeOffice() {
 	rl.DrawRectangle(deskX, 142, deskW, 1, rl.Color{R: 140, G: 108, B: 72, A: 255})
 
 	// === DESK ITEMS ===
-	r.drawDeskMug(90, 131, time)
+	r.drawDeskMug(90, 131)
 	r.drawKeyboard(155, 139)
-	r.drawDeskPlant(228, 126, time)
+	r.drawDeskPlant(228, 126)
 
 	// === DESK LEGS (below desk surface, y=143-162) ===
 	legColor := rl.Color{R: 140, G: 108, B: 72, A: 255}
@@ -81,14 +113,6 @@ func (r *Renderer) drawBiomeOffice() {
 
 	// === FLOOR (y=162-200) — hardwood planks ===
 	r.drawWoodFloor()
-
-	// === CAT on floor ===
-	if r.CatAlert && !r.CatPaused {
-		r.drawJumpingCat(265, 155, time)
-		r.drawCatAlertBanner(265, 155, r.CatAlertText)
-	} else {
-		r.drawSleepingCat(265, 155, time)
-	}
 }
 
 // --- HOME OFFICE ELEMENTS ---
@@ -152,7 +176,7 @@ func (r *Renderer) drawBookshelf(x, y int32) {
 	}
 }
 
-func (r *Renderer) drawOfficeWindow(x, y int32, time float32) {
+func (r *Renderer) drawOfficeWindow(x, y int32) {
 	frameColor := rl.Color{R: 200, G: 195, B: 185, A: 255}
 	winW := int32(90)
 	winH := int32(70)
@@ -308,12 +332,6 @@ func (r *Renderer) drawOfficeWindow(x, y int32, time float32) {
 	rl.DrawRectangle(x+paneW+2, y+2, winW-4-paneW*2, winH-4, frameColor)
 	rl.DrawRectangle(x+2, y+paneH+2, winW-4, winH-4-paneH*2, frameColor)
 
-	// Drifting cloud (adjusted for wider panes)
-	cloudX := int32(simpleSinF(float64(time*0.08)) * 15)
-	rl.DrawRectangle(x+15+cloudX, y+8, 12, 3, rl.Color{R: 245, G: 245, B: 248, A: 180})
-	rl.DrawRectangle(x+13+cloudX, y+10, 16, 3, rl.Color{R: 245, G: 245, B: 248, A: 150})
-	rl.DrawRectangle(x+16+cloudX, y+12, 10, 2, rl.Color{R: 245, G: 245, B: 248, A: 120})
-
 	// Sunlight glow on bottom panes
 	for py := y + winH - 2 - paneH; py < y+winH-2; py++ {
 		alpha := uint8(40 - 30*float32(py-(y+winH-2-paneH))/float32(paneH))
@@ -324,12 +342,26 @@ func (r *Renderer) drawOfficeWindow(x, y int32, time float32) {
 	rl.DrawRectangle(x-2, y+winH, winW+4, 3, rl.Color{R: 185, G: 180, B: 170, A: 255})
 }
 
+// drawWindowCloud drifts a cloud across the top panes of drawOfficeWindow
+func (r *Renderer) drawWindowCloud(x, y int32, time float32) {
+	// Adjusted for wider panes
+	cloudX := int32(simpleSinF(float64(time*0.08)) * 15)
+	rl.DrawRectangle(x+15+cloudX, y+8, 12, 3, rl.Color{R: 245, G: 245, B: 248, A: 180})
+	rl.DrawRectangle(x+13+cloudX, y+10, 16, 3, rl.Color{R: 245, G: 245, B: 248, A: 150})
+	rl.DrawRectangle(x+16+cloudX, y+12, 10, 2, rl.Color{R: 245, G: 245, B: 248, A: 120})
+}
+
+// Wall clock bezel size; drawWallArt draws the bezel, drawWallClock the time
+const (
+	wallClockW = int32(94)
+	wallClockH = int32(18)
+)
+
 func (r *Renderer) drawWallArt(x, y int32) {
-	bezelW := int32(94)
-	bezelH := int32(18)
+	bezelW := wallClockW
+	bezelH := wallClockH
 	bezelColor := rl.Color{R: 45, G: 45, B: 50, A: 255}
 	screenColor := rl.Color{R: 15, G: 20, B: 15, A: 255}
-	lcdGreen := rl.Color{R: 0, G: 220, B: 80, A: 255}
 
 	// Center the wider display at the original call site
 	cx := x + (24-bezelW)/2
@@ -342,6 +374,13 @@ func (r *Renderer) drawWallArt(x, y int32) {
 	rl.DrawRectangle(screenX, y+2, screenW, bezelH-4, screenColor)
 	// Wall-mount shadow
 	rl.DrawRectangle(cx+1, y+bezelH, bezelW-2, 1, rl.Color{R: 35, G: 35, B: 38, A: 255})
+}
+
+// drawWallClock draws the live UTC time on the drawWallArt screen
+func (r *Renderer) drawWallClock(x, y int32) {
+	lcdGreen := rl.Color{R: 0, G: 220, B: 80, A: 255}
+	screenX := x + (24-wallClockW)/2 + 2
+	screenW := wallClockW - 4
 
 	// Live UTC time
 	now := time.Now().UTC()
@@ -356,7 +395,7 @@ func (r *Renderer) drawWallArt(x, y int32) {
 	rl.DrawText(timeLine, timeX, y+10, 8, lcdGreen)
 }
 
-func (r *Renderer) drawMonitor(x, y int32, time float32) {
+func (r *Renderer) drawMonitor(x, y int32) {
 	// Stand
 	rl.DrawRectangle(x+16, y+30, 8, 8, rl.Color{R: 70, G: 70, B: 75, A: 255})
 	rl.DrawRectangle(x+12, y+37, 16, 3, rl.Color{R: 80, G: 80, B: 85, A: 255})
@@ -364,7 +403,10 @@ func (r *Renderer) drawMonitor(x, y int32, time float32) {
 	rl.DrawRectangle(x, y, 40, 30, rl.Color{R: 45, G: 45, B: 50, A: 255})
 	// Screen
 	rl.DrawRectangle(x+2, y+2, 36, 26, rl.Color{R: 30, G: 35, B: 45, A: 255})
+}
 
+// drawMonitorCode draws the scrolling code and cursor on a drawMonitor screen
+func (r *Renderer) drawMonitorCode(x, y int32, time float32) {
 	// Code lines with slow scroll
 	codeScroll := int32(time * 0.5)
 	lineColors := []rl.Color{
@@ -407,7 +449,7 @@ func (r *Renderer) drawKeyboard(x, y int32) {
 	}
 }
 
-func (r *Renderer) drawDeskMug(x, y int32, time float32) {
+func (r *Renderer) drawDeskMug(x, y int32) {
 	mugColor := rl.Color{R: 230, G: 230, B: 225, A: 255}
 	mugShadow := rl.Color{R: 200, G: 200, B: 195, A: 255}
 	rl.DrawRectangle(x, y, 7, 8, mugColor)
@@ -419,6 +461,10 @@ func (r *Renderer) drawDeskMug(x, y int32, time float32) {
 	rl.DrawPixel(x+8, y+3, mugShadow)
 	rl.DrawPixel(x+8, y+4, mugShadow)
 	rl.DrawPixel(x+7, y+5, mugShadow)
+}
+
+// drawMugSteam draws steam rising from drawDeskMug
+func (r *Renderer) drawMugSteam(x, y int32, time float32) {
 	// Gentle steam
 	sway := int32(simpleSinF(float64(time*0.8)) * 2)
 	alpha1 := uint8(100 + 50*simpleSinF(float64(time*1.2)))
@@ -428,21 +474,26 @@ func (r *Renderer) drawDeskMug(x, y int32, time float32) {
 	rl.DrawPixel(x+3+sway, y-4, rl.Color{R: 200, G: 200, B: 210, A: alpha1 / 2})
 }
 
-func (r *Renderer) drawDeskPlant(x, y int32, time float32) {
+func (r *Renderer) drawDeskPlant(x, y int32) {
 	potColor := rl.Color{R: 180, G: 100, B: 70, A: 255}
 	potDark := rl.Color{R: 150, G: 80, B: 55, A: 255}
 	rl.DrawRectangle(x, y+6, 10, 7, potColor)
 	rl.DrawRectangle(x-1, y+5, 12, 2, potDark)
 	// Soil
 	rl.DrawRectangle(x+1, y+5, 8, 1, rl.Color{R: 60, G: 45, B: 30, A: 255})
-	// Leaves with sway
-	sway := int32(simpleSinF(float64(time*0.5)) * 1)
-	leafGreen := rl.Color{R: 60, G: 140, B: 70, A: 255}
-	leafLight := rl.Color{R: 80, G: 170, B: 90, A: 255}
 	// Stem
+	leafGreen := rl.Color{R: 60, G: 140, B: 70, A: 255}
 	rl.DrawPixel(x+5, y+4, leafGreen)
 	rl.DrawPixel(x+5, y+3, leafGreen)
 	rl.DrawPixel(x+5, y+2, leafGreen)
+}
+
+// drawPlantLeaves draws the swaying leaves of drawDeskPlant
+func (r *Renderer) drawPlantLeaves(x, y int32, time float32) {
+	// Leaves with sway
+	sway := int32(simpleSinF(float64(time*0.5)) * 1)
+	leafGreen := rl.Color{R: 60, G: 140, B: 70, A: 255}
+	leafLight := rl.Color{R: 80, G: 170, B: 90, A: 255}
 	// Left leaves
 	rl.DrawPixel(x+3+sway, y+1, leafGreen)
 	rl.DrawPixel(x+2+sway, y, leafLight)
@@ -455,17 +506,28 @@ func (r *Renderer) drawDeskPlant(x, y int32, time float32) {
 	rl.DrawPixel(x+5, y-2, leafLight)
 }
 
+var (
+	officeChairColor = rl.Color{R: 55, G: 55, B: 60, A: 255}
+	officeChairLight = rl.Color{R: 65, G: 65, B: 70, A: 255}
+)
+
+// officeDeskTop is the first row of the desk surface; the desk and keyboard
+// are drawn over everything below it
+const officeDeskTop = 138
+
 func (r *Renderer) drawOfficeChairBG(x, y int32) {
 	// Chair back (visible above seat, behind character)
-	chairColor := rl.Color{R: 55, G: 55, B: 60, A: 255}
-	chairLight := rl.Color{R: 65, G: 65, B: 70, A: 255}
-
-	// Back rest
-	rl.DrawRectangle(x, y-18, 16, 18, chairColor)
-	rl.DrawRectangle(x+1, y-17, 14, 16, chairLight)
+	r.drawOfficeChairBack(x, y, y)
 
 	// Seat (partially visible)
-	rl.DrawRectangle(x-4, y, 24, 4, chairColor)
+	rl.DrawRectangle(x-4, y, 24, 4, officeChairColor)
+}
+
+// drawOfficeChairBack draws the back rest of a chair whose seat is at y,
+// only the rows above bottom
+func (r *Renderer) drawOfficeChairBack(x, y, bottom int32) {
+	rl.DrawRectangle(x, y-18, 16, min(18, bottom-(y-18)), officeChairColor)
+	rl.DrawRectangle(x+1, y-17, 14, min(16, bottom-(y-17)), officeChairLight)
 }
 
 func (r *Renderer) drawSleepingCat(x, y int32, time float32) {
@@ -0,0 +1,10 @@
+"""Pixel-art asset tooling for Claude Gym.
+
+Run from the cmd/ directory:
+
+    python -m devsprite build [targets]   # regenerate stale assets
+    python -m devsprite preview           # live browser preview
+    python -m devsprite scene out.png     # office scene frame, no window
+    python -m devsprite export out/       # demo + exercise GIF/APNG/WebP
+    python -m devsprite bench             # sheet build time per kernel backend
+"""
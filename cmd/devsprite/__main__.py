@@ -0,0 +1,185 @@
+"""Command line entry point: python -m devsprite <command>."""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from .build import SHEET_LAYOUT, SPRITE_SCALES, BuildError, Graph, default_targets, rel
+from .generate_exercises import LAYOUTS
+
+
+def cmd_build(args):
+    try:
+        graph = Graph(default_targets(scales=args.scales, layout=args.layout))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.list:
+        for name, target in graph.targets.items():
+            status = "up to date" if graph.is_up_to_date(target) else "stale"
+            deps = f" (after {', '.join(target.deps)})" if target.deps else ""
+            print(f"{name:<14} {status:<11} {target.description}{deps}")
+            if args.verbose:
+                for path in target.outputs:
+                    print(f"    {rel(path)}")
+        return 0
+
+    start = time.perf_counter()
+    try:
+        built, skipped = graph.build(args.targets or list(graph.targets), jobs=args.jobs, force=args.force)
+    except BuildError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{len(built)} built, {len(skipped)} up to date ({time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+def cmd_preview(args):
+    from . import preview_server
+    preview_server.run(args.host, args.port, args.scale)
+    return 0
+
+
+def cmd_scene(args):
+    from .scene import Scene
+    scene = Scene()
+    if args.frames > 1 and "{" not in args.out:
+        root, ext = os.path.splitext(args.out)
+        args.out = root + "_{:04d}" + ext
+    start = time.perf_counter()
+    frames = scene.frames(args.frames, fps=args.fps, start=args.time, anim=args.anim, mode=args.mode,
+                          text=args.text.replace("\\n", "\n"), cat_alert=args.cat_alert)
+    try:
+        for i, canvas in enumerate(frames):
+            img = canvas.image()
+            if args.scale > 1:
+                img = img.resize((img.width * args.scale, img.height * args.scale), Image.NEAREST)
+            img.save(args.out.format(i))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{args.frames} frames ({time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+def cmd_export(args):
+    from . import animexport
+    exercises = animexport.load_exercises()
+    jobs = animexport.default_jobs(exercises, loops=args.loops, demo=not args.exercise)
+    if args.exercise:
+        wanted = {animexport.slug(n) for n in args.exercise}
+        jobs = [job for job in jobs if job[0] in wanted]
+        missing = wanted - {name for name, _ in jobs}
+        if missing:
+            print(f"Error: unknown exercise {', '.join(sorted(missing))}", file=sys.stderr)
+            return 1
+    region = animexport.CHARACTER_BOX if args.character else None
+
+    start = time.perf_counter()
+    sizes = animexport.export_all(jobs, args.out_dir, formats=args.format, region=region,
+                                  scale=args.scale, workers=args.jobs)
+    for path, size in sorted(sizes.items()):
+        print(f"{path:<40} {size / 1024:>8.1f} KiB")
+    print(f"{len(sizes)} files ({time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+def cmd_bench(args):
+    from . import generate_exercises, kernels
+    backends = args.backend or list(kernels.BACKENDS)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in backends:
+            try:
+                kernels.use(name)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+            out_dir = os.path.join(tmp, name)
+            # Untimed first build: numba compiles here, poses fill their caches
+            paths = generate_exercises.stream_sheet(out_dir, previews=False, scales=args.scales)
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                generate_exercises.stream_sheet(out_dir, previews=False, scales=args.scales)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            digest = hashlib.sha256()
+            for path in sorted(paths):
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+            results[name] = (best, digest.hexdigest())
+
+    ref = results.get("python", results[backends[0]])[0]
+    for name, (best, _) in results.items():
+        print(f"{name:<8} {best:.3f}s  {ref / best:.2f}x")
+    if len({digest for _, digest in results.values()}) > 1:
+        print("Error: backends wrote different sheets", file=sys.stderr)
+        return 1
+    print(f"identical output ({', '.join(str(s) for s in sorted(set(args.scales) | {1}))}x sheets)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m devsprite", description="Claude Gym asset tooling.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="regenerate stale assets")
+    p.add_argument("targets", nargs="*", help="targets to build (default: all)")
+    p.add_argument("-j", "--jobs", type=int, default=None, help="parallel targets (default: CPU count)")
+    p.add_argument("-f", "--force", action="store_true", help="rebuild even if up to date")
+    p.add_argument("-l", "--list", action="store_true", help="list targets and their status")
+    p.add_argument("-v", "--verbose", action="store_true", help="with --list, show outputs")
+    p.add_argument("--scales", type=int, nargs="+", default=list(SPRITE_SCALES), metavar="N",
+                   help=f"sheet render scales to build and bundle "
+                        f"(default: {' '.join(map(str, SPRITE_SCALES))}; 1 is always built)")
+    p.add_argument("--layout", choices=LAYOUTS, default=SHEET_LAYOUT,
+                   help=f"sheet page layout: 'sheet' packs rows densely, 'rows' gives each exercise "
+                        f"its own texture (default: {SHEET_LAYOUT})")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("preview", help="live browser preview of the sprite sheet")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--scale", type=int, default=6, help="initial display scale (1-12)")
+    p.set_defaults(func=cmd_preview)
+
+    p = sub.add_parser("scene", help="render office scene frames without a window")
+    p.add_argument("out", help="PNG path; with --frames, may hold a {} frame-number field")
+    p.add_argument("-t", "--time", type=float, default=0.0, help="biome time of the first frame (seconds)")
+    p.add_argument("-n", "--frames", type=int, default=1, help="consecutive frames to render")
+    p.add_argument("--fps", type=float, default=12.0, help="frames per second of biome time")
+    p.add_argument("-a", "--anim", default="wondering", help="animation name from the sprite manifest")
+    p.add_argument("-m", "--mode", default="idle", help="UI overlay: idle, menu, prompting, pump_up, countdown, exercising, paused")
+    p.add_argument("--text", default="", help="exercise bubble text for exercising/paused (\\n for new lines)")
+    p.add_argument("--cat-alert", help="cat alert banner text")
+    p.add_argument("-s", "--scale", type=int, default=1, help="integer upscale of the saved PNGs")
+    p.set_defaults(func=cmd_scene)
+
+    p = sub.add_parser("export", help="animated GIF/APNG/WebP of the demo and each exercise")
+    p.add_argument("out_dir", help="output directory")
+    p.add_argument("exercise", nargs="*", help="exercise names to export (default: demo and all exercises)")
+    p.add_argument("-f", "--format", nargs="+", choices=("gif", "apng", "webp"), default=["gif", "apng", "webp"])
+    p.add_argument("--loops", type=int, default=2, help="animation loops per exercise")
+    p.add_argument("--character", action="store_true", help="crop to the character instead of the whole office")
+    p.add_argument("-s", "--scale", type=int, default=1, help="integer upscale")
+    p.add_argument("-j", "--jobs", type=int, default=None, help="parallel encodes (default: CPU count)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("bench", help="time a full sheet build on each pixel kernel backend")
+    p.add_argument("-b", "--backend", nargs="+", help="backends to time (default: all available)")
+    p.add_argument("--scales", type=int, nargs="+", default=[1], metavar="N", help="render scales, as in generate_exercises.py")
+    p.add_argument("-n", "--repeat", type=int, default=5, help="timed builds per backend; the best is reported")
+    p.set_defaults(func=cmd_bench)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
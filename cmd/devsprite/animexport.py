@@ -0,0 +1,265 @@
+"""Animated GIF / APNG / WebP export of composed office scenes.
+
+A job is a list of shots -- animation, UI mode, bubble text, frame count --
+rendered with scene.Scene at the game's sprite cadence and then encoded with:
+
+- one global palette per job (GIF, APNG), covering every color its frames
+  use, so frames carry no color tables and colors don't shift between them;
+- duplicate-frame coalescing: a frame identical to the one before it just
+  extends that frame's delay;
+- delta frames: after the first, each frame is only the dirty rectangle of
+  pixels that changed, with unchanged pixels inside it transparent so the
+  previous frame shows through (GIF, APNG; libwebp searches sub-frames
+  itself).
+
+The wall clock in the scene follows frame time, so output is deterministic
+and regenerating a file gives the same bytes. Jobs run in parallel, one
+process per CPU.
+"""
+import datetime
+import json
+import os
+import re
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import GifImagePlugin, Image
+
+from .pngstream import SIGNATURE, _chunk
+from .scene import FRAME_SECONDS, Scene
+
+FORMATS = ("gif", "apng", "webp")
+EXTENSIONS = {"gif": ".gif", "apng": ".png", "webp": ".webp"}
+TRANSPARENT = 255  # Palette index kept free for unchanged pixels
+CLOCK_START = datetime.datetime(2025, 1, 6, 9, 41, 0, tzinfo=datetime.timezone.utc)
+CHARACTER_BOX = (148, 106, 64, 64)  # Where drawClaude puts the sprite in the office
+EXERCISES_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "exercises.json"))
+ANIM_FRAMES = 16
+
+# The README demo: idle, Claude finishes, a prompt, the countdown and a round
+DEMO = [
+    {"anim": "wondering", "frames": 32},
+    {"anim": "coffee_idle", "frames": 16, "cat_alert": "Claude Code is done!"},
+    {"anim": "wondering", "frames": 24, "mode": "prompting", "cat_alert": "Claude Code is done!"},
+    {"anim": "pump_up", "frames": 16, "mode": "pump_up"},
+    {"anim": "pump_up", "frames": 12, "mode": "countdown", "countdown": 3},
+    {"anim": "pump_up", "frames": 12, "mode": "countdown", "countdown": 2},
+    {"anim": "pump_up", "frames": 12, "mode": "countdown", "countdown": 1},
+    {"exercise": "Chair Dips", "frames": 48},
+    {"exercise": "Arm Circles", "frames": 48},
+]
+
+
+def slug(name):
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def load_exercises(path=EXERCISES_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def exercise_shot(exercise, frames):
+    """A shot of an exercise as ModeExercising shows it (BubbleText)."""
+    return {
+        "anim": exercise["anim_row"],
+        "frames": frames,
+        "mode": "exercising",
+        "text": f"Let's do {exercise['name']}!\n{exercise['reps']}",
+    }
+
+
+def default_jobs(exercises, loops=2, demo=True):
+    """(name, shots) for the demo and one preview per exercise."""
+    by_name = {e["name"]: e for e in exercises}
+    jobs = []
+    if demo:
+        shots = [exercise_shot(by_name[s["exercise"]], s["frames"]) if "exercise" in s else s for s in DEMO]
+        jobs.append(("demo", shots))
+    for e in exercises:
+        jobs.append((slug(e["name"]), [exercise_shot(e, ANIM_FRAMES * loops)]))
+    return jobs
+
+
+# =========================================================================
+# FRAMES
+# =========================================================================
+
+def render_frames(scene, shots, region=None, scale=1):
+    """Render shots back to back; returns coalesced (rgb array, ms) frames."""
+    frames = []
+    t = 0.0
+    ms_done = 0
+    for shot in shots:
+        for i in range(shot["frames"]):
+            canvas = scene.render(
+                t=t, anim=shot.get("anim", "wondering"), frame=i % ANIM_FRAMES, mode=shot.get("mode", "idle"),
+                text=shot.get("text", ""), countdown=shot.get("countdown", 3), cat_alert=shot.get("cat_alert"),
+                clock=CLOCK_START + datetime.timedelta(seconds=t),
+            )
+            px = np.asarray(canvas.image())
+            if region:
+                x, y, w, h = region
+                px = px[y:y + h, x:x + w]
+            if scale > 1:
+                px = px.repeat(scale, axis=0).repeat(scale, axis=1)
+
+            # Whole-millisecond delays that add up to the real elapsed time
+            t += FRAME_SECONDS
+            ms = round(t * 1000) - ms_done
+            ms_done += ms
+            if frames and np.array_equal(frames[-1][0], px):
+                frames[-1][1] += ms
+            else:
+                frames.append([px, ms])
+    return [(px, ms) for px, ms in frames]
+
+
+def pack(rgb):
+    return (rgb[..., 0].astype(np.uint32) << 16) | (rgb[..., 1].astype(np.uint32) << 8) | rgb[..., 2]
+
+
+def global_palette(frames, colors=TRANSPARENT, sample=16):
+    """One palette for every frame: exact if the job has few enough colors,
+    otherwise a median cut over up to sample frames plus one pixel of every
+    color used. Returns (palette, index frames)."""
+    packed = [pack(px) for px, _ in frames]
+    keys = np.unique(np.concatenate([p.ravel() for p in packed]))
+    rgb = np.stack([(keys >> 16) & 255, (keys >> 8) & 255, keys & 255], axis=1).astype(np.uint8)
+
+    if len(keys) <= colors:
+        palette = rgb
+        lut = np.arange(len(keys), dtype=np.uint8)
+    else:
+        step = max(1, len(frames) // sample)
+        w = frames[0][0].shape[1]
+        extra = np.zeros((-(-len(rgb) // w) * w, 3), dtype=np.uint8)
+        extra[:len(rgb)] = rgb
+        stacked = np.concatenate([px for px, _ in frames[::step]] + [extra.reshape(-1, w, 3)])
+        quant = Image.fromarray(stacked, "RGB").quantize(colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+        palette = np.array(quant.getpalette()[:colors * 3], dtype=np.uint8).reshape(-1, 3)
+        # Nearest palette entry for each distinct color
+        lut = np.empty(len(keys), dtype=np.uint8)
+        pal = palette.astype(np.int32)
+        for i in range(0, len(keys), 4096):
+            d = ((rgb[i:i + 4096, None, :].astype(np.int32) - pal[None]) ** 2).sum(axis=2)
+            lut[i:i + 4096] = d.argmin(axis=1)
+
+    return palette, [lut[np.searchsorted(keys, p)] for p in packed]
+
+
+def delta_frames(indexed, durations):
+    """(x, y, sub-image, ms) per output frame: the first whole, later ones cut
+    to their dirty rectangle with unchanged pixels set to TRANSPARENT.
+    Frames that don't change anything are merged into the one before."""
+    out = [[0, 0, indexed[0], durations[0]]]
+    prev = indexed[0]
+    for cur, ms in zip(indexed[1:], durations[1:]):
+        changed = cur != prev
+        rows, cols = np.flatnonzero(changed.any(axis=1)), np.flatnonzero(changed.any(axis=0))
+        if not len(rows):
+            out[-1][3] += ms
+            continue
+        y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        sub = np.where(changed[y0:y1, x0:x1], cur[y0:y1, x0:x1], TRANSPARENT).astype(np.uint8)
+        out.append([int(x0), int(y0), sub, ms])
+        prev = cur
+    return out
+
+
+# =========================================================================
+# ENCODERS
+# =========================================================================
+
+def write_gif(path, palette, deltas, loop=0):
+    h, w = deltas[0][2].shape
+    table = np.zeros((256, 3), dtype=np.uint8)
+    table[:len(palette)] = palette
+    with open(path, "wb") as f:
+        # Global color table of 256 entries, no local tables
+        f.write(b"GIF89a" + struct.pack("<HHBBB", w, h, 0xF7, 0, 0) + table.tobytes())
+        f.write(b"!\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+        ms_done = cs_done = 0
+        for x, y, sub, ms in deltas:
+            # GIF delays are centiseconds; round the running total, not each frame
+            ms_done += ms
+            cs = round(ms_done / 10) - cs_done
+            cs_done += cs
+            im = Image.fromarray(sub, "P")
+            for data in GifImagePlugin.getdata(im, offset=(x, y), transparency=TRANSPARENT, duration=cs * 10, disposal=1):
+                f.write(data)
+        f.write(b";")
+
+
+def write_apng(path, palette, deltas, loop=0):
+    h, w = deltas[0][2].shape
+    alpha = bytes([255] * len(palette) + [0] * (TRANSPARENT + 1 - len(palette)))
+    table = np.zeros((TRANSPARENT + 1, 3), dtype=np.uint8)
+    table[:len(palette)] = palette
+    with open(path, "wb") as f:
+        f.write(SIGNATURE)
+        _chunk(f, b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 3, 0, 0, 0))  # 8-bit indexed
+        _chunk(f, b"acTL", struct.pack(">II", len(deltas), loop))
+        _chunk(f, b"PLTE", table.tobytes())
+        _chunk(f, b"tRNS", alpha)
+        seq = 0
+        for i, (x, y, sub, ms) in enumerate(deltas):
+            sh, sw = sub.shape
+            # dispose_op NONE, blend_op OVER: transparent pixels keep the previous frame
+            _chunk(f, b"fcTL", struct.pack(">IIIIIHHBB", seq, sw, sh, x, y, ms, 1000, 0, 1))
+            seq += 1
+            raw = np.empty((sh, sw + 1), dtype=np.uint8)
+            raw[:, 0] = 0  # Filter None per row, as in pngstream
+            raw[:, 1:] = sub
+            data = zlib.compress(raw.tobytes(), 9)
+            if i == 0:
+                _chunk(f, b"IDAT", data)
+            else:
+                _chunk(f, b"fdAT", struct.pack(">I", seq) + data)
+                seq += 1
+        _chunk(f, b"IEND", b"")
+
+
+def write_webp(path, frames, loop=0):
+    images = [Image.fromarray(px, "RGB") for px, _ in frames]
+    images[0].save(path, save_all=True, append_images=images[1:], duration=[ms for _, ms in frames],
+                   loop=loop, lossless=True, quality=100, method=4, minimize_size=True)
+
+
+# =========================================================================
+# JOBS
+# =========================================================================
+
+def export_job(name, shots, out_dir, formats=FORMATS, region=None, scale=1, loop=0):
+    """Render and encode one job; returns {path: bytes written}."""
+    frames = render_frames(Scene(), shots, region, scale)
+    sizes = {}
+    deltas = None
+    for fmt in formats:
+        path = os.path.join(out_dir, name + EXTENSIONS[fmt])
+        if fmt == "webp":
+            write_webp(path, frames, loop)
+        else:
+            if deltas is None:
+                palette, indexed = global_palette(frames)
+                deltas = delta_frames(indexed, [ms for _, ms in frames])
+            (write_gif if fmt == "gif" else write_apng)(path, palette, deltas, loop)
+        sizes[path] = os.path.getsize(path)
+    return sizes
+
+
+def export_all(jobs, out_dir, formats=FORMATS, region=None, scale=1, loop=0, workers=None):
+    """Run export_job for every (name, shots) job, in parallel."""
+    os.makedirs(out_dir, exist_ok=True)
+    args = [(name, shots, out_dir, formats, region, scale, loop) for name, shots in jobs]
+    if workers == 1 or len(jobs) < 2:
+        results = [export_job(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(export_job, *zip(*args)))
+    sizes = {}
+    for r in results:
+        sizes.update(r)
+    return sizes
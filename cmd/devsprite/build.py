@@ -0,0 +1,290 @@
+"""Build graph for generated art assets.
+
+Each output (character PNG, sprite sheet, previews, class-select art, the
+embedded Go asset bundle) is a Target with declared inputs and outputs. A
+target is up to date when its outputs exist and the content hashes of its
+inputs and outputs match the stamps recorded by the last successful build. A target whose input is another
+target's output depends on it; independent targets run in parallel threads
+inside one warm process, so Pillow and the generator modules load once.
+
+All paths are resolved from the repo root, never from the current directory.
+"""
+import ast
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import bundle, generate, generate_exercises
+from readme_art import class_select
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+ASSETS = os.path.join(ROOT, "assets")
+DEV_ASSETS = os.path.join(ASSETS, "developer")
+STAMP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".build-stamps.json")
+
+# Sheet render scales built and bundled by default. The renderer draws a
+# frame at 2x (claudeScale), so sheets finer than 2x look no sharper
+SPRITE_SCALES = (1, 2)
+
+# Sheet page layout: "sheet" packs rows densely, "rows" gives each exercise
+# its own page (see generate_exercises.build_manifest)
+SHEET_LAYOUT = generate_exercises.PAGE_LAYOUT
+
+
+def rel(path):
+    return os.path.relpath(path, ROOT)
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def module_sources(module):
+    """Source files of a devsprite module and of every devsprite module it
+    imports, directly or through others, so a change to a shared helper
+    rebuilds everything generated with it."""
+    pkg_dir = os.path.dirname(os.path.abspath(__file__))
+    seen = []
+    todo = [os.path.abspath(module.__file__)]
+    while todo:
+        path = todo.pop()
+        if path in seen:
+            continue
+        seen.append(path)
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            # from .x import y / from . import x
+            if isinstance(node, ast.ImportFrom) and node.level == 1:
+                names = [node.module] if node.module else [a.name for a in node.names]
+                for name in names:
+                    dep = os.path.join(pkg_dir, name.split(".")[0] + ".py")
+                    if os.path.exists(dep):
+                        todo.append(dep)
+    return sorted(seen)
+
+
+class BuildError(Exception):
+    pass
+
+
+class Target:
+    """One buildable output group.
+
+    inputs:  files whose content determines the outputs
+    outputs: files the action writes
+    action:  callable(target) that writes every path in outputs
+    options: build options the action reads; changing one makes the
+             target stale like an input edit
+    """
+
+    def __init__(self, name, inputs, outputs, action, description="", options=None):
+        self.name = name
+        self.inputs = [os.path.normpath(p) for p in inputs]
+        self.outputs = [os.path.normpath(p) for p in outputs]
+        self.action = action
+        self.description = description
+        self.options = options or {}
+        self.deps = []  # filled in by Graph
+
+    def input_digest(self):
+        h = hashlib.sha256(self.name.encode())
+        if self.options:
+            h.update(json.dumps(self.options, sort_keys=True).encode())
+        for path in self.inputs:
+            if not os.path.exists(path):
+                raise BuildError(f"{self.name}: missing input {rel(path)}")
+            h.update(rel(path).encode())
+            h.update(file_digest(path).encode())
+        return h.hexdigest()
+
+    def output_digests(self):
+        return {rel(p): file_digest(p) for p in self.outputs}
+
+
+class Graph:
+    """Targets plus the recorded stamps of their last successful builds."""
+
+    def __init__(self, targets, stamp_file=STAMP_FILE):
+        self.targets = {t.name: t for t in targets}
+        self.stamp_file = stamp_file
+        self.stamps = self._load_stamps()
+        self._stamp_lock = threading.Lock()
+
+        self.producers = {}
+        for t in targets:
+            for out in t.outputs:
+                self.producers[out] = t
+        for t in targets:
+            t.deps = sorted({self.producers[i].name for i in t.inputs
+                             if i in self.producers and self.producers[i] is not t})
+
+    def _load_stamps(self):
+        try:
+            with open(self.stamp_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_stamps(self):
+        tmp = self.stamp_file + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.stamps, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.stamp_file)
+
+    def closure(self, names):
+        """Requested targets plus everything they depend on, in dependency order."""
+        order = []
+        seen = set()
+
+        def visit(name):
+            if name in seen:
+                return
+            if name not in self.targets:
+                raise BuildError(f"unknown target '{name}' (try --list)")
+            seen.add(name)
+            for dep in self.targets[name].deps:
+                visit(dep)
+            order.append(name)
+
+        for name in names:
+            visit(name)
+        return order
+
+    def is_up_to_date(self, target):
+        # An input another target hasn't written yet: stale, not an error
+        if any(i in self.producers and not os.path.exists(i) for i in target.inputs):
+            return False
+        stamp = self.stamps.get(target.name)
+        if not stamp or stamp.get("inputs") != target.input_digest():
+            return False
+        if any(not os.path.exists(p) for p in target.outputs):
+            return False
+        return stamp.get("outputs") == target.output_digests()
+
+    def _run(self, target, force):
+        if not force and self.is_up_to_date(target):
+            return False
+        start = time.perf_counter()
+        target.action(target)
+        missing = [rel(p) for p in target.outputs if not os.path.exists(p)]
+        if missing:
+            raise BuildError(f"{target.name}: action did not write {', '.join(missing)}")
+        stamp = {"inputs": target.input_digest(), "outputs": target.output_digests()}
+        with self._stamp_lock:
+            self.stamps[target.name] = stamp
+            self._save_stamps()
+        print(f"  built {target.name} ({time.perf_counter() - start:.2f}s)")
+        return True
+
+    def build(self, names, jobs=None, force=False):
+        """Build names and their dependencies. Returns (built, skipped) names.
+
+        force rebuilds the named targets; their dependencies still only
+        rebuild when stale.
+        """
+        order = self.closure(names)
+        forced = set(names) if force else set()
+        pending = {name: set(self.targets[name].deps) & set(order) for name in order}
+        built, skipped = [], []
+
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+            running = {}
+            while pending or running:
+                for name in [n for n, deps in pending.items() if not deps]:
+                    del pending[name]
+                    running[pool.submit(self._run, self.targets[name], name in forced)] = name
+                if not running:
+                    raise BuildError(f"dependency cycle among: {', '.join(sorted(pending))}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut)
+                    (built if fut.result() else skipped).append(name)
+                    for deps in pending.values():
+                        deps.discard(name)
+        return built, skipped
+
+
+# =========================================================================
+# TARGETS
+# =========================================================================
+
+def _build_character(target):
+    generate.write_character(generate.render(), DEV_ASSETS)
+
+
+def _build_sheet(target):
+    generate_exercises.stream_sheet(DEV_ASSETS, previews=False, layout=target.options["layout"],
+                                    scales=target.options["scales"])
+
+
+def _build_previews(target):
+    generate_exercises.stream_sheet(DEV_ASSETS, sheet=False)
+
+
+def _build_class_select(target):
+    data = class_select.load_data()
+    class_select.render_variants(data, data["variants"])
+
+
+def _build_bundle(target):
+    bundle.write_bundle(*target.outputs, manifests=target.options["manifests"])
+
+
+def default_targets(scales=SPRITE_SCALES, layout=SHEET_LAYOUT):
+    """The build graph; scales are the sheet render scales to build and
+    bundle (1x is always included), layout the page layout of every sheet."""
+    scales = generate_exercises.sheet_scales(scales)
+    sheet = generate_exercises.sheet_paths(DEV_ASSETS, layout=layout, scales=scales)
+    cs_data = class_select.load_data()
+    cs_fonts = {class_select.font_path(loc.get("font", cs_data["font"]))
+                for loc in cs_data["locales"].values()}
+
+    return [
+        Target(
+            "character",
+            inputs=module_sources(generate),
+            outputs=[os.path.join(DEV_ASSETS, "dev_character.png"),
+                     os.path.join(DEV_ASSETS, "dev_character_preview.png")],
+            action=_build_character,
+            description="32x32 developer character + 8x preview",
+        ),
+        Target(
+            "sheet",
+            inputs=module_sources(generate_exercises),
+            outputs=sheet,
+            action=_build_sheet,
+            description="exercise sprite sheet pages + manifests loaded by the renderer",
+            options={"scales": scales, "layout": layout},
+        ),
+        Target(
+            "previews",
+            inputs=module_sources(generate_exercises),
+            outputs=generate_exercises.preview_paths(DEV_ASSETS),
+            action=_build_previews,
+            description="4x sheet preview + 8x key frame previews",
+        ),
+        Target(
+            "class-select",
+            inputs=[class_select.__file__, class_select.DATA_PATH] + sorted(cs_fonts),
+            outputs=[class_select.variant_path(v) for v in cs_data["variants"]],
+            action=_build_class_select,
+            description="README 'select your class' art",
+        ),
+        Target(
+            "bundle",
+            inputs=sheet + [os.path.join(ROOT, "exercises.json"), os.path.join(ROOT, "config.json"), *module_sources(bundle)],
+            outputs=[bundle.BUNDLE_PATH, bundle.GO_PATH],
+            action=_build_bundle,
+            description="go:embed bundle of sprite pages, manifests, pose rig and default configs",
+            options={"manifests": [f"developer/{generate_exercises.manifest_name(s)}" for s in scales]},
+        ),
+    ]
@@ -0,0 +1,108 @@
+"""Embedded asset bundle for the Go binary.
+
+Packs the sprite manifests (one per render scale), their sheet pages (the
+pre-decoded blobs and the PNGs the runtime falls back to), the pose rig with
+its parts atlas and the default JSON configs into a deterministic zip
+(assets/bundle.zip) and writes assets_bundle_gen.go, which embeds it with
+go:embed. The runtime then reads these from memory instead of probing the
+filesystem.
+
+Both files are only rewritten when their content changes, so an unchanged
+bundle never dirties the Go build cache.
+"""
+import hashlib
+import io
+import json
+import os
+import zipfile
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+BUNDLE_PATH = os.path.join(ROOT, "assets", "bundle.zip")
+GO_PATH = os.path.join(ROOT, "assets_bundle_gen.go")
+MANIFEST = os.path.join("developer", "exercise_spritesheet.json")
+POSE_RIG = os.path.join("developer", "exercise_poses.json")
+
+# Fixed timestamp so identical content always zips to identical bytes
+ZIP_DATE = (2025, 1, 1, 0, 0, 0)
+
+GO_TEMPLATE = """\
+// Code generated by cmd/devsprite build; DO NOT EDIT.
+
+package main
+
+import _ "embed"
+
+//go:embed assets/bundle.zip
+var embeddedBundle []byte
+
+// embeddedBundleHash is the SHA-256 of embeddedBundle
+const embeddedBundleHash = "{digest}"
+"""
+
+
+def bundle_sources(manifests=(MANIFEST,)):
+    """(archive name, path on disk) for everything the bundle holds.
+
+    manifests are the assets-relative sprite manifests to pack, each with
+    the PNGs and blobs of its pages: everything the runtime can load, so the
+    release binary never needs loose asset files.
+    """
+    dev = os.path.join(ROOT, "assets", "developer")
+    sources = []
+    for name in manifests:
+        manifest_path = os.path.join(ROOT, "assets", name)
+        sources.append((name, manifest_path))
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        for page in manifest["pages"]:
+            sources.append((f"developer/{page['file']}", os.path.join(dev, page["file"])))
+            if page.get("blob"):
+                sources.append((f"developer/{page['blob']}", os.path.join(dev, page["blob"])))
+    rig_path = os.path.join(ROOT, "assets", POSE_RIG)
+    if os.path.exists(rig_path):
+        with open(rig_path) as f:
+            parts = json.load(f)["parts_file"]
+        sources += [(POSE_RIG, rig_path), (f"developer/{parts}", os.path.join(dev, parts))]
+    sources.append(("exercises.json", os.path.join(ROOT, "exercises.json")))
+    sources.append(("config.json", os.path.join(ROOT, "config.json")))
+    return [(name.replace(os.sep, "/"), path) for name, path in sources]
+
+
+def pack(sources):
+    """Deterministic deflate zip of the given files."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, path in sources:
+            info = zipfile.ZipInfo(name, ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            with open(path, "rb") as f:
+                zf.writestr(info, f.read(), compresslevel=9)
+    return buf.getvalue()
+
+
+def write_if_changed(path, data):
+    """Write data unless the file already holds it. Returns True if written."""
+    try:
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return False
+    except OSError:
+        pass
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def write_bundle(bundle_path=BUNDLE_PATH, go_path=GO_PATH, manifests=(MANIFEST,)):
+    """Pack and write the bundle plus its Go embed file. Returns written paths."""
+    data = pack(bundle_sources(manifests))
+    go_src = GO_TEMPLATE.format(digest=hashlib.sha256(data).hexdigest()).encode()
+    written = []
+    if write_if_changed(bundle_path, data):
+        written.append(bundle_path)
+    if write_if_changed(go_path, go_src):
+        written.append(go_path)
+    return written
@@ -0,0 +1,71 @@
+"""Drawing surface for the exercise sprites, addressed in art pixels.
+
+A Canvas holds one RGBA image per render scale, all covering the same
+art-pixel area. Art pixel (x, y) is the scale x scale block at
+(x * scale, y * scale) of each image, so px() and everything else drawn
+pixel by pixel comes out exactly as a NEAREST upscale would.
+
+Primitives with real geometry (_fill_body_segment, _draw_thick_arm and pose
+limbs) work out that geometry once in art coordinates and rasterize it on
+each image's own pixel grid, so a 4x sheet gets smooth diagonals instead of
+4x4 stair steps. Pixel X of a scale-s image has its center at art coordinate
+(X + 0.5) / s - 0.5, which is X itself at scale 1: 1x output does not change.
+"""
+import numpy as np
+from PIL import Image
+
+
+class Canvas:
+    """width x height art pixels, rendered at every scale in scales."""
+
+    def __init__(self, width, height, scales=(1,)):
+        self.width, self.height = width, height
+        self.images = {s: Image.new("RGBA", (width * s, height * s), (0, 0, 0, 0)) for s in scales}
+        self._bind()
+
+    def _bind(self):
+        self._pixels = {s: image.load() for s, image in self.images.items()}
+        if self.scales == (1,):
+            # Art pixels are image pixels: px() sets them straight through the
+            # pixel access object, skipping the per-scale loop
+            self.putpixel = self._pixels[1].__setitem__
+
+    @property
+    def scales(self):
+        return tuple(self.images)
+
+    def putpixel(self, xy, c):
+        """Set one art pixel in every image; callers clip, as px() does."""
+        x, y = xy
+        for s, pixels in self._pixels.items():
+            for py in range(y * s, y * s + s):
+                for px in range(x * s, x * s + s):
+                    pixels[px, py] = c
+
+    def paint(self, scale, x, y, index, colors):
+        """Copy an index patch (an (h, w) array of indices into colors, -1 to
+        leave a pixel alone) into the scale image with its top-left at pixel
+        (x, y), clipped to the image."""
+        drawn = index >= 0
+        if not drawn.any():
+            return
+        patch = np.asarray(colors, dtype=np.uint8)[np.where(drawn, index, 0)]
+        self.images[scale].paste(Image.fromarray(patch, "RGBA"), (x, y),
+                                 Image.fromarray(drawn.astype(np.uint8) * 255, "L"))
+
+    def transpose(self, method):
+        """A copy with every image flipped by Image.transpose (mirror methods
+        only: the art-pixel size is kept)."""
+        out = Canvas.__new__(Canvas)
+        out.width, out.height = self.width, self.height
+        out.images = {s: image.transpose(method) for s, image in self.images.items()}
+        out._bind()
+        return out
+
+    def paste_opaque(self, src, ox, oy):
+        """Copy the pixels of src that aren't fully transparent to art pixel
+        (ox, oy), replacing what is underneath. src needs the same scales."""
+        for s, image in self.images.items():
+            sprite = src.images[s]
+            image.paste(sprite, (ox * s, oy * s), sprite.getchannel("A").point(lambda a: 255 if a else 0))
+
@@ -1,4 +1,6 @@
 """Generate pixel art developer character with Claude logo t-shirt."""
+import os
+
 from PIL import Image
 
 W, H = 32, 32
@@ -29,17 +31,19 @@ ShoeH = (0x66, 0x66, 0x66, 255)
 O = (0x22, 0x22, 0x22, 255)  # dark outline
 WH = (0xFF, 0xFF, 0xFF, 255)  # white
 
-img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-px = img.putpixel
+# Repo-root assets/developer, independent of the current directory
+OUT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets", "developer"))
 
 
-def rect(x1, y1, x2, y2, c):
+def rect(img, x1, y1, x2, y2, c):
     for y in range(y1, y2 + 1):
         for x in range(x1, x2 + 1):
-            px((x, y), c)
+            img.putpixel((x, y), c)
 
 
-def draw_developer():
+def draw_developer(img):
+    px = img.putpixel
+
     # === HAIR (y=6-9) ===
     # Top tuft
     for dx in range(3):
@@ -146,17 +150,33 @@ def draw_developer():
             px((x, 29), c)
 
 
-draw_developer()
+def render():
+    """Render the 32x32 developer character."""
+    img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+    draw_developer(img)
+    return img
+
+
+def write_character(img, out_dir=OUT_DIR):
+    """Save the 1x character and an 8x preview. Returns the written paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, "dev_character.png")
+    preview_path = os.path.join(out_dir, "dev_character_preview.png")
+
+    # Save at 1x (original 32x32)
+    img.save(path)
+
+    # Also save a 8x scaled version for easy viewing
+    scaled = img.resize((W * 8, H * 8), Image.NEAREST)
+    scaled.save(preview_path)
+    return [path, preview_path]
 
-import os
-os.makedirs("assets/developer", exist_ok=True)
 
-# Save at 1x (original 32x32)
-img.save("assets/developer/dev_character.png")
+def main():
+    write_character(render())
+    print("Generated assets/developer/dev_character.png (32x32)")
+    print("Generated assets/developer/dev_character_preview.png (256x256 preview)")
 
-# Also save a 8x scaled version for easy viewing
-scaled = img.resize((W * 8, H * 8), Image.NEAREST)
-scaled.save("assets/developer/dev_character_preview.png")
 
-print("Generated assets/developer/dev_character.png (32x32)")
-print("Generated assets/developer/dev_character_preview.png (256x256 preview)")
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,44 @@ Row 3: Chair dips - SIDE VIEW with office chair (16 frames)
 Row 4: Standing arm circles - FRONT VIEW (16 frames)
 Row 5: Wondering - looking around, no coffee (16 frames, front view)
 """
+import argparse
+import json
 import math
+import os
+
 from PIL import Image
 
+try:
+    from . import kernels
+    from .canvas import Canvas
+    from .pngstream import PNGWriter
+    from .pose import Pose, arm, part, rig_paths, segment, write_rig
+    from .texblob import BlobWriter
+except ImportError:  # run as a script from cmd/devsprite
+    import kernels
+    from canvas import Canvas
+    from pngstream import PNGWriter
+    from pose import Pose, arm, part, rig_paths, segment, write_rig
+    from texblob import BlobWriter
+
 FRAME_W, FRAME_H = 32, 32
 NUM_FRAMES = 16
 NUM_ANIMS = 18
 
+# Repo-root assets/developer, independent of the current directory
+OUT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets", "developer"))
+SHEET_NAME = "exercise_spritesheet.png"
+MANIFEST_NAME = "exercise_spritesheet.json"
+# Pose tracks + parts atlas for animations the game can assemble at runtime
+RIG_NAME = "exercise_poses.json"
+# Pages are split to stay under this size; 4096 is safe on integrated GPUs
+MAX_PAGE_SIZE = 4096
+LAYOUTS = ("sheet", "rows")
+PAGE_LAYOUT = "sheet"
+# Shown in every session; the "rows" layout keeps them together on page 0
+CORE_ANIMS = ["coffee_idle", "waving", "pump_up", "wondering"]
+KEY_FRAMES = [0, 4, 5, 6, 8, 12]
+
 # Color palette (same as male dev character)
 Skin  = (0xF5, 0xD0, 0xA9, 255)
 SkinS = (0xD4, 0xA5, 0x74, 255)
@@ -252,70 +283,47 @@ def draw_coffee_idle_frame(img, ox, oy, frame):
 # WAVING - calling for attention (front view)
 # =========================================================================
 
-def draw_wave_arms(img, ox, oy, breath, wave_frame):
-    """Draw arms for waving animation.
-
-    Left arm stays relaxed at side.
-    Right arm waves overhead: up-right, tilted right, up-right, tilted left (back and forth).
-    """
-    # Left arm relaxed at side
-    for dy in range(3):
-        px(img, ox + 7, oy + 17 + breath + dy, ShirtS)
-        px(img, ox + 8, oy + 17 + breath + dy, Shirt)
-    for dy in range(3):
-        px(img, ox + 7, oy + 20 + breath + dy, SkinS)
-        px(img, ox + 8, oy + 20 + breath + dy, Skin)
-
-    # Right arm waving above head
-    # Shoulder pivot
-    sx, sy = 23, 17 + breath
-
-    # Wave positions: arm swings back and forth overhead
-    # Each position is (elbow_dx, elbow_dy, hand_dx, hand_dy) relative to shoulder
-    wave_positions = [
-        # Arm up-right (neutral)
-        (3, -3, 5, -6),
-        (4, -3, 6, -6),
-        # Tilted right
-        (4, -2, 7, -4),
-        (5, -2, 7, -3),
-        # Back to center
-        (4, -3, 6, -6),
-        (3, -3, 5, -6),
-        # Tilted left
-        (2, -3, 2, -7),
-        (1, -3, 1, -7),
-        # Back to center
-        (2, -3, 3, -6),
-        (3, -3, 5, -6),
-        # Tilted right
-        (4, -2, 7, -4),
-        (5, -2, 7, -3),
-        # Back to center
-        (4, -3, 6, -6),
-        (3, -3, 5, -6),
-        # Tilted left
-        (2, -3, 2, -7),
-        (1, -3, 1, -7),
-    ]
-
-    edx, edy, hdx, hdy = wave_positions[wave_frame]
-
-    elbow_x = sx + edx
-    elbow_y = sy + edy
-    hand_x = sx + hdx
-    hand_y = sy + hdy
-
-    # Upper arm: shoulder to elbow (shirt colored)
-    _draw_thick_arm(img, ox, oy, sx, sy, elbow_x, elbow_y, Shirt, ShirtH)
-
-    # Forearm: elbow to hand (skin colored)
-    _draw_thick_arm(img, ox, oy, elbow_x, elbow_y, hand_x, hand_y, Skin, SkinH)
-
-    # Hand (slightly bigger for visibility)
-    px(img, ox + hand_x, oy + hand_y, Skin)
-    px(img, ox + hand_x + 1, oy + hand_y, SkinH)
-    px(img, ox + hand_x, oy + hand_y + 1, SkinH)
+def draw_calling_mouth(img, ox, oy):
+    """Open mouth (small dark oval) over the front head's smile."""
+    for x in (14, 15, 16):
+        px(img, ox + x, oy + 14, O)
+
+
+def draw_wave_hand(img, ox, oy):
+    """Waving hand, slightly bigger for visibility; (ox, oy) is the wrist."""
+    px(img, ox, oy, Skin)
+    px(img, ox + 1, oy, SkinH)
+    px(img, ox, oy + 1, SkinH)
+
+
+# Energetic bounce, shared by the body and the waving arm
+WAVE_BOUNCE = [0, 0, -1, -1, 0, 0, -1, -1, 0, 0, -1, -1, 0, 0, -1, -1]
+
+# Left arm stays relaxed at the side. The right arm waves overhead back and
+# forth (up-right, tilted right, center, tilted left, ...) from a shoulder
+# pivot at (23, 17) that bounces with the body; the mouth opens to call out
+# on the bounce frames.
+WAVE_POSE = Pose(
+    tracks={
+        "body": [(f, 0, b) for f, b in enumerate(WAVE_BOUNCE)],
+        "shoulder": [(f, 23, 17 + b) for f, b in enumerate(WAVE_BOUNCE)],
+        "elbow": [(0, 26, 14), (1, 27, 14), (2, 27, 14), (3, 28, 14), (4, 27, 14), (5, 26, 14),
+                  (6, 25, 13), (7, 24, 13), (8, 25, 14), (9, 26, 14), (10, 27, 14), (11, 28, 14),
+                  (12, 27, 14), (13, 26, 14), (14, 25, 13), (15, 24, 13)],
+        "hand": [(0, 28, 11), (1, 29, 11), (2, 30, 12), (3, 30, 13), (4, 29, 11), (5, 28, 11),
+                 (6, 25, 9), (7, 24, 9), (8, 26, 11), (9, 28, 11), (10, 30, 12), (11, 30, 13),
+                 (12, 29, 11), (13, 28, 11), (14, 25, 9), (15, 24, 9)],
+    },
+    layers=[
+        part("upper_front", lambda img, ox, oy: draw_upper_front(img, ox, oy), at="body"),
+        part("calling_mouth", draw_calling_mouth, at="body", frames=(2, 3, 6, 7, 10, 11, 14, 15)),
+        part("legs_front", lambda img, ox, oy: draw_legs_front(img, ox, oy)),
+        part("left_arm_front", lambda img, ox, oy: draw_left_arm_front(img, ox, oy), at="body"),
+        arm("shoulder", "elbow", Shirt, ShirtH),   # upper arm
+        arm("elbow", "hand", Skin, SkinH),         # forearm
+        part("wave_hand", draw_wave_hand, at="hand"),
+    ],
+)
 
 
 def draw_wave_frame(img, ox, oy, frame):
@@ -324,33 +332,7 @@ def draw_wave_frame(img, ox, oy, frame):
     16 frames: character waves right arm overhead back and forth.
     Slight body bounce to feel energetic.
     """
-    # Energetic bounce
-    bounce_curve = [0, 0, -1, -1, 0, 0, -1, -1, 0, 0, -1, -1, 0, 0, -1, -1]
-    bounce = bounce_curve[frame]
-
-    # Open mouth for calling out on some frames
-    calling = frame in (2, 3, 6, 7, 10, 11, 14, 15)
-
-    # Draw body
-    draw_hair_front(img, ox, oy + bounce)
-    draw_head_front(img, ox, oy + bounce)
-
-    # Override mouth when calling
-    if calling:
-        mouth_y = oy + bounce + 14
-        # Open mouth (small dark oval)
-        px(img, ox + 14, mouth_y, O)
-        px(img, ox + 15, mouth_y, O)
-        px(img, ox + 16, mouth_y, O)
-
-    draw_neck_front(img, ox, oy + bounce)
-    draw_shirt_front(img, ox, oy + bounce)
-    draw_logo_front(img, ox, oy + bounce)
-    draw_pants_front(img, ox, oy)
-    draw_shoes_front(img, ox, oy)
-
-    # Draw waving arms
-    draw_wave_arms(img, ox, oy, bounce, frame)
+    WAVE_POSE.draw(img, ox, oy, frame)
 
 
 # =========================================================================
@@ -672,12 +654,38 @@ def draw_shoes_front(img, ox, oy):
             px(img, ox + x, oy + 29, c)
 
 
+def draw_upper_front(img, ox, oy):
+    """Hair, head, neck, shirt and logo: everything that bobs."""
+    draw_hair_front(img, ox, oy)
+    draw_head_front(img, ox, oy)
+    draw_neck_front(img, ox, oy)
+    draw_shirt_front(img, ox, oy)
+    draw_logo_front(img, ox, oy)
+
+
+def draw_legs_front(img, ox, oy):
+    draw_pants_front(img, ox, oy)
+    draw_shoes_front(img, ox, oy)
+
+
+def draw_left_arm_front(img, ox, oy):
+    """Left arm relaxed at side."""
+    for dy in range(3):
+        px(img, ox + 7, oy + 17 + dy, ShirtS)
+        px(img, ox + 8, oy + 17 + dy, Shirt)
+    for dy in range(3):
+        px(img, ox + 7, oy + 20 + dy, SkinS)
+        px(img, ox + 8, oy + 20 + dy, Skin)
+
+
 def _fill_body_segment(img, ox, oy, x1, y1, x2, y2, half_w, fill, shade, highlight):
     """Fill a rotated rectangle from (x1,y1) to (x2,y2) with half_w perpendicular width.
 
     Used for drawing thick body parts (torso, legs) on diagonal poses.
     Scans every pixel in the bounding box and checks if it falls inside the
-    rotated rectangle, producing a solid filled parallelogram.
+    rotated rectangle, producing a solid filled parallelogram. At higher
+    render scales the same test runs on the finer pixel grid, so edges stay
+    straight instead of turning into scaled-up steps.
     """
     body_dx = x2 - x1
     body_dy = y2 - y1
@@ -704,72 +712,65 @@ def _fill_body_segment(img, ox, oy, x1, y1, x2, y2, half_w, fill, shade, highlig
     min_py = int(math.floor(min(corners_y))) - 1
     max_py = int(math.ceil(max(corners_y))) + 1
 
-    for scan_y in range(min_py, max_py + 1):
-        for scan_x in range(min_px, max_px + 1):
-            vx = scan_x - x1
-            vy = scan_y - y1
-            along = vx * ux + vy * uy
-            perp = vx * px_dir + vy * py_dir
-            if -0.7 <= along <= body_len + 0.7 and abs(perp) <= half_w + 0.3:
-                c = fill
-                if perp < -(half_w - 1.2):
-                    c = highlight
-                elif perp > (half_w - 1.2):
-                    c = shade
-                px(img, ox + scan_x, oy + scan_y, c)
+    # The scan itself is kernels.segment_index: a pixel is inside if it lies
+    # within -0.7..len+0.7 along the body and half_w+0.3 across it, with the
+    # outermost 1.5px either side in highlight/shade
+    for s in img.scales:
+        x0, y0 = min_px * s, min_py * s
+        index = kernels.segment_index(x0, y0, (max_px - min_px + 1) * s, (max_py - min_py + 1) * s, s,
+                                      x1, y1, ux, uy, px_dir, py_dir, body_len, half_w)
+        img.paint(s, ox * s + x0, oy * s + y0, index, (fill, shade, highlight))
 
 
 def _draw_thick_arm(img, ox, oy, x1, y1, x2, y2, c1, c2):
-    """Draw a 2px wide line from (x1,y1) to (x2,y2)."""
-    steps = max(abs(x2 - x1), abs(y2 - y1), 1)
-    for i in range(steps + 1):
-        t = i / steps
-        x = int(round(x1 + (x2 - x1) * t))
-        y = int(round(y1 + (y2 - y1) * t))
-        px(img, ox + x, oy + y, c1)
-        if abs(x2 - x1) >= abs(y2 - y1):
-            px(img, ox + x, oy + y + 1, c2)
-        else:
-            px(img, ox + x + 1, oy + y, c2)
+    """Draw a 2px wide line from (x1,y1) to (x2,y2).
 
+    At render scale s the line takes s times as many steps and each of its
+    pixels is an s x s block, so it stays 2 art pixels wide; c1 goes over c2
+    where the blocks overlap. The stepping is kernels.line_index.
+    """
+    for s in img.scales:
+        x0, y0, index = kernels.line_index(x1, y1, x2, y2, s)
+        img.paint(s, ox * s + x0, oy * s + y0, index, (c1, c2))
 
-def draw_circle_arms(img, ox, oy, frame):
-    """Draw arms at positions along a circular path."""
-    angle = frame * 2 * math.pi / 16
-
-    l_sx, l_sy = 9, 18
-    r_sx, r_sy = 22, 18
-    radius = 5
-
-    l_ex = l_sx + int(round(-radius * math.cos(angle)))
-    l_ey = l_sy + int(round(-radius * math.sin(angle)))
-    r_ex = r_sx + int(round(radius * math.cos(angle)))
-    r_ey = r_sy + int(round(-radius * math.sin(angle)))
-
-    l_mx = (l_sx + l_ex) // 2
-    l_my = (l_sy + l_ey) // 2
-    _draw_thick_arm(img, ox, oy, l_sx, l_sy, l_mx, l_my, ShirtS, Shirt)
-    _draw_thick_arm(img, ox, oy, l_mx, l_my, l_ex, l_ey, SkinS, Skin)
 
-    r_mx = (r_sx + r_ex) // 2
-    r_my = (r_sy + r_ey) // 2
-    _draw_thick_arm(img, ox, oy, r_sx, r_sy, r_mx, r_my, Shirt, ShirtH)
-    _draw_thick_arm(img, ox, oy, r_mx, r_my, r_ex, r_ey, Skin, SkinH)
+def _circle_keys(sx, sy, radius, mirror):
+    """Elbow and hand keyframes for a hand circling the shoulder at (sx, sy),
+    one key per frame; the elbow stays halfway along the arm."""
+    elbow, hand = [], []
+    for frame in range(NUM_FRAMES):
+        angle = frame * 2 * math.pi / NUM_FRAMES
+        ex = sx + int(round(mirror * radius * math.cos(angle)))
+        ey = sy + int(round(-radius * math.sin(angle)))
+        elbow.append((frame, (sx + ex) // 2, (sy + ey) // 2))
+        hand.append((frame, ex, ey))
+    return elbow, hand
+
+
+_l_elbow, _l_hand = _circle_keys(9, 18, 5, -1)
+_r_elbow, _r_hand = _circle_keys(22, 18, 5, 1)
+
+# Upper body bobs on the down-strokes; both arms hang from it
+ARM_CIRCLES_POSE = Pose(
+    tracks={
+        "body": [(3, 0, 0), (4, 0, -1), (5, 0, -1), (6, 0, 0), (11, 0, 0), (12, 0, -1), (13, 0, -1), (14, 0, 0)],
+        "l_shoulder": [(0, 9, 18)], "l_elbow": _l_elbow, "l_hand": _l_hand,
+        "r_shoulder": [(0, 22, 18)], "r_elbow": _r_elbow, "r_hand": _r_hand,
+    },
+    layers=[
+        part("upper_front", draw_upper_front, at="body"),
+        part("legs_front", draw_legs_front),
+        arm("l_shoulder", "l_elbow", ShirtS, Shirt, at="body"),
+        arm("l_elbow", "l_hand", SkinS, Skin, at="body"),
+        arm("r_shoulder", "r_elbow", Shirt, ShirtH, at="body"),
+        arm("r_elbow", "r_hand", Skin, SkinH, at="body"),
+    ],
+)
 
 
 def draw_arm_circle_frame(img, ox, oy, frame):
     """Draw one frame of standing arm circles."""
-    bob_curve = [0, 0, 0, 0, -1, -1, 0, 0, 0, 0, 0, 0, -1, -1, 0, 0]
-    bob = bob_curve[frame]
-
-    draw_hair_front(img, ox, oy + bob)
-    draw_head_front(img, ox, oy + bob)
-    draw_neck_front(img, ox, oy + bob)
-    draw_shirt_front(img, ox, oy + bob)
-    draw_logo_front(img, ox, oy + bob)
-    draw_pants_front(img, ox, oy)
-    draw_shoes_front(img, ox, oy)
-    draw_circle_arms(img, ox, oy + bob, frame)
+    ARM_CIRCLES_POSE.draw(img, ox, oy, frame)
 
 
 # =========================================================================
@@ -1044,61 +1045,53 @@ def draw_seated_arms_resting(img, ox, oy, breath=0):
 # ROW 6: KNEE RAISES (seated, side view)
 # =========================================================================
 
-def draw_knee_raise_frame(img, ox, oy, frame):
-    """Seated knee raises - thigh rotates forward 60-90° from vertical."""
-    cx = ox + SEAT_DX
-    raise_curve = [0, 1, 2, 3, 4, 4, 3, 2, 1, 0, 0, 0, 0, 0, 0, 0]
-    knee_lift = raise_curve[frame]
+def draw_seated_upper_body(img, ox, oy):
+    """Side-view hair, head, neck, torso and resting arms, seated in the chair."""
+    draw_side_hair(img, ox + SEAT_DX, oy)
+    draw_side_head(img, ox + SEAT_DX, oy)
+    draw_side_neck(img, ox + SEAT_DX, oy)
+    draw_side_torso(img, ox + SEAT_DX, oy)
+    draw_seated_arms_resting(img, ox + SEAT_DX, oy)
 
-    draw_office_chair(img, ox, oy)
 
-    if knee_lift > 0:
-        # 1. Resting leg (behind everything, still seated)
-        draw_seated_legs(img, cx, oy)
+def draw_raised_shin(img, ox, oy):
+    """Lower leg hanging straight down from the knee at (ox, oy), 3px wide,
+    with the foot at the bottom."""
+    for dy in range(4):
+        px(img, ox - 1, oy + 1 + dy, Pants)
+        px(img, ox, oy + 1 + dy, Pants)
+        px(img, ox + 1, oy + 1 + dy, PantsS)
+    foot_y = oy + 5
+    px(img, ox - 1, foot_y, ShoeH)
+    px(img, ox, foot_y, Shoe)
+    px(img, ox - 1, foot_y + 1, Shoe)
+    px(img, ox, foot_y + 1, Shoe)
+
+
+# Resting leg behind, upper body in the middle, raised leg in front. The hip
+# is at the front-bottom of the torso; over frames 1-8 the knee moves FORWARD
+# (left) and UP, holds, and comes back down to the seat edge. Shorter thigh
+# to match seated proportions.
+KNEE_RAISE_POSE = Pose(
+    tracks={
+        "hip": [(0, SEAT_DX + 13, 23)],
+        "knee": [(0, SEAT_DX + 10, 23), (1, SEAT_DX + 10, 22), (2, SEAT_DX + 8, 21), (3, SEAT_DX + 7, 20),
+                 (4, SEAT_DX + 6, 20), (5, SEAT_DX + 6, 20), (6, SEAT_DX + 7, 20), (7, SEAT_DX + 8, 21),
+                 (8, SEAT_DX + 10, 22), (9, SEAT_DX + 10, 23)],
+    },
+    layers=[
+        part("office_chair", draw_office_chair),
+        part("seated_legs", lambda img, ox, oy: draw_seated_legs(img, ox + SEAT_DX, oy)),
+        part("seated_upper_body", draw_seated_upper_body),
+        segment("hip", "knee", 1.8, Pants, PantsS, PantsS, frames=range(1, 9)),   # thigh
+        part("raised_shin", draw_raised_shin, at="knee", frames=range(1, 9), origin=(8, 8)),
+    ],
+)
 
-        # 2. Upper body (middle layer)
-        draw_side_hair(img, cx, oy)
-        draw_side_head(img, cx, oy)
-        draw_side_neck(img, cx, oy)
-        draw_side_torso(img, cx, oy)
-        draw_seated_arms_resting(img, cx, oy)
 
-        # 3. Raised leg (front layer — drawn last to appear in front)
-        # Hip joint at front-bottom of torso
-        hip_x = cx + 13
-        hip_y = oy + 23
-
-        # Knee moves FORWARD (left) and UP as lift increases
-        # Shorter thigh to match seated proportions
-        knee_x = [0, cx + 10, cx + 8, cx + 7, cx + 6][knee_lift]
-        knee_y = [0, oy + 22, oy + 21, oy + 20, oy + 20][knee_lift]
-
-        # Thigh (hip to knee) - filled parallelogram
-        _fill_body_segment(img, 0, 0,
-                           float(hip_x), float(hip_y),
-                           float(knee_x), float(knee_y),
-                           1.8, Pants, PantsS, PantsS)
-
-        # Lower leg hangs straight down from knee - 3px wide
-        for dy in range(4):
-            px(img, knee_x - 1, knee_y + 1 + dy, Pants)
-            px(img, knee_x, knee_y + 1 + dy, Pants)
-            px(img, knee_x + 1, knee_y + 1 + dy, PantsS)
-
-        # Foot at bottom of lower leg
-        foot_y = knee_y + 5
-        px(img, knee_x - 1, foot_y, ShoeH)
-        px(img, knee_x, foot_y, Shoe)
-        px(img, knee_x - 1, foot_y + 1, Shoe)
-        px(img, knee_x, foot_y + 1, Shoe)
-    else:
-        # Resting: legs first, then body on top
-        draw_seated_legs(img, cx, oy)
-        draw_side_hair(img, cx, oy)
-        draw_side_head(img, cx, oy)
-        draw_side_neck(img, cx, oy)
-        draw_side_torso(img, cx, oy)
-        draw_seated_arms_resting(img, cx, oy)
+def draw_knee_raise_frame(img, ox, oy, frame):
+    """Seated knee raises - thigh rotates forward 60-90° from vertical."""
+    KNEE_RAISE_POSE.draw(img, ox, oy, frame)
 
 
 # =========================================================================
@@ -1774,7 +1767,7 @@ def draw_wall_sit_frame(img, ox, oy, frame):
 
 def _draw_side_upper_body_right(img, ox, oy):
     """Draw side-view upper body facing RIGHT by mirroring the left-facing view."""
-    temp = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
+    temp = Canvas(32, 32, img.scales)
     draw_side_hair(temp, 0, 0)
     draw_side_head(temp, 0, 0)
     draw_side_neck(temp, 0, 0)
@@ -1786,17 +1779,12 @@ def _draw_side_upper_body_right(img, ox, oy):
     px(temp, 15, 21, Skin)
     px(temp, 14, 22, Skin)
     px(temp, 13, 22, SkinH)
-    temp = temp.transpose(Image.FLIP_LEFT_RIGHT)
-    for y in range(32):
-        for x in range(32):
-            c = temp.getpixel((x, y))
-            if c[3] > 0:
-                px(img, ox + x, oy + y, c)
+    img.paste_opaque(temp.transpose(Image.FLIP_LEFT_RIGHT), ox, oy)
 
 
 def _draw_side_upper_body_right_wide(img, ox, oy):
     """Draw wider transition torso facing RIGHT (mirrored)."""
-    temp = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
+    temp = Canvas(32, 32, img.scales)
     draw_side_hair(temp, 0, 0)
     draw_side_head(temp, 0, 0)
     draw_side_neck(temp, 0, 0)
@@ -1822,12 +1810,7 @@ def _draw_side_upper_body_right_wide(img, ox, oy):
         px(temp, 17, 18 + dy, ShirtH)
     px(temp, 15, 21, Skin)
     px(temp, 14, 22, SkinH)
-    temp = temp.transpose(Image.FLIP_LEFT_RIGHT)
-    for y in range(32):
-        for x in range(32):
-            c = temp.getpixel((x, y))
-            if c[3] > 0:
-                px(img, ox + x, oy + y, c)
+    img.paste_opaque(temp.transpose(Image.FLIP_LEFT_RIGHT), ox, oy)
 
 
 def draw_torso_rotation_frame(img, ox, oy, frame):
@@ -1914,6 +1897,22 @@ def draw_torso_rotation_frame(img, ox, oy, frame):
 # ROW 17: REVERSE LUNGES (side view)
 # =========================================================================
 
+# Lunge frames 2-9: hips drop 3px, the back knee sweeps down and back
+# (carefully tuned) and the back foot slides back onto its toes
+REVERSE_LUNGE_POSE = Pose(
+    tracks={
+        "hip": [(2, 14, 23), (5, 14, 26), (6, 14, 26), (9, 14, 23)],
+        "back_knee": [(2, 15, 26), (3, 16, 27), (4, 18, 28), (5, 19, 28),
+                      (6, 19, 28), (7, 18, 28), (8, 16, 27), (9, 15, 26)],
+        "back_foot": [(2, 16, 29), (5, 22, 29), (6, 22, 29), (9, 16, 29)],
+    },
+    layers=[
+        segment("hip", "back_knee", 1.8, Pants, PantsS, PantsS),
+        segment("back_knee", "back_foot", 1.2, Pants, PantsS, PantsS),
+    ],
+)
+
+
 def draw_reverse_lunge_frame(img, ox, oy, frame):
     """Side view reverse lunges - proper form.
 
@@ -1925,6 +1924,7 @@ def draw_reverse_lunge_frame(img, ox, oy, frame):
     """
     lunge_curve = [0, 0, 1, 2, 3, 4, 4, 3, 2, 1, 0, 0, 0, 0, 0, 0]
     depth = lunge_curve[frame]
+    pose = REVERSE_LUNGE_POSE
 
     if depth == 0:
         # Standing position - standard side-view character
@@ -1943,31 +1943,19 @@ def draw_reverse_lunge_frame(img, ox, oy, frame):
 
     # --- LUNGE POSITION (depth 1-4) ---
     # Hips drop straight down
-    body_drop = [0, 0, 1, 2, 3][depth]
-    hip_y = 23 + body_drop
+    _, hip_y = pose.point("hip", frame)
+    body_drop = hip_y - 23
 
     # Front knee: above ankle, approaches 90° at max depth
     front_foot_cx = 10  # foot center (fixed on ground)
     front_knee_x = [0, 11, 11, 10, 10][depth]
     front_knee_y = hip_y + (1 if depth <= 2 else 0)
 
-    # Back knee & foot positions per depth (carefully tuned)
-    bk_x = [0, 15, 16, 18, 19][depth]
-    bk_y = [0, 26, 27, 28, 28][depth]
-    bf_x = [0, 16, 18, 20, 22][depth]
-
     # ---- DRAW ORDER: back leg, front leg, upper body ----
 
-    # BACK THIGH: hip to back knee (diagonal, filled parallelogram)
-    _fill_body_segment(img, ox, oy,
-                       14.0, float(hip_y),
-                       float(bk_x), float(bk_y),
-                       1.8, Pants, PantsS, PantsS)
-    # BACK SHIN: knee to foot (filled parallelogram)
-    _fill_body_segment(img, ox, oy,
-                       float(bk_x), float(bk_y),
-                       float(bf_x), 29.0,
-                       1.2, Pants, PantsS, PantsS)
+    # BACK THIGH and SHIN: hip to back knee to foot (filled parallelograms)
+    pose.draw(img, ox, oy, frame)
+    bf_x, _ = pose.point("back_foot", frame)
     # Back foot: on toes only (2px)
     px(img, ox + bf_x, oy + 29, Shoe)
     px(img, ox + bf_x + 1, oy + 29, ShoeH)
@@ -2008,110 +1996,269 @@ def draw_reverse_lunge_frame(img, ox, oy, frame):
 # GENERATE
 # =========================================================================
 
-def main():
-    sheet_w = FRAME_W * NUM_FRAMES
-    sheet_h = FRAME_H * NUM_ANIMS
-    sheet = Image.new("RGBA", (sheet_w, sheet_h), (0, 0, 0, 0))
-
-    # Row 0: Idle coffee sip
-    for frame in range(NUM_FRAMES):
-        draw_coffee_idle_frame(sheet, frame * FRAME_W, 0, frame)
-
-    # Row 1: Waving (call to exercise)
-    for frame in range(NUM_FRAMES):
-        draw_wave_frame(sheet, frame * FRAME_W, FRAME_H, frame)
-
-    # Row 2: Pump-up "let's do it!" fist pump
-    for frame in range(NUM_FRAMES):
-        draw_pumpup_frame(sheet, frame * FRAME_W, FRAME_H * 2, frame)
-
-    # Row 3: Chair dips
-    for frame in range(NUM_FRAMES):
-        draw_chair_dip_frame(sheet, frame * FRAME_W, FRAME_H * 3, frame)
-
-    # Row 4: Arm circles
-    for frame in range(NUM_FRAMES):
-        draw_arm_circle_frame(sheet, frame * FRAME_W, FRAME_H * 4, frame)
-
-    # Row 5: Wondering (looking around, no coffee)
+# Sheet row order. Index == row == AnimationType in animations.go.
+ANIMATIONS = [
+    ("coffee_idle", draw_coffee_idle_frame),
+    ("waving", draw_wave_frame),
+    ("pump_up", draw_pumpup_frame),
+    ("chair_dips", draw_chair_dip_frame),
+    ("arm_circles", draw_arm_circle_frame),
+    ("wondering", draw_wondering_frame),
+    ("knee_raises", draw_knee_raise_frame),
+    ("spinal_twist", draw_spinal_twist_frame),
+    ("glute_squeeze", draw_glute_squeeze_frame),
+    ("shoulder_rolls", draw_shoulder_rolls_frame),
+    ("leg_extensions", draw_leg_extension_frame),
+    ("neck_stretch", draw_neck_stretch_frame),
+    ("desk_pushups", draw_desk_pushup_frame),
+    ("squats", draw_squat_frame),
+    ("calf_raises", draw_calf_raise_frame),
+    ("wall_sit", draw_wall_sit_frame),
+    ("torso_rotation", draw_torso_rotation_frame),
+    ("reverse_lunges", draw_reverse_lunge_frame),
+]
+
+
+# Animations drawn entirely from a Pose, exported for runtime playback
+RIGGED = {
+    "waving": WAVE_POSE,
+    "arm_circles": ARM_CIRCLES_POSE,
+    "knee_raises": KNEE_RAISE_POSE,
+}
+
+
+def write_poses(out_dir=OUT_DIR):
+    """Write the rig of every RIGGED animation; returns the written paths."""
+    names = [name for name, _ in ANIMATIONS]
+    return write_rig([(names.index(name), name, pose) for name, pose in RIGGED.items()], out_dir, RIG_NAME,
+                     (FRAME_W, FRAME_H))
+
+
+def draw_row(img, oy, draw_frame):
+    """Draw all frames of one animation as a horizontal strip at row offset oy."""
     for frame in range(NUM_FRAMES):
-        draw_wondering_frame(sheet, frame * FRAME_W, FRAME_H * 5, frame)
+        draw_frame(img, frame * FRAME_W, oy, frame)
 
-    # Row 6: Knee Raises
-    for frame in range(NUM_FRAMES):
-        draw_knee_raise_frame(sheet, frame * FRAME_W, FRAME_H * 6, frame)
 
-    # Row 7: Spinal Twist
-    for frame in range(NUM_FRAMES):
-        draw_spinal_twist_frame(sheet, frame * FRAME_W, FRAME_H * 7, frame)
+def render_strips(draw_frame, scales=(1,)):
+    """Render one animation row at every scale in one pass: {scale: strip}.
 
-    # Row 8: Glute Squeeze
-    for frame in range(NUM_FRAMES):
-        draw_glute_squeeze_frame(sheet, frame * FRAME_W, FRAME_H * 8, frame)
+    The drawing code runs once; each scale rasterizes the same geometry
+    natively (see canvas.py), so the 1x strip is unchanged and larger ones
+    are not upscales.
+    """
+    canvas = Canvas(FRAME_W * NUM_FRAMES, FRAME_H, scales)
+    draw_row(canvas, 0, draw_frame)
+    return canvas.images
 
-    # Row 9: Shoulder Rolls
-    for frame in range(NUM_FRAMES):
-        draw_shoulder_rolls_frame(sheet, frame * FRAME_W, FRAME_H * 9, frame)
 
-    # Row 10: Leg Extensions
-    for frame in range(NUM_FRAMES):
-        draw_leg_extension_frame(sheet, frame * FRAME_W, FRAME_H * 10, frame)
+def render_row(draw_frame, scale=1):
+    """Render one animation row as its own strip, natively at scale."""
+    return render_strips(draw_frame, (scale,))[scale]
 
-    # Row 11: Neck Stretch
-    for frame in range(NUM_FRAMES):
-        draw_neck_stretch_frame(sheet, frame * FRAME_W, FRAME_H * 11, frame)
 
-    # Row 12: Desk Push-Ups
-    for frame in range(NUM_FRAMES):
-        draw_desk_pushup_frame(sheet, frame * FRAME_W, FRAME_H * 12, frame)
+def build_sheet(scale=1):
+    """Render every animation row into a single RGBA sprite sheet."""
+    sheet_w = FRAME_W * NUM_FRAMES
+    sheet_h = FRAME_H * NUM_ANIMS
+    sheet = Canvas(sheet_w, sheet_h, (scale,))
+
+    for row, (_, draw_frame) in enumerate(ANIMATIONS):
+        draw_row(sheet, FRAME_H * row, draw_frame)
+    return sheet.images[scale]
+
+
+def preview_paths(out_dir=OUT_DIR):
+    """Preview paths written by stream_sheet, in write order."""
+    paths = [os.path.join(out_dir, "exercise_spritesheet_preview.png")]
+    for anim_name, _ in ANIMATIONS:
+        for frame in KEY_FRAMES:
+            paths.append(os.path.join(out_dir, f"{anim_name}_f{frame:02d}_preview.png"))
+    return paths
+
+
+def _write_key_frames(strip, anim_name, out_dir):
+    paths = []
+    for frame in KEY_FRAMES:
+        region = strip.crop((frame * FRAME_W, 0, (frame + 1) * FRAME_W, FRAME_H))
+        path = os.path.join(out_dir, f"{anim_name}_f{frame:02d}_preview.png")
+        region.resize((FRAME_W * 8, FRAME_H * 8), Image.NEAREST).save(path)
+        paths.append(path)
+    return paths
+
+
+def page_name(page, ext=".png", scale=1):
+    """File name of sheet page N. Page 0 keeps the historical single-sheet
+    name; sheets at other scales add a _2x / _4x suffix."""
+    base = os.path.splitext(SHEET_NAME)[0]
+    if scale != 1:
+        base += f"_{scale}x"
+    if page == 0:
+        return base + ext
+    return f"{base}_p{page}{ext}"
+
+
+def _page_groups(layout, rows_per_page):
+    """Animation indices per page, each group in ANIMATIONS order."""
+    indices = list(range(len(ANIMATIONS)))
+    if layout == "sheet":
+        groups = [indices]
+    elif layout == "rows":
+        names = [name for name, _ in ANIMATIONS]
+        core = [names.index(name) for name in CORE_ANIMS]
+        groups = [core] + [[i] for i in indices if i not in core]
+    else:
+        raise ValueError(f"unknown layout '{layout}' (expected one of {', '.join(LAYOUTS)})")
+    return [g[i:i + rows_per_page] for g in groups for i in range(0, len(g), rows_per_page)]
 
-    # Row 13: Bodyweight Squats
-    for frame in range(NUM_FRAMES):
-        draw_squat_frame(sheet, frame * FRAME_W, FRAME_H * 13, frame)
 
-    # Row 14: Calf Raises
-    for frame in range(NUM_FRAMES):
-        draw_calf_raise_frame(sheet, frame * FRAME_W, FRAME_H * 14, frame)
+def manifest_name(scale=1):
+    """File name of the manifest for the sheet rendered at scale."""
+    if scale == 1:
+        return MANIFEST_NAME
+    base, ext = os.path.splitext(MANIFEST_NAME)
+    return f"{base}_{scale}x{ext}"
 
-    # Row 15: Wall Sit
-    for frame in range(NUM_FRAMES):
-        draw_wall_sit_frame(sheet, frame * FRAME_W, FRAME_H * 15, frame)
 
-    # Row 16: Torso Rotation
-    for frame in range(NUM_FRAMES):
-        draw_torso_rotation_frame(sheet, frame * FRAME_W, FRAME_H * 16, frame)
+def build_manifest(max_page=MAX_PAGE_SIZE, layout=PAGE_LAYOUT, scale=1):
+    """Assign every animation row a (page, row).
 
-    # Row 17: Reverse Lunges
-    for frame in range(NUM_FRAMES):
-        draw_reverse_lunge_frame(sheet, frame * FRAME_W, FRAME_H * 17, frame)
+    layout "sheet" packs rows in order onto as few pages as fit max_page;
+    "rows" puts CORE_ANIMS on page 0 and every other animation on its own
+    page, so the renderer only uploads the exercises a session shows.
 
-    import os
-    os.makedirs("assets/developer", exist_ok=True)
+    Returns the manifest the renderer loads: page files and sizes, plus the
+    (page, row) of every animation in ANIMATIONS (= AnimationType) order.
+    Frame and page sizes are in pixels of the given render scale.
+    """
+    frame_w, frame_h = FRAME_W * scale, FRAME_H * scale
+    sheet_w = frame_w * NUM_FRAMES
+    if sheet_w > max_page or frame_h > max_page:
+        raise ValueError(f"a {sheet_w}x{frame_h} animation row does not fit a {max_page}px page")
+
+    pages = []
+    animations = [None] * len(ANIMATIONS)
+    for page, group in enumerate(_page_groups(layout, max_page // frame_h)):
+        pages.append({"file": page_name(page, scale=scale), "blob": page_name(page, ".cgtx", scale),
+                      "width": sheet_w, "height": frame_h * len(group)})
+        for row, i in enumerate(group):
+            animations[i] = {"name": ANIMATIONS[i][0], "page": page, "row": row}
+
+    return {
+        "version": 1,
+        "frame_width": frame_w,
+        "frame_height": frame_h,
+        "frames": NUM_FRAMES,
+        "pages": pages,
+        "animations": animations,
+    }
+
+
+def sheet_scales(scales):
+    """Render scales in write order; the 1x sheet is always built."""
+    if any(scale < 1 for scale in scales):
+        raise ValueError(f"render scales must be 1 or more, got {list(scales)}")
+    return sorted(set(scales) | {1})
+
+
+def sheet_paths(out_dir=OUT_DIR, max_page=MAX_PAGE_SIZE, layout=PAGE_LAYOUT, scales=(1,)):
+    """Sheet pages, their texture blobs, the manifests and the pose rig
+    written by stream_sheet."""
+    paths = []
+    for scale in sheet_scales(scales):
+        for p in build_manifest(max_page, layout, scale)["pages"]:
+            paths += [os.path.join(out_dir, p["file"]), os.path.join(out_dir, p["blob"])]
+        paths.append(os.path.join(out_dir, manifest_name(scale)))
+    return paths + rig_paths(out_dir, RIG_NAME)
+
+
+def stream_sheet(out_dir=OUT_DIR, sheet=True, previews=True, max_page=MAX_PAGE_SIZE, layout=PAGE_LAYOUT,
+                 scales=(1,)):
+    """Render the sheet one animation row at a time, streaming rows to disk.
+
+    Each row is drawn once, at every scale in scales (plus 1x) together,
+    and each strip is fed to the PNG and pre-decoded .cgtx blob of its sheet
+    page; the 1x strip also goes to the 4x preview writer (upscaled per row)
+    and the key frame previews. Strips are then dropped. A page's writers
+    stay open only until its last row arrives, so peak memory is one row at
+    each scale and its 4x preview copy, independent of NUM_ANIMS. Returns
+    the written paths.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    scales = sheet_scales(scales) if sheet else [1]
+    manifests = {scale: build_manifest(max_page, layout, scale) for scale in scales}
+    sheet_w = FRAME_W * NUM_FRAMES
+    sheet_h = FRAME_H * len(ANIMATIONS)
+
+    open_pages = {}  # (scale, page index) -> [png writer, blob writer, rows left]
+    preview_writer = None
+    paths = []
+    if previews:
+        preview_writer = PNGWriter(preview_paths(out_dir)[0], sheet_w * 4, sheet_h * 4)
+        paths.append(preview_writer.path)
+    try:
+        for row, (anim_name, draw_frame) in enumerate(ANIMATIONS):
+            strips = render_strips(draw_frame, scales)
+            if sheet:
+                for scale, strip in strips.items():
+                    manifest = manifests[scale]
+                    key = (scale, manifest["animations"][row]["page"])
+                    if key not in open_pages:
+                        page = manifest["pages"][key[1]]
+                        png = PNGWriter(os.path.join(out_dir, page["file"]), page["width"], page["height"])
+                        blob = BlobWriter(os.path.join(out_dir, page["blob"]), page["width"], page["height"],
+                                          manifest["frame_width"], manifest["frame_height"])
+                        open_pages[key] = [png, blob, page["height"] // manifest["frame_height"]]
+                        paths += [png.path, blob.path]
+                    entry = open_pages[key]
+                    entry[0].write_image(strip)
+                    entry[1].write_image(strip)
+                    entry[2] -= 1
+                    if entry[2] == 0:
+                        entry[0].close()
+                        entry[1].close()
+                        del open_pages[key]
+            if previews:
+                strip = strips[1]
+                preview_writer.write_image(strip.resize((sheet_w * 4, FRAME_H * 4), Image.NEAREST))
+                paths += _write_key_frames(strip, anim_name, out_dir)
+    finally:
+        for png, blob, _ in open_pages.values():
+            png.close()
+            blob.close()
+        if preview_writer:
+            preview_writer.close()
+
+    if sheet:
+        for scale, manifest in manifests.items():
+            manifest_path = os.path.join(out_dir, manifest_name(scale))
+            with open(manifest_path, "w") as f:
+                json.dump(manifest, f, indent=2)
+                f.write("\n")
+            paths.append(manifest_path)
+        paths += write_poses(out_dir)
+    return paths
 
-    sheet.save("assets/developer/exercise_spritesheet.png")
-    print(f"Generated exercise_spritesheet.png ({sheet_w}x{sheet_h})")
 
-    preview = sheet.resize((sheet_w * 4, sheet_h * 4), Image.NEAREST)
-    preview.save("assets/developer/exercise_spritesheet_preview.png")
+def main():
+    parser = argparse.ArgumentParser(description="Generate the exercise sprite sheet and previews.")
+    parser.add_argument("--max-page", type=int, default=MAX_PAGE_SIZE,
+                        help=f"maximum sheet page width/height in pixels (default {MAX_PAGE_SIZE})")
+    parser.add_argument("--layout", choices=LAYOUTS, default=PAGE_LAYOUT,
+                        help=f"'sheet' packs rows densely, 'rows' gives each exercise its own texture "
+                             f"(default {PAGE_LAYOUT})")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1], metavar="N",
+                        help="also render native N-x sheets, e.g. --scales 2 4 (the 1x sheet is always built)")
+    args = parser.parse_args()
+
+    stream_sheet(max_page=args.max_page, layout=args.layout, scales=args.scales)
+    for scale in sheet_scales(args.scales):
+        for page in build_manifest(args.max_page, args.layout, scale)["pages"]:
+            print(f"Generated {page['file']} + {page['blob']} ({page['width']}x{page['height']})")
+        print(f"Generated {manifest_name(scale)}")
+    print(f"Generated {RIG_NAME} + parts atlas ({', '.join(RIGGED)})")
+    sheet_w, sheet_h = FRAME_W * NUM_FRAMES, FRAME_H * len(ANIMATIONS)
     print(f"Generated exercise_spritesheet_preview.png ({sheet_w*4}x{sheet_h*4})")
-
-    # Key frame previews
-    anim_names = [
-        "coffee_idle", "waving", "pump_up", "chair_dips", "arm_circles", "wondering",
-        "knee_raises", "spinal_twist", "glute_squeeze", "shoulder_rolls", "leg_extensions", "neck_stretch",
-        "desk_pushups", "squats", "calf_raises", "wall_sit", "torso_rotation", "reverse_lunges",
-    ]
-    for anim in range(NUM_ANIMS):
-        anim_name = anim_names[anim]
-        for frame in [0, 4, 5, 6, 8, 12]:
-            region = sheet.crop((
-                frame * FRAME_W,
-                anim * FRAME_H,
-                (frame + 1) * FRAME_W,
-                (anim + 1) * FRAME_H,
-            ))
-            scaled = region.resize((FRAME_W * 8, FRAME_H * 8), Image.NEAREST)
-            scaled.save(f"assets/developer/{anim_name}_f{frame:02d}_preview.png")
     print("Generated key frame previews (8x scale)")
 
 
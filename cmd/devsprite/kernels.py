@@ -0,0 +1,118 @@
+"""Pixel kernels behind _fill_body_segment and _draw_thick_arm.
+
+Each kernel turns one limb into an index patch: an (h, w) int8 array of
+color indices, -1 where the limb doesn't reach, which Canvas.paint() then
+copies in with a single paste instead of a putpixel per pixel.
+
+Two backends compute the same patches:
+
+- "numba": the loop kernels compiled with numba, used when it is installed
+  (`pip install numba`);
+- "python": the same loops as plain Python, the default without numba.
+
+Both do the same IEEE double operations in the same order (numba runs
+without fastmath, so nothing is fused or reordered) and round half to even,
+so the sheets they produce are byte-identical. DEVSPRITE_KERNELS picks a
+backend by name; `python -m devsprite bench` times a full sheet build on
+each one.
+
+Neither backend makes the full sheet build measurably faster: the time goes
+to pixels drawn one by one through px(), not to limbs. numba only speeds up
+limb-heavy rows (desk pushups: 9.6ms to 5.1ms). A vectorized NumPy backend
+was tried and dropped, as it was slower than the loops at 1x (0.76x) and no
+faster at 1+2+4x.
+"""
+import os
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+BACKENDS = ("numba", "python") if numba else ("python",)
+
+
+# =========================================================================
+# KERNELS
+# =========================================================================
+
+def _segment_loops(x0, y0, w, h, s, x1, y1, ux, uy, px_dir, py_dir, length, half_w):
+    out = np.full((h, w), -1, dtype=np.int8)
+    for j in range(h):
+        vy = (y0 + j + 0.5) / s - 0.5 - y1
+        for i in range(w):
+            vx = (x0 + i + 0.5) / s - 0.5 - x1
+            along = vx * ux + vy * uy
+            perp = vx * px_dir + vy * py_dir
+            if -0.7 <= along <= length + 0.7 and abs(perp) <= half_w + 0.3:
+                if perp < -(half_w - 1.2):
+                    out[j, i] = 2
+                elif perp > (half_w - 1.2):
+                    out[j, i] = 1
+                else:
+                    out[j, i] = 0
+    return out
+
+
+def _line_loops(x1, y1, x2, y2, s):
+    dx, dy = x2 - x1, y2 - y1
+    steps = max(abs(dx), abs(dy), 1) * s
+    xs = np.empty(steps + 1, dtype=np.int64)
+    ys = np.empty(steps + 1, dtype=np.int64)
+    for i in range(steps + 1):
+        t = i / steps
+        xs[i] = round(x1 * s + dx * s * t)
+        ys[i] = round(y1 * s + dy * s * t)
+    side_x, side_y = (0, s) if abs(dx) >= abs(dy) else (s, 0)
+    x0, y0 = xs.min(), ys.min()
+    out = np.full((ys.max() - y0 + s + side_y, xs.max() - x0 + s + side_x), -1, dtype=np.int8)
+    # c2 (index 1) beside the line first, c1 (index 0) on top
+    for color, ox, oy in ((1, side_x, side_y), (0, 0, 0)):
+        for i in range(steps + 1):
+            bx, by = xs[i] - x0 + ox, ys[i] - y0 + oy
+            out[by:by + s, bx:bx + s] = color
+    return x0, y0, out
+
+
+# =========================================================================
+# BACKEND
+# =========================================================================
+
+_KERNELS = {
+    "python": (_segment_loops, _line_loops),
+}
+if numba:
+    # The on-disk cache records the importing module's name, so only use it
+    # as devsprite.kernels; a script run (import kernels) compiles afresh
+    _jit = numba.njit(cache=bool(__package__))
+    _KERNELS["numba"] = (_jit(_segment_loops), _jit(_line_loops))
+
+backend = None
+_segment = _line = None
+
+
+def use(name):
+    """Switch every kernel to backend name (one of BACKENDS)."""
+    global backend, _segment, _line
+    if name not in _KERNELS:
+        raise ValueError(f"kernel backend '{name}' is not available (have {', '.join(BACKENDS)})")
+    backend = name
+    _segment, _line = _KERNELS[name]
+
+
+def segment_index(x0, y0, w, h, s, x1, y1, ux, uy, px_dir, py_dir, length, half_w):
+    """_fill_body_segment over the w x h pixels from (x0, y0) of a scale-s
+    grid: 0 fill, 1 shade, 2 highlight, -1 outside."""
+    return _segment(x0, y0, w, h, s, float(x1), float(y1), ux, uy, px_dir, py_dir, length, float(half_w))
+
+
+def line_index(x1, y1, x2, y2, s):
+    """_draw_thick_arm between whole art pixels on a scale-s grid: (x0, y0,
+    patch), patch 0 for c1 and 1 for c2, its top-left at pixel (x0, y0)."""
+    x0, y0, out = _line(int(x1), int(y1), int(x2), int(y2), s)
+    return int(x0), int(y0), out
+
+
+use(os.environ.get("DEVSPRITE_KERNELS") or BACKENDS[0])
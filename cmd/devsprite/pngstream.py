@@ -0,0 +1,91 @@
+"""Incremental PNG encoder.
+
+PNGWriter takes RGBA scanlines as they are produced and pushes them through a
+zlib stream, emitting an IDAT chunk whenever the compressor hands back enough
+data. Only the pending compressed bytes are held in memory, so writing an
+image costs the memory of whatever rows the caller has in hand, not the full
+width x height buffer Image.save needs.
+
+    with PNGWriter(path, width, height) as png:
+        for strip in strips:          # PIL RGBA images, width x any height
+            png.write_image(strip)
+"""
+import struct
+import zlib
+
+SIGNATURE = b"\x89PNG\r\n\x1a\n"
+IDAT_SIZE = 1 << 16
+COLOR_RGBA = 6
+
+
+def _chunk(f, kind, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(kind)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+
+class PNGWriter:
+    """Write an 8-bit RGBA PNG one scanline (or strip of scanlines) at a time."""
+
+    def __init__(self, path, width, height, level=6):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self._stride = width * 4
+        self._zlib = zlib.compressobj(level)
+        self._pending = bytearray()
+        self._f = open(path, "wb")
+        self._f.write(SIGNATURE)
+        _chunk(self._f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, COLOR_RGBA, 0, 0, 0))
+
+    def write_rows(self, data):
+        """Append raw RGBA bytes covering one or more whole scanlines."""
+        if len(data) % self._stride:
+            raise ValueError(f"row data is not a multiple of {self._stride} bytes")
+        count = len(data) // self._stride
+        if self.rows_written + count > self.height:
+            raise ValueError(f"{self.path}: more than {self.height} rows written")
+
+        # Filter type 0 (None) on every line: pixel art compresses well without prediction
+        view = memoryview(data)
+        raw = b"".join(b"\x00" + view[i * self._stride:(i + 1) * self._stride] for i in range(count))
+        self._push(self._zlib.compress(raw))
+        self.rows_written += count
+
+    def write_image(self, img):
+        """Append every scanline of an RGBA image whose width matches."""
+        if img.width != self.width:
+            raise ValueError(f"strip width {img.width} != image width {self.width}")
+        self.write_rows(img.convert("RGBA").tobytes())
+
+    def _push(self, data):
+        self._pending += data
+        while len(self._pending) >= IDAT_SIZE:
+            _chunk(self._f, b"IDAT", bytes(self._pending[:IDAT_SIZE]))
+            del self._pending[:IDAT_SIZE]
+
+    def close(self):
+        if self._f is None:
+            return
+        try:
+            if self.rows_written != self.height:
+                raise ValueError(f"{self.path}: wrote {self.rows_written} of {self.height} rows")
+            self._pending += self._zlib.flush()
+            if self._pending:
+                _chunk(self._f, b"IDAT", bytes(self._pending))
+            _chunk(self._f, b"IEND", b"")
+        finally:
+            self._f.close()
+            self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._f.close()
+            self._f = None
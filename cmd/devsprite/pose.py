@@ -0,0 +1,356 @@
+"""Skeletal poses for the exercise animations.
+
+A Pose is a set of joint tracks plus the layers drawn from them. A track is a
+list of (frame, x, y) keyframes in frame coordinates; between keyframes the
+joint moves linearly, and after the last one it moves back towards the first,
+so animations loop. A single keyframe holds the joint still.
+
+rasterize() evaluates every track at all requested times at once and draws
+each layer across every frame in one numpy pass, with the pixel rules of the
+hand-written helpers in generate_exercises.py:
+
+- segment(): _fill_body_segment, a filled parallelogram with shaded edges
+  (thighs, shins, torsos on diagonal poses);
+- arm(): _draw_thick_arm, a 2px stepped line between whole-pixel joints;
+- part(): a sprite cut from the generator's own drawing helpers (head,
+  torso, legs...), pinned to a joint.
+
+Layers are drawn in list order, later ones on top, and are clipped to the
+frame. A layer can be limited to some frames, and limbs can hang from a
+joint (`at`) so a whole arm bobs with the body by whole pixels. Times may be
+fractional, so a pose renders at any frame count for about the cost of one
+frame per layer. Like canvas.Canvas, a pose renders natively at any scale:
+joints stay in art pixels and limbs are rasterized on the finer grid.
+
+A pose made only of parts and limbs needs no sprite sheet: write_rig()
+exports the tracks, layers and a small parts atlas for the game to assemble
+frames at runtime (pose_rig.go), with the same rules.
+"""
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+from PIL import Image
+
+try:
+    from .canvas import Canvas
+except ImportError:  # run as a script from cmd/devsprite
+    from canvas import Canvas
+
+SEGMENT, ARM, PART = "segment", "arm", "part"
+RIG_VERSION = 1
+
+# colors: segment (fill, shade, highlight), arm (c1, c2)
+Limb = namedtuple("Limb", "kind a b half_w colors at frames")
+
+
+def segment(a, b, half_w, fill, shade, highlight, at=None, frames=None):
+    """Filled limb from joint a to joint b, half_w pixels either side."""
+    return Limb(SEGMENT, a, b, half_w, (fill, shade, highlight), at, _frame_set(frames))
+
+
+def arm(a, b, c1, c2, at=None, frames=None):
+    """2px line from joint a to joint b: c1 along the line, c2 beside it."""
+    return Limb(ARM, a, b, 0.0, (c1, c2), at, _frame_set(frames))
+
+
+class Part:
+    """Sprite of whatever draw(img, *origin) paints, pinned by origin to joint
+    `at` (the frame origin if None). A nonzero origin keeps pixels left of or
+    above the joint. The sprite is drawn the first time a scale is used, so
+    poses can be declared before the helpers they call."""
+
+    kind = PART
+
+    def __init__(self, name, draw, at=None, frames=None, origin=(0, 0), size=(32, 32)):
+        self.name, self.at, self.frames = name, at, _frame_set(frames)
+        self._draw, self._origin, self._size = draw, origin, size
+        self._sprites = {}
+
+    def __repr__(self):
+        # Stable across runs (no addresses) for the preview's row fingerprints
+        return (f"Part({self.name!r}, draw={self._draw.__qualname__}, at={self.at!r}, "
+                f"frames={_frames_repr(self.frames)}, origin={self._origin!r}, size={self._size!r})")
+
+    def sprite(self, scale=1):
+        """(dx, dy, cropped sprite) at a render scale, offsets in its pixels."""
+        if scale not in self._sprites:
+            canvas = Canvas(*self._size, scales=(scale,))
+            self._draw(canvas, *self._origin)
+            img = canvas.images[scale]
+            box = img.getbbox()
+            if box is None:
+                raise ValueError(f"part '{self.name}' draws nothing")
+            self._sprites[scale] = (box[0] - self._origin[0] * scale, box[1] - self._origin[1] * scale,
+                                    img.crop(box))
+        return self._sprites[scale]
+
+    @property
+    def dx(self):
+        return self.sprite()[0]
+
+    @property
+    def dy(self):
+        return self.sprite()[1]
+
+    @property
+    def image(self):
+        """The cropped 1x sprite, drawn with its top-left at joint + (dx, dy)."""
+        return self.sprite()[2]
+
+
+def part(name, draw, at=None, frames=None, origin=(0, 0)):
+    """Sprite layer; parts with the same name must draw the same thing."""
+    return Part(name, draw, at, frames, origin)
+
+
+def _frame_set(frames):
+    return None if frames is None else frozenset(frames)
+
+
+def _frames_repr(frames):
+    return None if frames is None else sorted(frames)
+
+
+class Pose:
+    """Joint tracks and layers of one animation, looping every `frames`."""
+
+    def __init__(self, tracks, layers=(), frames=16):
+        self.frames = frames
+        self.layers = list(layers)
+        self.tracks = {}
+        for name, keys in tracks.items():
+            keys = sorted(keys)
+            if not keys:
+                raise ValueError(f"joint '{name}' has no keyframes")
+            self.tracks[name] = np.array(keys, dtype=np.float64).reshape(-1, 3)
+        for layer in self.layers:
+            for joint in _joints_of(layer):
+                if joint not in self.tracks:
+                    raise ValueError(f"{layer.kind} layer uses unknown joint '{joint}'")
+        self._layers = {}
+
+    def __repr__(self):
+        tracks = {name: keys.tolist() for name, keys in self.tracks.items()}
+        layers = [layer if layer.kind == PART else layer._replace(frames=_frames_repr(layer.frames))
+                  for layer in self.layers]
+        return f"Pose(tracks={tracks!r}, layers={layers!r}, frames={self.frames!r})"
+
+    def parts(self):
+        """The part layers, in drawing order."""
+        return [layer for layer in self.layers if layer.kind == PART]
+
+    def joints(self, times):
+        """{joint: (len(times), 2) float array} of positions at each time."""
+        times = np.asarray(times, dtype=np.float64)
+        out = {}
+        for name, keys in self.tracks.items():
+            if len(keys) == 1:
+                out[name] = np.broadcast_to(keys[0, 1:], (len(times), 2)).copy()
+            else:
+                out[name] = np.stack([np.interp(times, keys[:, 0], keys[:, 1], period=self.frames),
+                                      np.interp(times, keys[:, 0], keys[:, 2], period=self.frames)], axis=1)
+        return out
+
+    def point(self, joint, frame):
+        """Whole-pixel (x, y) of a joint at a frame."""
+        x, y = self.joints([frame])[joint][0]
+        return int(round(x)), int(round(y))
+
+    def rasterize(self, width, height, times=None, scale=1):
+        """(len(times), height * scale, width * scale, 4) uint8 frames of
+        every layer, alpha 0 where nothing is drawn. width and height are in
+        art pixels; times defaults to each whole frame."""
+        if times is None:
+            times = np.arange(self.frames)
+        times = np.asarray(times, dtype=np.float64)
+        joints = self.joints(times)
+        whole = np.floor(times).astype(np.int64) % self.frames
+        zero = np.zeros((len(times), 2), dtype=np.int64)
+        out = np.zeros((len(times), height * scale, width * scale, 4), dtype=np.uint8)
+        for layer in self.layers:
+            shown = np.ones(len(times), dtype=bool)
+            if layer.frames is not None:
+                shown = np.isin(whole, list(layer.frames))
+            if not shown.any():
+                continue
+            origin = np.rint(joints[layer.at]).astype(np.int64) if layer.at else zero
+            if layer.kind == PART:
+                _blit_part(out, np.flatnonzero(shown), origin[shown], layer, scale)
+            else:
+                draw = _fill_segments if layer.kind == SEGMENT else _thick_lines
+                sub = out[shown]
+                draw(sub, joints[layer.a][shown], joints[layer.b][shown], origin[shown], layer, scale)
+                out[shown] = sub
+        return out
+
+    def draw(self, img, ox, oy, frame, width=32, height=32):
+        """Draw one whole frame of the pose onto Canvas img at art pixel
+        (ox, oy), at each of its scales.
+
+        Pixels replace what is underneath, like px(). All frames of a scale
+        are rasterized together the first time and cached.
+        """
+        for s, image in img.images.items():
+            key = (width, height, s)
+            if key not in self._layers:
+                layers = self.rasterize(width, height, scale=s)
+                self._layers[key] = [(Image.fromarray(l, "RGBA"), Image.fromarray(l[..., 3] != 0).convert("L"))
+                                     for l in layers]
+            layer, mask = self._layers[key][frame % self.frames]
+            image.paste(layer, (ox * s, oy * s), mask)
+
+    def to_json(self):
+        """Tracks and layers as written to the rig; parts are named, their
+        pixels live in the atlas."""
+        tracks = {name: [[_num(v) for v in key] for key in keys.tolist()] for name, keys in self.tracks.items()}
+        layers = []
+        for layer in self.layers:
+            entry = {"kind": layer.kind}
+            if layer.kind == PART:
+                entry.update(part=layer.name, dx=layer.dx, dy=layer.dy)
+            else:
+                entry.update(a=layer.a, b=layer.b, colors=[list(c) for c in layer.colors])
+                if layer.kind == SEGMENT:
+                    entry["half_w"] = layer.half_w
+            if layer.at:
+                entry["at"] = layer.at
+            if layer.frames is not None:
+                entry["frames"] = sorted(layer.frames)
+            layers.append(entry)
+        return {"frames": self.frames, "tracks": tracks, "layers": layers}
+
+
+def _num(v):
+    return int(v) if v == int(v) else v
+
+
+def _joints_of(layer):
+    joints = [layer.at] if layer.at else []
+    if layer.kind != PART:
+        joints += [layer.a, layer.b]
+    return joints
+
+
+def _fill_segments(out, a, b, origin, limb, scale=1):
+    """_fill_body_segment for every frame: pixels within half_w + 0.3 of the
+    a-b axis and up to 0.7 past either end, highlight on the -perpendicular
+    edge and shade on the +perpendicular edge. At scale s, pixel centers sit
+    at (X + 0.5) / s - 0.5 art pixels."""
+    h, w = out.shape[1:3]
+    half_w = limb.half_w
+    x1, y1 = a[:, 0, None, None], a[:, 1, None, None]
+    dx, dy = b[:, 0, None, None] - x1, b[:, 1, None, None] - y1
+    length = np.sqrt(dx * dx + dy * dy)
+    valid = length >= 0.1
+    length = np.where(valid, length, 1.0)
+    ux, uy = dx / length, dy / length
+
+    # Pixel grid in the limb's own coordinates
+    vx = ((np.arange(w) + 0.5) / scale - 0.5)[None, None, :] - origin[:, 0, None, None] - x1
+    vy = ((np.arange(h) + 0.5) / scale - 0.5)[None, :, None] - origin[:, 1, None, None] - y1
+    along = vx * ux + vy * uy
+    perp = vx * -uy + vy * ux
+    inside = valid & (along >= -0.7) & (along <= length + 0.7) & (np.abs(perp) <= half_w + 0.3)
+
+    # 0 fill, 1 shade, 2 highlight
+    which = np.where(perp < -(half_w - 1.2), 2, np.where(perp > half_w - 1.2, 1, 0))
+    colors = np.array(limb.colors, dtype=np.uint8)
+    out[inside] = colors[which[inside]]
+
+
+def _thick_lines(out, a, b, origin, limb, scale=1):
+    """_draw_thick_arm for every frame: joints snap to whole pixels, the line
+    takes max(|dx|, |dy|) * scale steps of scale x scale blocks and its
+    second color sits one block below it on shallow lines and to the right of
+    it on steep ones, under the first where they overlap."""
+    n, h, w, _ = out.shape
+    s = scale
+    a, b = np.rint(a).astype(np.int64), np.rint(b).astype(np.int64)
+    x1, y1 = a[:, 0, None], a[:, 1, None]
+    dx, dy = b[:, 0, None] - x1, b[:, 1, None] - y1
+    steps = np.maximum(np.maximum(np.abs(dx), np.abs(dy)), 1) * s
+
+    i = np.arange(int(steps.max()) + 1)[None, :]
+    t = i / steps
+    x = np.rint(x1 * s + dx * s * t).astype(np.int64) + origin[:, 0, None] * s
+    y = np.rint(y1 * s + dy * s * t).astype(np.int64) + origin[:, 1, None] * s
+    drawn = np.broadcast_to(i <= steps, x.shape)
+    f = np.broadcast_to(np.arange(n)[:, None], x.shape)
+    shallow = np.broadcast_to(np.abs(dx) >= np.abs(dy), x.shape).astype(np.int64)
+
+    c1, c2 = (np.array(c, dtype=np.uint8) for c in limb.colors)
+    for px, py, c in ((x + (1 - shallow) * s, y + shallow * s, c2), (x, y, c1)):
+        for by in range(s):
+            for bx in range(s):
+                bpx, bpy = px + bx, py + by
+                keep = drawn & (bpx >= 0) & (bpx < w) & (bpy >= 0) & (bpy < h)
+                out[f[keep], bpy[keep], bpx[keep]] = c
+
+
+def _blit_part(out, index, origin, part, scale=1):
+    """Copy a part's opaque pixels into frames out[index] at origin + (dx, dy)."""
+    h, w = out.shape[1:3]
+    dx, dy, image = part.sprite(scale)
+    sprite = np.asarray(image)
+    mask = sprite[..., 3] != 0
+    sh, sw = mask.shape
+    for i, (ox, oy) in zip(index, origin):
+        x0, y0 = ox * scale + dx, oy * scale + dy
+        cx0, cy0 = max(0, -x0), max(0, -y0)
+        cx1, cy1 = min(sw, w - x0), min(sh, h - y0)
+        if cx0 >= cx1 or cy0 >= cy1:
+            continue
+        dst = out[i, y0 + cy0:y0 + cy1, x0 + cx0:x0 + cx1]
+        m = mask[cy0:cy1, cx0:cx1]
+        dst[m] = sprite[cy0:cy1, cx0:cx1][m]
+
+
+def rig_paths(out_dir, json_name):
+    """The rig description and its parts atlas."""
+    base = os.path.splitext(json_name)[0]
+    return [os.path.join(out_dir, json_name), os.path.join(out_dir, base + "_parts.png")]
+
+
+def write_rig(animations, out_dir, json_name, frame_size=(32, 32)):
+    """Export standalone poses for runtime playback.
+
+    animations is a list of (index, name, pose); index is the AnimationType the
+    pose replaces. Parts are packed left to right into one atlas, each name
+    once. Returns the written paths.
+    """
+    json_path, atlas_path = rig_paths(out_dir, json_name)
+    sprites = {}
+    for _, _, pose in animations:
+        for layer in pose.layers:
+            if layer.kind == PART:
+                sprites.setdefault(layer.name, layer.image)
+
+    boxes = {}
+    x = 0
+    for name, image in sprites.items():
+        boxes[name] = (x, 0, image.width, image.height)
+        x += image.width
+    atlas = Image.new("RGBA", (max(x, 1), max([i.height for i in sprites.values()] or [1])), (0, 0, 0, 0))
+    for name, image in sprites.items():
+        atlas.paste(image, boxes[name][:2])
+
+    rig = {
+        "version": RIG_VERSION,
+        "frame_width": frame_size[0],
+        "frame_height": frame_size[1],
+        "parts_file": os.path.basename(atlas_path),
+        "parts": [{"name": name, "x": bx, "y": by, "w": bw, "h": bh} for name, (bx, by, bw, bh) in boxes.items()],
+        "animations": [dict(index=index, name=name, **pose.to_json()) for index, name, pose in animations],
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    atlas.save(atlas_path, optimize=True)
+    # The JSON goes last and whole (renamed into place): the game's hot
+    # reload reads the rig when it changes, and the atlas must be ready then
+    tmp = json_path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(rig, f, separators=(",", ":"))
+        f.write("\n")
+    os.replace(tmp, json_path)
+    return [json_path, atlas_path]
@@ -0,0 +1,407 @@
+"""Live preview server for the exercise sprite animations.
+
+Serves every row of the exercise sprite sheet as a looping, pixelated
+animation in the browser and pushes updates over Server-Sent Events whenever
+generate_exercises.py or one of its helper modules (pose, canvas, kernels...)
+changes on disk. Only rows whose drawing code (or any
+helper/constant it reaches) changed are re-rendered, so edits show up in well
+under a second without building the Go `debug` studio or raylib.
+
+Usage (from cmd/):
+    python -m devsprite preview [--port 8765] [--scale 6]
+
+Then open http://127.0.0.1:8765/ in a browser.
+"""
+import asyncio
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import types
+from urllib.parse import urlsplit
+
+from . import generate_exercises as gen
+
+POLL_INTERVAL = 0.2  # seconds between source mtime checks
+FRAME_MS = 84        # matches AnimationSystem.frameDuration (~12 FPS)
+
+# Modules generate_exercises draws with, reloaded before it in this order
+# (each after the ones it imports) when any watched source changes
+HELPERS = ("kernels", "canvas", "pngstream", "texblob", "pose")
+
+
+# =========================================================================
+# CHANGE DETECTION
+# =========================================================================
+
+def _code_digest(h, code):
+    """Feed a code object (and nested code objects) into hash h.
+
+    Line numbers are left out so edits elsewhere in the file that only shift
+    a function down don't mark it dirty.
+    """
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_digest(h, const)
+        else:
+            h.update(repr(const).encode())
+
+
+def _global_names(code):
+    """All global names referenced by code, including nested functions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def helpers_digest():
+    """Hash the source of every HELPERS module.
+
+    Their code (kernels, Canvas, Pose rasterizing...) is not walked by
+    row_fingerprint, and any row may run it, so an edit to one marks every
+    row dirty.
+    """
+    h = hashlib.sha1()
+    for name in HELPERS:
+        with open(sys.modules[f"{__package__}.{name}"].__file__, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def row_fingerprint(module, draw_frame, helpers=""):
+    """Hash a row's draw function together with everything it reaches.
+
+    Walks module-level functions and constants referenced transitively from
+    draw_frame, so changing a shared helper (e.g. draw_head_front) or a
+    palette color marks every row that uses it as dirty. A pose counts by its
+    repr plus the functions its parts draw with; helpers (helpers_digest())
+    stands in for the helper modules.
+    """
+    funcs = {}
+    consts = {}
+    stack = [(draw_frame.__name__, draw_frame)]
+    while stack:
+        key, fn = stack.pop()
+        if key in funcs:
+            continue
+        funcs[key] = fn
+        for name in _global_names(fn.__code__):
+            val = getattr(module, name, None)
+            if isinstance(val, types.FunctionType):
+                if val.__module__ == module.__name__:
+                    stack.append((val.__name__, val))
+            elif not isinstance(val, (types.ModuleType, type)) and val is not None:
+                consts[name] = val
+                if isinstance(val, module.Pose):
+                    # Parts often draw through lambdas: key them by part name
+                    stack.extend((f"{name}.{layer.name}", layer._draw) for layer in val.parts())
+
+    h = hashlib.sha1(helpers.encode())
+    for name in sorted(funcs):
+        h.update(name.encode())
+        _code_digest(h, funcs[name].__code__)
+    for name in sorted(consts):
+        h.update(name.encode())
+        h.update(repr(consts[name]).encode())
+    return h.hexdigest()
+
+
+# =========================================================================
+# RENDERING
+# =========================================================================
+
+def render_row_png(module, draw_frame):
+    """Render one animation row as a FRAME_W*NUM_FRAMES x FRAME_H PNG."""
+    strip = module.render_row(draw_frame)
+    buf = io.BytesIO()
+    strip.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class PreviewState:
+    """Rendered rows plus the fingerprints they were rendered from."""
+
+    def __init__(self, module):
+        self.module = module
+        self.names = []
+        self.fingerprints = []
+        self.pngs = []
+        self.versions = []
+        self.error = None
+
+    def rebuild(self, module):
+        """Re-render rows whose fingerprint changed. Returns changed row indices."""
+        names = [name for name, _ in module.ANIMATIONS]
+        helpers = helpers_digest()
+        fingerprints = [row_fingerprint(module, fn, helpers) for _, fn in module.ANIMATIONS]
+
+        changed = []
+        pngs = list(self.pngs[:len(names)])
+        versions = list(self.versions[:len(names)])
+        for row, (_, draw_frame) in enumerate(module.ANIMATIONS):
+            if row < len(self.fingerprints) and self.fingerprints[row] == fingerprints[row] \
+                    and self.names[row] == names[row]:
+                continue
+            png = render_row_png(module, draw_frame)
+            if row < len(pngs):
+                pngs[row] = png
+                versions[row] += 1
+            else:
+                pngs.append(png)
+                versions.append(1)
+            changed.append(row)
+
+        self.module = module
+        self.names = names
+        self.fingerprints = fingerprints
+        self.pngs = pngs
+        self.versions = versions
+        self.error = None
+        return changed
+
+    def layout(self):
+        return [
+            {"row": row, "name": name, "version": self.versions[row]}
+            for row, name in enumerate(self.names)
+        ]
+
+
+# =========================================================================
+# HTTP + SSE
+# =========================================================================
+
+INDEX_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>devsprite preview</title>
+<style>
+body { background:#18141f; color:#ddd; font:12px monospace; margin:16px; }
+#grid { display:flex; flex-wrap:wrap; gap:12px; }
+figure { margin:0; background:#221c2e; padding:6px; }
+canvas { display:block; image-rendering:pixelated; image-rendering:crisp-edges; }
+figcaption { margin-top:4px; }
+#err { color:#ff7060; white-space:pre-wrap; }
+</style></head><body>
+<div>scale <input id="scale" type="range" min="1" max="12" value="__SCALE__">
+<span id="scaleval">__SCALE__x</span> &nbsp; <span id="status">connecting...</span></div>
+<div id="err"></div>
+<div id="grid"></div>
+<script>
+const FW = __FRAME_W__, FH = __FRAME_H__, NF = __NUM_FRAMES__, FRAME_MS = __FRAME_MS__;
+const rows = [];
+const grid = document.getElementById("grid");
+const scaleInput = document.getElementById("scale");
+
+function applyScale() {
+  const s = scaleInput.value;
+  document.getElementById("scaleval").textContent = s + "x";
+  for (const r of rows) { r.canvas.style.width = (FW * s) + "px"; r.canvas.style.height = (FH * s) + "px"; }
+}
+scaleInput.oninput = applyScale;
+
+function loadRow(r, version) {
+  const img = new Image();
+  img.onload = () => { r.img = img; };
+  img.src = "/row/" + r.row + ".png?v=" + version;
+}
+
+async function loadLayout() {
+  const layout = await (await fetch("/anims.json")).json();
+  grid.innerHTML = "";
+  rows.length = 0;
+  for (const a of layout) {
+    const fig = document.createElement("figure");
+    const canvas = document.createElement("canvas");
+    canvas.width = FW; canvas.height = FH;
+    const cap = document.createElement("figcaption");
+    cap.textContent = a.row + " " + a.name;
+    fig.append(canvas, cap);
+    grid.append(fig);
+    const r = { row: a.row, canvas, ctx: canvas.getContext("2d"), img: null };
+    rows.push(r);
+    loadRow(r, a.version);
+  }
+  applyScale();
+}
+
+let frame = 0;
+setInterval(() => {
+  frame = (frame + 1) % NF;
+  for (const r of rows) {
+    if (!r.img) continue;
+    r.ctx.clearRect(0, 0, FW, FH);
+    r.ctx.drawImage(r.img, frame * FW, 0, FW, FH, 0, 0, FW, FH);
+  }
+}, FRAME_MS);
+
+const es = new EventSource("/events");
+const status = document.getElementById("status");
+es.onopen = () => { status.textContent = "live"; };
+es.onerror = () => { status.textContent = "disconnected"; };
+es.addEventListener("row", (e) => {
+  const d = JSON.parse(e.data);
+  const r = rows[d.row];
+  if (r) loadRow(r, d.version);
+  document.getElementById("err").textContent = "";
+});
+es.addEventListener("layout", () => { loadLayout(); document.getElementById("err").textContent = ""; });
+es.addEventListener("error", (e) => { if (e.data) document.getElementById("err").textContent = JSON.parse(e.data).message; });
+loadLayout();
+</script></body></html>
+"""
+
+
+class PreviewServer:
+    """Serves the preview page and broadcasts row updates to SSE clients."""
+
+    def __init__(self, state, source_paths, scale):
+        self.state = state
+        self.source_paths = source_paths
+        self.scale = scale
+        self.clients = set()
+
+    def index_html(self):
+        m = self.state.module
+        return (INDEX_HTML
+                .replace("__SCALE__", str(self.scale))
+                .replace("__FRAME_W__", str(m.FRAME_W))
+                .replace("__FRAME_H__", str(m.FRAME_H))
+                .replace("__NUM_FRAMES__", str(m.NUM_FRAMES))
+                .replace("__FRAME_MS__", str(FRAME_MS)))
+
+    def broadcast(self, event, data):
+        msg = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+        for queue in self.clients:
+            queue.put_nowait(msg)
+
+    async def handle(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            # Drain headers; nothing in them matters to us
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET":
+                await self._respond(writer, 405, "text/plain", b"method not allowed")
+                return
+            path = urlsplit(parts[1]).path
+
+            if path == "/":
+                await self._respond(writer, 200, "text/html; charset=utf-8", self.index_html().encode())
+            elif path == "/anims.json":
+                await self._respond(writer, 200, "application/json", json.dumps(self.state.layout()).encode())
+            elif path.startswith("/row/") and path.endswith(".png"):
+                try:
+                    row = int(path[len("/row/"):-len(".png")])
+                    png = self.state.pngs[row]
+                except (ValueError, IndexError):
+                    await self._respond(writer, 404, "text/plain", b"no such row")
+                    return
+                await self._respond(writer, 200, "image/png", png)
+            elif path == "/events":
+                await self._stream_events(writer)
+            else:
+                await self._respond(writer, 404, "text/plain", b"not found")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, content_type, body):
+        reason = {200: "OK", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Cache-Control: no-store\r\n"
+            "Connection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+
+    async def _stream_events(self, writer):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-store\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+            b"retry: 1000\n\n"
+        )
+        if self.state.error:
+            writer.write(f"event: error\ndata: {json.dumps({'message': self.state.error})}\n\n".encode())
+        await writer.drain()
+
+        queue = asyncio.Queue()
+        self.clients.add(queue)
+        try:
+            while True:
+                try:
+                    msg = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    msg = b": keepalive\n\n"
+                writer.write(msg)
+                await writer.drain()
+        finally:
+            self.clients.discard(queue)
+
+    def _mtimes(self):
+        return [os.stat(path).st_mtime_ns for path in self.source_paths]
+
+    async def watch_source(self):
+        """Poll the generator and helper sources and push re-rendered rows on
+        change."""
+        loop = asyncio.get_running_loop()
+        last_mtimes = self._mtimes()
+        while True:
+            await asyncio.sleep(POLL_INTERVAL)
+            try:
+                mtimes = self._mtimes()
+            except OSError:
+                continue  # editor mid-save (rename/replace)
+            if mtimes == last_mtimes:
+                continue
+            last_mtimes = mtimes
+
+            old_count = len(self.state.names)
+            old_names = list(self.state.names)
+            try:
+                for name in HELPERS:
+                    importlib.reload(sys.modules[f"{__package__}.{name}"])
+                module = importlib.reload(self.state.module)
+                changed = await loop.run_in_executor(None, self.state.rebuild, module)
+            except Exception as e:  # keep serving the last good frames
+                self.state.error = f"{type(e).__name__}: {e}"
+                print(f"Reload failed: {self.state.error}")
+                self.broadcast("error", {"message": self.state.error})
+                continue
+
+            if len(self.state.names) != old_count or self.state.names != old_names:
+                print(f"Layout changed ({len(self.state.names)} rows)")
+                self.broadcast("layout", {})
+                continue
+            for row in changed:
+                self.broadcast("row", {"row": row, "version": self.state.versions[row]})
+            names = ", ".join(self.state.names[row] for row in changed) or "none"
+            print(f"Re-rendered {len(changed)} row(s): {names}")
+
+
+async def serve(host, port, scale):
+    state = PreviewState(gen)
+    state.rebuild(gen)
+    sources = [os.path.abspath(sys.modules[f"{__package__}.{name}"].__file__) for name in HELPERS]
+    server = PreviewServer(state, sources + [os.path.abspath(gen.__file__)], scale)
+
+    http = await asyncio.start_server(server.handle, host, port)
+    print(f"Preview: http://{host}:{port}/  (watching {os.path.basename(gen.__file__)} and its helpers)")
+    async with http:
+        await asyncio.gather(http.serve_forever(), server.watch_source())
+
+
+def run(host="127.0.0.1", port=8765, scale=6):
+    try:
+        asyncio.run(serve(host, port, scale))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,780 @@
+"""Headless reference renderer for the office scene.
+
+Draws what the game window shows -- the office biome from biome_office.go,
+one character frame from the sprite sheet and the UI overlays from
+renderer_ui.go -- into a 320x200 numpy canvas, with no window or GPU. Draw
+order, coordinates and the Go float32 math are followed call for call, and
+blending works like raylib's: translucent draws also blend the target's
+alpha, and the window shows the target composited over black. Rectangles,
+pixels, sprites and the bubble triangles therefore match a screenshot of
+the game. Text is the exception: raylib's built-in font isn't in the repo,
+so labels use Pillow's bitmap font and only approximate the game's.
+
+As in the game, the static part of the office is drawn once per Scene and
+copied for each frame, so a frame costs a few dozen array slices:
+
+    scene = Scene()
+    for i in range(120):
+        scene.render(t=i / 12, anim="wondering", frame=i % 16).image().save(f"f{i:03}.png")
+"""
+import datetime
+import json
+import math
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+W, H = 320, 200
+CLEAR = (24, 20, 37, 255)  # main.go's frame target clear color
+
+FRAME_SECONDS = 0.084  # AnimationSystem frameDuration
+CLAUDE_SCALE = 2
+OFFICE_CLAUDE_OFFSET_X = 20
+OFFICE_DESK_TOP = 138  # first desk row; the desk covers the chair below it
+
+ASSET_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets", "developer"))
+MANIFEST_PATH = os.path.join(ASSET_DIR, "exercise_spritesheet.json")
+
+MODES = ("idle", "menu", "prompting", "pump_up", "countdown", "exercising", "paused")
+
+# renderer_ui.go colors
+UI_BG = (20, 18, 30, 220)
+UI_BORDER = (80, 80, 100, 255)
+UI_TEXT = (220, 220, 230, 255)
+UI_DIM = (140, 140, 160, 255)
+UI_HIGHLIGHT = (255, 170, 50, 255)
+UI_ACCENT = (100, 180, 255, 255)
+BUBBLE_BG = (255, 255, 245, 240)
+BUBBLE_TEXT = (40, 40, 50, 255)
+BANNER_BG = (200, 60, 60, 230)
+BANNER_TEXT = (255, 255, 255, 255)
+
+
+def f32(x):
+    return np.float32(x)
+
+
+def sin(x):
+    return math.sin(float(x))
+
+
+# =========================================================================
+# CANVAS
+# =========================================================================
+
+class Font:
+    """Stand-in for raylib's default font: a bitmap font drawn as 1-bit masks."""
+
+    def __init__(self):
+        try:
+            self.font = ImageFont.load_default_imagefont()
+        except AttributeError:  # Pillow < 10.1
+            self.font = ImageFont.load_default()
+        self.masks = {}
+
+    def measure(self, text):
+        return int(self.font.getlength(text))
+
+    def mask(self, text):
+        m = self.masks.get(text)
+        if m is None:
+            img = Image.new("L", (max(1, self.measure(text)), 12), 0)
+            ImageDraw.Draw(img).text((0, 0), text, fill=255, font=self.font)
+            m = self.masks[text] = np.asarray(img) > 127
+        return m
+
+
+class Canvas:
+    """An RGBA render target with the raylib draw calls the game uses.
+
+    Every call blends like raylib's default mode, on all four channels:
+    out = (src * a + dst * (255 - a)) / 255, rounded to 8 bits.
+    """
+
+    font = None
+
+    def __init__(self, width=W, height=H, clear=CLEAR):
+        self.px = np.empty((height, width, 4), dtype=np.uint8)
+        self.px[:] = clear
+        if Canvas.font is None:
+            Canvas.font = Font()
+
+    def copy(self):
+        c = Canvas.__new__(Canvas)
+        c.px = self.px.copy()
+        return c
+
+    def _clip(self, x, y, w, h):
+        height, width = self.px.shape[:2]
+        x0, y0 = max(int(x), 0), max(int(y), 0)
+        x1, y1 = min(int(x + w), width), min(int(y + h), height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def _blend(self, region, color, mask=None):
+        a = color[3]
+        if a == 0:
+            return
+        if a == 255:
+            if mask is None:
+                region[:] = color
+            else:
+                region[mask] = color
+            return
+        dst = region if mask is None else region[mask]
+        src = np.array(color, dtype=np.float32)
+        out = np.floor((src * a + dst.astype(np.float32) * (255 - a)) / 255 + 0.5).astype(np.uint8)
+        if mask is None:
+            region[:] = out
+        else:
+            region[mask] = out
+
+    def rect(self, x, y, w, h, color):
+        """DrawRectangle."""
+        box = self._clip(x, y, w, h)
+        if box:
+            x0, y0, x1, y1 = box
+            self._blend(self.px[y0:y1, x0:x1], color)
+
+    def pixel(self, x, y, color):
+        """DrawPixel."""
+        self.rect(x, y, 1, 1, color)
+
+    def line(self, x0, y0, x1, y1, color):
+        """DrawLine; the game only draws horizontal and vertical ones, and GL
+        leaves out the end pixel."""
+        if y0 == y1:
+            self.rect(min(x0, x1), y0, abs(x1 - x0), 1, color)
+        elif x0 == x1:
+            self.rect(x0, min(y0, y1), 1, abs(y1 - y0), color)
+        else:
+            raise ValueError("only axis-aligned lines are supported")
+
+    def rect_lines(self, x, y, w, h, color):
+        """DrawRectangleLines: a 1px outline inside the rectangle."""
+        self.rect(x, y, w, 1, color)
+        self.rect(x, y + h - 1, w, 1, color)
+        self.rect(x, y + 1, 1, h - 2, color)
+        self.rect(x + w - 1, y + 1, 1, h - 2, color)
+
+    def _mask_fill(self, x0, y0, x1, y1, inside, color):
+        box = self._clip(x0, y0, x1 - x0, y1 - y0)
+        if not box:
+            return
+        x0, y0, x1, y1 = box
+        ys, xs = np.mgrid[y0:y1, x0:x1].astype(np.float32) + 0.5
+        mask = inside(xs, ys)
+        if mask.any():
+            self._blend(self.px[y0:y1, x0:x1], color, mask)
+
+    def triangle(self, v1, v2, v3, color):
+        """DrawTriangle: pixels whose centers fall inside, either winding."""
+        (ax, ay), (bx, by), (cx, cy) = v1, v2, v3
+
+        def inside(xs, ys):
+            e1 = (bx - ax) * (ys - ay) - (by - ay) * (xs - ax)
+            e2 = (cx - bx) * (ys - by) - (cy - by) * (xs - bx)
+            e3 = (ax - cx) * (ys - cy) - (ay - cy) * (xs - cx)
+            return ((e1 >= 0) & (e2 >= 0) & (e3 >= 0)) | ((e1 <= 0) & (e2 <= 0) & (e3 <= 0))
+
+        self._mask_fill(math.floor(min(ax, bx, cx)), math.floor(min(ay, by, cy)),
+                        math.ceil(max(ax, bx, cx)), math.ceil(max(ay, by, cy)), inside, color)
+
+    def circle(self, cx, cy, r, color):
+        """DrawCircle."""
+        self._mask_fill(cx - r, cy - r, cx + r + 1, cy + r + 1,
+                        lambda xs, ys: (xs - cx) ** 2 + (ys - cy) ** 2 <= r * r, color)
+
+    def blit(self, rgba, x, y, scale=1):
+        """DrawTexturePro of a whole RGBA array, nearest-neighbor scaled."""
+        if scale != 1:
+            rgba = rgba.repeat(scale, axis=0).repeat(scale, axis=1)
+        h, w = rgba.shape[:2]
+        box = self._clip(x, y, w, h)
+        if not box:
+            return
+        x0, y0, x1, y1 = box
+        src = rgba[y0 - y:y1 - y, x0 - x:x1 - x].astype(np.float32)
+        dst = self.px[y0:y1, x0:x1]
+        a = src[..., 3:4]
+        dst[:] = np.floor((src * a + dst.astype(np.float32) * (255 - a)) / 255 + 0.5).astype(np.uint8)
+
+    def measure(self, text):
+        """MeasureText(text, 8)."""
+        return self.font.measure(text)
+
+    def text(self, text, x, y, color):
+        """DrawText(text, x, y, 8, color)."""
+        if not text:
+            return
+        mask = self.font.mask(text)
+        h, w = mask.shape
+        box = self._clip(x, y, w, h)
+        if box:
+            x0, y0, x1, y1 = box
+            self._blend(self.px[y0:y1, x0:x1], color, mask[y0 - y:y1 - y, x0 - x:x1 - x])
+
+    def image(self):
+        """What the window shows: the target drawn over black, as an RGB image."""
+        px = self.px.astype(np.uint16)
+        rgb = (px[..., :3] * px[..., 3:4] + 127) // 255
+        return Image.fromarray(rgb.astype(np.uint8), "RGB")
+
+
+# =========================================================================
+# OFFICE BIOME (biome_office.go)
+# =========================================================================
+
+def draw_office_static(c):
+    """drawOfficeStatic: everything in the office that never changes."""
+    # Ceiling with wood trim
+    for y in range(12):
+        t = f32(y) / f32(12.0)
+        c.line(0, y, W, y, (int(f32(245) - t * 8), int(f32(238) - t * 8), int(f32(228) - t * 8), 255))
+    c.rect(0, 12, W, 2, (165, 130, 90, 255))
+
+    # Back wall
+    for y in range(14, 138):
+        t = f32(y - 14) / f32(124.0)
+        c.line(0, y, W, y, (int(f32(210) - t * 20), int(f32(215) - t * 18), int(f32(200) - t * 22), 255))
+
+    draw_bookshelf(c, 8, 30)
+    draw_office_window(c, 85, 24)
+    draw_wall_art(c, 240, 40)
+
+    draw_monitor(c, 116, 100)
+    draw_monitor(c, 164, 100)
+    draw_office_chair_bg(c, 168, 142)
+
+    # Desk surface
+    c.rect(80, 138, 160, 1, (185, 150, 110, 255))
+    c.rect(80, 139, 160, 3, (165, 130, 92, 255))
+    c.rect(80, 142, 160, 1, (140, 108, 72, 255))
+
+    draw_desk_mug(c, 90, 131)
+    draw_keyboard(c, 155, 139)
+    draw_desk_plant(c, 228, 126)
+
+    # Desk legs
+    leg, leg_highlight = (140, 108, 72, 255), (155, 122, 85, 255)
+    for lx in (85, 235):
+        c.rect(lx, 143, 3, 19, leg)
+        c.rect(lx, 143, 4, 1, leg_highlight)
+
+    draw_wood_floor(c)
+
+
+def draw_office_animated(c, t, clock, cat_alert=None, cat_paused=False):
+    """The per-frame part of drawBiomeOffice, over the static layer."""
+    draw_window_cloud(c, 85, 24, t)
+    draw_wall_clock(c, 240, 40, clock)
+    draw_monitor_code(c, 116, 100, t)
+    draw_monitor_code(c, 164, 100, t)
+    # The chair back covers the bottom code lines of the right monitor; only
+    # its rows above the desk, which the baked desk and keyboard sit over
+    draw_office_chair_back(c, 168, 142, OFFICE_DESK_TOP)
+    draw_mug_steam(c, 90, 131, t)
+    draw_plant_leaves(c, 228, 126, t)
+
+    if cat_alert and not cat_paused:
+        draw_jumping_cat(c, 265, 155, t)
+        draw_cat_alert_banner(c, 265, 155, cat_alert)
+    else:
+        draw_sleeping_cat(c, 265, 155, t)
+
+
+BOOK_COLORS = [
+    (180, 60, 60), (60, 100, 180), (60, 150, 80), (200, 170, 60), (140, 80, 160),
+    (200, 120, 60), (100, 140, 160), (180, 100, 120), (100, 100, 100), (160, 140, 100),
+    (80, 120, 60), (170, 80, 80), (90, 90, 150), (180, 150, 100), (120, 60, 100),
+]
+
+
+def draw_bookshelf(c, x, y):
+    shelf_w, shelf_h, inner_h = 36, 100, 28
+    wood_dark, wood_med = (120, 80, 50, 255), (140, 100, 65, 255)
+    c.rect(x, y, shelf_w, shelf_h, wood_dark)
+    c.rect(x + 2, y + 2, shelf_w - 4, shelf_h - 4, wood_med)
+
+    for s, sy in enumerate((y + 2, y + 34, y + 66)):
+        c.rect(x + 3, sy + 1, shelf_w - 6, inner_h, (80, 55, 35, 255))
+        bx = x + 4
+        for b in range(5):
+            r, g, bl = BOOK_COLORS[(s * 5 + b) % len(BOOK_COLORS)]
+            book_w = 4 + b % 3
+            book_h = inner_h - 4 - (b % 3) * 2
+            book_y = sy + 1 + inner_h - book_h
+            c.rect(bx, book_y, book_w, book_h, (r, g, bl, 255))
+            c.rect(bx, book_y, 1, book_h, (min(r + 30, 255), min(g + 30, 255), min(bl + 30, 255), 255))
+            bx += book_w + 1
+        c.rect(x + 2, sy + inner_h + 1, shelf_w - 4, 3, wood_dark)
+
+
+def draw_office_window(c, x, y):
+    frame = (200, 195, 185, 255)
+    win_w, win_h = 90, 70
+    pane_w, pane_h = 41, 31
+    c.rect(x, y, win_w, win_h, frame)
+
+    sky, hill, water = (145, 200, 230, 255), (120, 140, 100, 255), (100, 140, 170, 255)
+    tower, tower_hi, tower_sh = (190, 75, 50, 255), (210, 95, 65, 255), (155, 55, 35, 255)
+    cable = (175, 65, 45, 255)
+
+    def droop(cx, span):
+        t = f32(cx) / f32(span)
+        return int(f32(4.0) * t * (f32(1.0) - t) * f32(7.0))
+
+    def pane(px, py, pw, ph, bottom):
+        c.rect(px, py, pw, ph, sky)
+        t1x, t2x = px + pw // 3 - 1, px + pw * 2 // 3 - 1
+        if bottom:
+            water_top = py + ph // 4
+            c.rect(px, water_top, pw, ph - ph // 4, water)
+            for wy in range(water_top + 3, py + ph, 4):
+                c.rect(px + int(sin(wy * 0.8)) * 2 + pw // 4, wy, 3, 1, (120, 160, 185, 50))
+
+            c.rect(t1x, py, 2, ph // 3, tower)
+            c.rect(t1x, py, 1, ph // 3, tower_hi)
+            c.rect(t1x + 1, py, 1, ph // 3, tower_sh)
+            c.rect(t2x, py, 2, ph // 3, tower)
+            c.rect(t2x, py, 1, ph // 3, tower_sh)
+            c.rect(t2x + 1, py, 1, ph // 3, tower_hi)
+            for sx in range(t1x + 3, t2x, 3):
+                c.pixel(sx, py, cable)
+                c.pixel(sx, py + 1, cable)
+
+            deck_y = py + ph // 4 - 1
+            c.rect(px, deck_y, pw, 1, (175, 65, 45, 200))
+            ry = deck_y + 2
+            while ry < deck_y + 8 and ry < py + ph - 1:
+                c.pixel(t1x, ry, (155, 65, 50, 55))
+                c.pixel(t2x + 1, ry, (155, 65, 50, 55))
+                ry += 3
+            return
+
+        hill_y = py + ph - 8
+        c.rect(px, hill_y, pw, 4, hill)
+        for hx in range(0, pw, 3):
+            bump = int(sin(hx * 0.7))
+            c.pixel(px + hx, hill_y - 1 + bump, hill)
+            c.pixel(px + hx + 1, hill_y - 1 + bump, hill)
+        c.rect(px, py + ph - 4, pw, 4, (125, 175, 205, 255))
+
+        tower_h = 17
+        base = py + ph - 4
+        c.rect(t1x, base - tower_h, 2, tower_h, tower)
+        c.rect(t1x, base - tower_h, 1, tower_h, tower_hi)
+        c.rect(t1x + 1, base - tower_h, 1, tower_h, tower_sh)
+        c.rect(t2x, base - tower_h, 2, tower_h, tower)
+        c.rect(t2x, base - tower_h, 1, tower_h, tower_sh)
+        c.rect(t2x + 1, base - tower_h, 1, tower_h, tower_hi)
+        for beam_y in (base - tower_h + 4, base - tower_h // 2):
+            c.rect(t1x, beam_y, 2, 1, tower_hi)
+            c.rect(t2x, beam_y, 2, 1, tower_hi)
+
+        t1cx, t2cx = t1x + 1, t2x
+        cable_top = base - tower_h + 1
+        span = t2cx - t1cx
+        for cx in range(span + 1):
+            c.pixel(t1cx + cx, cable_top + droop(cx, span), cable)
+        deck_y = base - 4
+        for cx in range(3, span, 3):
+            for sy in range(cable_top + droop(cx, span), deck_y + 1):
+                c.pixel(t1cx + cx, sy, cable)
+
+        left_span = t1cx - px
+        for cx in range(left_span):
+            t = f32(cx) / f32(left_span)
+            c.pixel(px + cx, cable_top + int((f32(1.0) - t) * f32(5.0)), cable)
+        right_span = px + pw - t2cx
+        for cx in range(right_span):
+            t = f32(cx) / f32(right_span)
+            c.pixel(t2cx + cx, cable_top + int(t * f32(5.0)), cable)
+
+    right_x, bottom_y = x + win_w - 2 - pane_w, y + win_h - 2 - pane_h
+    pane(x + 2, y + 2, pane_w, pane_h, False)
+    pane(right_x, y + 2, pane_w, pane_h, False)
+    pane(x + 2, bottom_y, pane_w, pane_h, True)
+    pane(right_x, bottom_y, pane_w, pane_h, True)
+
+    c.rect(x + pane_w + 2, y + 2, win_w - 4 - pane_w * 2, win_h - 4, frame)
+    c.rect(x + 2, y + pane_h + 2, win_w - 4, win_h - 4 - pane_h * 2, frame)
+
+    # Sunlight glow on bottom panes
+    for py in range(bottom_y, y + win_h - 2):
+        alpha = int(f32(40) - f32(30) * f32(py - bottom_y) / f32(pane_h))
+        c.rect(x + 2, py, pane_w, 1, (255, 250, 220, alpha))
+
+    c.rect(x - 2, y + win_h, win_w + 4, 3, (185, 180, 170, 255))
+
+
+def draw_window_cloud(c, x, y, t):
+    cloud_x = int(sin(f32(t) * f32(0.08)) * 15)
+    c.rect(x + 15 + cloud_x, y + 8, 12, 3, (245, 245, 248, 180))
+    c.rect(x + 13 + cloud_x, y + 10, 16, 3, (245, 245, 248, 150))
+    c.rect(x + 16 + cloud_x, y + 12, 10, 2, (245, 245, 248, 120))
+
+
+WALL_CLOCK_W, WALL_CLOCK_H = 94, 18
+
+
+def draw_wall_art(c, x, y):
+    cx = x + math.trunc((24 - WALL_CLOCK_W) / 2)
+    c.rect(cx, y, WALL_CLOCK_W, WALL_CLOCK_H, (45, 45, 50, 255))
+    c.rect(cx + 2, y + 2, WALL_CLOCK_W - 4, WALL_CLOCK_H - 4, (15, 20, 15, 255))
+    c.rect(cx + 1, y + WALL_CLOCK_H, WALL_CLOCK_W - 2, 1, (35, 35, 38, 255))
+
+
+def draw_wall_clock(c, x, y, now):
+    green = (0, 220, 80, 255)
+    screen_x = x + math.trunc((24 - WALL_CLOCK_W) / 2) + 2
+    screen_w = WALL_CLOCK_W - 4
+    date_line = f"UTC {now.year:04d}-{now.month:02d}-{now.day:02d}"
+    time_line = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+    c.text(date_line, screen_x + (screen_w - c.measure(date_line)) // 2, y + 3, green)
+    c.text(time_line, screen_x + (screen_w - c.measure(time_line)) // 2, y + 10, green)
+
+
+def draw_monitor(c, x, y):
+    c.rect(x + 16, y + 30, 8, 8, (70, 70, 75, 255))
+    c.rect(x + 12, y + 37, 16, 3, (80, 80, 85, 255))
+    c.rect(x, y, 40, 30, (45, 45, 50, 255))
+    c.rect(x + 2, y + 2, 36, 26, (30, 35, 45, 255))
+
+
+CODE_COLORS = [
+    (100, 200, 130, 255), (180, 180, 200, 255), (220, 170, 100, 255),
+    (130, 170, 220, 255), (180, 180, 200, 255), (200, 120, 160, 255),
+]
+
+
+def draw_monitor_code(c, x, y, t):
+    scroll = int(f32(t) * f32(0.5))
+    for i in range(8):
+        indent = ((i + scroll // 2) % 3) * 3
+        line_w = min(10 + (i * 7 + scroll) % 15, 30)
+        c.rect(x + 4 + indent, y + 4 + i * 3, line_w, 1, CODE_COLORS[(i + scroll) % len(CODE_COLORS)])
+    if int(f32(t)) % 2 == 0:
+        c.rect(x + 8, y + 4 + 6 * 3, 2, 2, (200, 200, 220, 255))
+
+
+def draw_keyboard(c, x, y):
+    c.rect(x, y, 36, 4, (60, 60, 65, 255))
+    c.rect(x + 1, y, 34, 3, (75, 75, 80, 255))
+    for row in range(2):
+        for col in range(8):
+            kx, ky = x + 2 + col * 4, y + row * 2
+            c.pixel(kx, ky, (90, 90, 95, 255))
+            c.pixel(kx + 1, ky, (95, 95, 100, 255))
+
+
+def draw_desk_mug(c, x, y):
+    mug, shadow = (230, 230, 225, 255), (200, 200, 195, 255)
+    c.rect(x, y, 7, 8, mug)
+    c.rect(x, y + 7, 7, 1, shadow)
+    c.rect(x + 1, y, 5, 2, (90, 55, 25, 255))
+    for hx, hy in ((7, 2), (8, 3), (8, 4), (7, 5)):
+        c.pixel(x + hx, y + hy, shadow)
+
+
+def draw_mug_steam(c, x, y, t):
+    t = f32(t)
+    sway = int(sin(t * f32(0.8)) * 2)
+    alpha1 = int(100 + 50 * sin(t * f32(1.2)))
+    alpha2 = int(80 + 40 * sin(t * f32(1.2) + f32(1)))
+    c.pixel(x + 2 + sway, y - 2, (200, 200, 210, alpha1))
+    c.pixel(x + 4 - sway, y - 3, (200, 200, 210, alpha2))
+    c.pixel(x + 3 + sway, y - 4, (200, 200, 210, alpha1 // 2))
+
+
+def draw_desk_plant(c, x, y):
+    c.rect(x, y + 6, 10, 7, (180, 100, 70, 255))
+    c.rect(x - 1, y + 5, 12, 2, (150, 80, 55, 255))
+    c.rect(x + 1, y + 5, 8, 1, (60, 45, 30, 255))
+    for sy in (4, 3, 2):
+        c.pixel(x + 5, y + sy, (60, 140, 70, 255))
+
+
+def draw_plant_leaves(c, x, y, t):
+    sway = int(sin(f32(t) * f32(0.5)))
+    green, light = (60, 140, 70, 255), (80, 170, 90, 255)
+    c.pixel(x + 3 + sway, y + 1, green)
+    c.pixel(x + 2 + sway, y, light)
+    c.pixel(x + 7 - sway, y + 1, green)
+    c.pixel(x + 8 - sway, y, light)
+    c.pixel(x + 4 + sway, y - 1, light)
+    c.pixel(x + 6 - sway, y - 1, green)
+    c.pixel(x + 5, y - 2, light)
+
+
+def draw_office_chair_bg(c, x, y):
+    draw_office_chair_back(c, x, y, y)
+    c.rect(x - 4, y, 24, 4, (55, 55, 60, 255))
+
+
+def draw_office_chair_back(c, x, y, bottom):
+    """The chair's back rest, only the rows above bottom."""
+    c.rect(x, y - 18, 16, min(18, bottom - (y - 18)), (55, 55, 60, 255))
+    c.rect(x + 1, y - 17, 14, min(16, bottom - (y - 17)), (65, 65, 70, 255))
+
+
+CAT, CAT_LIGHT = (80, 75, 70, 255), (100, 95, 88, 255)
+
+
+def draw_sleeping_cat(c, x, y, t):
+    t = f32(t)
+    b = int(sin(t * f32(0.6)))
+    c.rect(x, y + 2 + b, 14, 6, CAT)
+    c.rect(x + 1, y + 1 + b, 12, 8, CAT)
+    c.rect(x + 3, y + 3 + b, 8, 4, CAT_LIGHT)
+    c.rect(x - 1, y + 1 + b, 5, 5, CAT)
+    c.pixel(x - 1, y + b, CAT)
+    c.pixel(x + 2, y + b, CAT)
+
+    wag = int(sin(t * f32(1.0)) * 2)
+    c.pixel(x + 13, y + 4 + b, CAT)
+    c.pixel(x + 14, y + 3 + b + wag, CAT)
+    c.pixel(x + 15, y + 2 + b + wag, CAT)
+
+    z = sin(t * f32(0.4))
+    z_color = (180, 180, 200, int(120 + 60 * z))
+    zy = y - 3 + int(z * 2)
+    c.pixel(x + 4, zy, z_color)
+    c.pixel(x + 5, zy - 1, z_color)
+
+
+def draw_jumping_cat(c, x, y, t):
+    t = f32(t)
+    by = y + min(int(sin(t * f32(4.0)) * 10), 0)
+    c.rect(x + 2, by - 4, 8, 10, CAT)
+    c.rect(x + 3, by - 3, 6, 8, CAT_LIGHT)
+    c.rect(x + 1, by - 9, 10, 6, CAT)
+    c.rect(x + 2, by - 8, 8, 4, CAT_LIGHT)
+    for ex in (1, 2, 9, 10):
+        c.pixel(x + ex, by - 10, CAT)
+    c.pixel(x + 3, by - 7, (220, 200, 60, 255))
+    c.pixel(x + 8, by - 7, (220, 200, 60, 255))
+    c.rect(x + 3, by + 6, 2, 4, CAT)
+    c.rect(x + 7, by + 6, 2, 4, CAT)
+
+    wag = int(sin(t * f32(3.0)) * 2)
+    c.pixel(x + 10, by - 2, CAT)
+    c.pixel(x + 11, by - 3, CAT)
+    c.pixel(x + 12 + wag, by - 4, CAT)
+    c.pixel(x + 13 + wag, by - 5, CAT)
+
+    if int(t * f32(3)) % 2 == 0:
+        c.rect(x + 5, by - 14, 2, 3, (255, 220, 60, 255))
+        c.rect(x + 5, by - 10, 2, 1, (255, 220, 60, 255))
+
+
+def draw_cat_alert_banner(c, x, y, text):
+    font_size, padding, spacing = 8, 8, 2
+    line1, line2 = "Claude Code", ""
+    if text == "Claude Code is done!":
+        line2 = "is done!"
+    elif text == "Claude Code needs you!":
+        line2 = "needs you!"
+    else:
+        line1 = text
+
+    banner_w = max(c.measure(line1), c.measure(line2)) + padding * 2
+    banner_h = font_size * 2 + spacing + padding * 2
+    bx = min(max(x + 6 - math.trunc(banner_w / 2), 2), W - 2 - banner_w)
+    by = y - 65
+
+    c.rect(bx, by, banner_w, banner_h, BUBBLE_BG)
+    c.rect_lines(bx, by, banner_w, banner_h, (180, 180, 170, 255))
+    tail_x = x + 6
+    c.triangle((tail_x - 3, by + banner_h), (tail_x + 3, by + banner_h), (tail_x, by + banner_h + 4), BUBBLE_BG)
+
+    claude = (217, 119, 60, 255)
+    c.text(line1, bx + padding, by + padding, claude)
+    if line2:
+        c.text(line2, bx + padding, by + padding + font_size + spacing, claude)
+
+
+def draw_wood_floor(c):
+    base, dark, light, groove = (155, 120, 80, 255), (140, 108, 70, 255), (168, 132, 90, 255), (125, 95, 60, 255)
+    c.rect(0, 162, W, 38, base)
+    plank_h, plank_w = 8, 40
+    for py in range(162, 200, plank_h):
+        c.line(0, py, W, py, groove)
+    for row in range(5):
+        py = 162 + row * plank_h
+        for px in range(plank_w // 2 if row % 2 else 0, W, plank_w):
+            c.line(px, py, px, py + plank_h, groove)
+            shade = (px // plank_w + row) % 3
+            if shade == 0:
+                c.rect(px + 1, py + 1, plank_w - 2, plank_h - 2, dark)
+            elif shade == 1:
+                c.rect(px + 1, py + 1, plank_w - 2, plank_h - 2, light)
+    c.rect(0, 162, W, 2, (130, 100, 65, 255))
+
+
+# =========================================================================
+# CHARACTER (renderer_claude.go)
+# =========================================================================
+
+class SpriteSheet:
+    """Frames of the exercise sprite sheet, addressed like SpritePages."""
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        with open(manifest_path, encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.dir = os.path.dirname(manifest_path)
+        self.names = [a["name"] for a in self.manifest["animations"]]
+        self.pages = {}
+
+    def placement(self, anim):
+        """Page and row of an animation, by manifest name or AnimationType number."""
+        if isinstance(anim, str):
+            if anim not in self.names:
+                raise ValueError(f"unknown animation {anim!r} (have: {', '.join(self.names)})")
+            anim = self.names.index(anim)
+        a = self.manifest["animations"][anim]
+        return a["page"], a["row"]
+
+    def frame(self, anim, frame):
+        page, row = self.placement(anim)
+        px = self.pages.get(page)
+        if px is None:
+            path = os.path.join(self.dir, self.manifest["pages"][page]["file"])
+            with Image.open(path) as img:
+                px = self.pages[page] = np.asarray(img.convert("RGBA"))
+        fw, fh = self.manifest["frame_width"], self.manifest["frame_height"]
+        return px[row * fh:(row + 1) * fh, frame * fw:(frame + 1) * fw]
+
+
+def draw_claude(c, sheet, anim, frame, offset_x=OFFICE_CLAUDE_OFFSET_X):
+    size = 32 * CLAUDE_SCALE
+    x = W // 2 - size // 2 + offset_x
+    y = 160 - size + 10
+    if sheet is not None:
+        c.blit(sheet.frame(anim, frame), x, y, CLAUDE_SCALE)
+        return
+    # drawPlaceholderClaude
+    color = (217, 119, 87, 255)
+    bob = (frame // 10) % 2 if anim in (0, 5, "coffee_idle", "wondering") else 0
+    c.rect(x + 8, y + 20, 16, 24, color)
+    c.circle(x + 16, y + 14 + bob, 10, color)
+    c.circle(x + 13, y + 12 + bob, 2, (255, 255, 255, 255))
+    c.circle(x + 19, y + 12 + bob, 2, (255, 255, 255, 255))
+
+
+# =========================================================================
+# UI OVERLAYS (renderer_ui.go)
+# =========================================================================
+
+def draw_hint_bar(c, text):
+    y = H - 12
+    c.rect(0, y, W, 12, (0, 0, 0, 150))
+    c.text(text, (W - c.measure(text)) // 2, y + 2, UI_DIM)
+
+
+def draw_speech_bubble(c, text):
+    if not text:
+        return
+    lines = text.split("\n")
+    bubble_w = max(c.measure(line) for line in lines) + 16
+    bubble_h = len(lines) * 10 + 10
+    center = W // 2
+    bx = min(max(center - math.trunc(bubble_w / 2), 4), W - 4 - bubble_w)
+    by = 90 - bubble_h
+
+    c.rect(bx, by, bubble_w, bubble_h, BUBBLE_BG)
+    c.rect_lines(bx, by, bubble_w, bubble_h, (180, 180, 170, 255))
+    c.triangle((center - 4, by + bubble_h), (center + 4, by + bubble_h), (center, by + bubble_h + 6), BUBBLE_BG)
+    for i, line in enumerate(lines):
+        c.text(line, bx + 8, by + 5 + i * 10, BUBBLE_TEXT)
+
+
+def draw_menu(c, selected=0):
+    c.rect(0, 0, W, H, (0, 0, 0, 100))
+    title = "EXERCISE MENU"
+    options = ["Start Exercise", "Exercise Log"]
+    box_w = min(max([c.measure(title)] + [c.measure("> " + o) for o in options]) + 24, W - 16)
+    box_h = 22 + len(options) * 16
+    box_x, box_y = (W - box_w) // 2, 40
+
+    c.rect(box_x - 1, box_y - 1, box_w + 2, box_h + 2, UI_BORDER)
+    c.rect(box_x, box_y, box_w, box_h, UI_BG)
+    c.text(title, box_x + (box_w - c.measure(title)) // 2, box_y + 6, UI_ACCENT)
+    for i, opt in enumerate(options):
+        y = box_y + 22 + i * 16
+        color, prefix = UI_TEXT, "  "
+        if i == selected:
+            color, prefix = UI_HIGHLIGHT, "> "
+            c.rect(box_x + 4, y - 1, box_w - 8, 12, (60, 55, 80, 200))
+        c.text(prefix + opt, box_x + 8, y, color)
+    draw_hint_bar(c, "[Enter] Select  [Esc] Close")
+
+
+def draw_pause_banner(c):
+    c.rect(0, 4, W, 20, BANNER_BG)
+    title, hint = "Paused", "[Esc] Resume  [Enter] Stop"
+    c.text(title, (W - c.measure(title)) // 2, 6, BANNER_TEXT)
+    c.text(hint, (W - c.measure(hint)) // 2, 15, (255, 200, 200, 255))
+
+
+def draw_overlay(c, mode, text="", countdown=3, selected=0, first=True):
+    """The Renderer.Draw switch on MenuState.Mode; text is the exercise's
+    bubble text while exercising or paused."""
+    if mode == "idle":
+        draw_hint_bar(c, "[Tab] Exercise menu")
+    elif mode == "menu":
+        draw_menu(c, selected)
+    elif mode == "prompting":
+        draw_speech_bubble(c, "Time to exercise!\nY or Enter to start")
+        draw_hint_bar(c, "[Y/Enter] Start  [N] Dismiss  [Tab] Menu")
+    elif mode == "pump_up":
+        draw_speech_bubble(c, "Let's start!" if first else "Next exercise!")
+    elif mode == "countdown":
+        draw_speech_bubble(c, str(countdown))
+    elif mode == "exercising":
+        draw_speech_bubble(c, text)
+        draw_hint_bar(c, "[Tab] Next exercise  [Esc] Pause")
+    elif mode == "paused":
+        draw_speech_bubble(c, text or "Get ready...")
+        draw_pause_banner(c)
+    elif mode is not None:
+        raise ValueError(f"unknown mode {mode!r} (have: {', '.join(MODES)})")
+
+
+# =========================================================================
+# SCENE
+# =========================================================================
+
+class Scene:
+    """Composes full frames: office, character and overlays.
+
+    The static office is drawn once here and copied per frame, the way the
+    game bakes it into its biome layer (alpha made opaque, as there).
+    """
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.static = Canvas()
+        draw_office_static(self.static)
+        self.static.px[..., 3] = 255
+        self.sheet = SpriteSheet(manifest_path) if manifest_path and os.path.exists(manifest_path) else None
+
+    def render(self, t=0.0, anim="wondering", frame=None, mode="idle", text="", countdown=3,
+               selected=0, first=True, cat_alert=None, cat_paused=False, clock=None):
+        """One frame at biome time t (seconds). frame defaults to the sprite
+        frame showing at t; clock defaults to now."""
+        if frame is None:
+            frame = int(t / FRAME_SECONDS) % 16
+        if clock is None:
+            clock = datetime.datetime.now(datetime.timezone.utc)
+        c = self.static.copy()
+        draw_office_animated(c, t, clock, cat_alert, cat_paused)
+        draw_claude(c, self.sheet, anim, frame)
+        draw_overlay(c, mode, text, countdown, selected, first)
+        return c
+
+    def frames(self, count, fps=12.0, start=0.0, **kwargs):
+        """Yield count consecutive frames, fps apart, starting at time start."""
+        for i in range(count):
+            yield self.render(t=start + i / fps, **kwargs)
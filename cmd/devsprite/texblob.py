@@ -0,0 +1,133 @@
+"""Pre-decoded texture blobs (.cgtx) for zero-decode sprite loading.
+
+The game uploads these straight to the GPU instead of inflating a PNG on
+every launch. Layout (little-endian), read by texture_blob.go:
+
+    offset  size  field
+    0       4     magic "CGTX"
+    4       2     version (1)
+    6       2     format: 1 = RGBA8, 2 = 8-bit palette indices
+    8       4     width
+    12      4     height
+    16      2     frame width
+    18      2     frame height
+    20      2     frames per row
+    22      2     rows
+    24      2     palette entries (format 2; 0 for RGBA8)
+    26      2     reserved (0)
+    28      4     CRC-32 of everything after the header
+    32      ...   pixels: width*height*4 bytes (RGBA8) or width*height indices
+    ...     ...   palette: entries*4 RGBA bytes (format 2)
+
+The palette trails the pixels so indices can be streamed row by row while the
+palette is still being discovered; the header is patched on close.
+"""
+import array
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"CGTX"
+VERSION = 1
+FORMAT_RGBA8 = 1
+FORMAT_INDEXED8 = 2
+HEADER = struct.Struct("<4sHHIIHHHHHHI")
+
+
+class BlobWriter:
+    """Stream RGBA strips into a .cgtx blob."""
+
+    def __init__(self, path, width, height, frame_w, frame_h, indexed=True):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.frame_w = frame_w
+        self.frame_h = frame_h
+        self.format = FORMAT_INDEXED8 if indexed else FORMAT_RGBA8
+        self.rows_written = 0
+        self.palette = {}  # packed RGBA uint32 -> index
+        self._crc = 0
+        self._f = open(path, "wb")
+        self._f.write(b"\0" * HEADER.size)
+
+    def write_image(self, img):
+        """Append every scanline of an RGBA image whose width matches."""
+        if img.width != self.width:
+            raise ValueError(f"strip width {img.width} != blob width {self.width}")
+        if self.rows_written + img.height > self.height:
+            raise ValueError(f"{self.path}: more than {self.height} rows written")
+
+        data = img.convert("RGBA").tobytes()
+        if self.format == FORMAT_INDEXED8:
+            colors, first, inverse = np.unique(np.frombuffer(data, dtype=np.uint32), return_index=True,
+                                               return_inverse=True)
+            palette = self.palette
+            # New colors get indices in order of first appearance
+            for i in np.argsort(first, kind="stable"):
+                c = int(colors[i])
+                if c not in palette:
+                    if len(palette) == 256:
+                        raise ValueError(f"{self.path}: more than 256 colors, write RGBA8 instead")
+                    palette[c] = len(palette)
+            lut = np.array([palette[int(c)] for c in colors], dtype=np.uint8)
+            data = lut[inverse.ravel()].tobytes()
+        self._write(data)
+        self.rows_written += img.height
+
+    def _write(self, data):
+        self._crc = zlib.crc32(data, self._crc)
+        self._f.write(data)
+
+    def close(self):
+        if self._f is None:
+            return
+        try:
+            if self.rows_written != self.height:
+                raise ValueError(f"{self.path}: wrote {self.rows_written} of {self.height} rows")
+            entries = 0
+            if self.format == FORMAT_INDEXED8:
+                entries = len(self.palette)
+                # dict preserves insertion order, which is index order
+                self._write(array.array("I", self.palette).tobytes())
+            self._f.seek(0)
+            self._f.write(HEADER.pack(
+                MAGIC, VERSION, self.format, self.width, self.height,
+                self.frame_w, self.frame_h, self.width // self.frame_w, self.height // self.frame_h,
+                entries, 0, self._crc,
+            ))
+        finally:
+            self._f.close()
+            self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._f.close()
+            self._f = None
+
+
+def read_blob(path):
+    """Decode a .cgtx blob to (header dict, RGBA bytes). For checks and tools."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    (magic, version, fmt, width, height, frame_w, frame_h,
+     frames, rows, entries, _, crc) = HEADER.unpack_from(raw)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a version {VERSION} CGTX blob")
+    body = raw[HEADER.size:]
+    if zlib.crc32(body) != crc:
+        raise ValueError(f"{path}: checksum mismatch")
+
+    if fmt == FORMAT_RGBA8:
+        pixels = body[:width * height * 4]
+    else:
+        palette = array.array("I", body[width * height:width * height + entries * 4])
+        pixels = array.array("I", (palette[i] for i in body[:width * height])).tobytes()
+    header = {"format": fmt, "width": width, "height": height, "frame_width": frame_w,
+              "frame_height": frame_h, "frames": frames, "rows": rows, "palette": entries}
+    return header, pixels
@@ -0,0 +1,7 @@
+"""Exercise-log analytics across many users.
+
+Run from the cmd/ directory:
+
+    python -m logstats logs/ -o summary.json    # every log under logs/
+    python -m logstats a.jsonl b.json -o summary.npz
+"""
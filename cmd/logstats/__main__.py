@@ -0,0 +1,41 @@
+"""Command line entry point: python -m logstats <logs...>."""
+import argparse
+import sys
+import time
+
+from .aggregate import CHUNK_ENTRIES, summarize, write_summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m logstats", description="Aggregate exercise logs across users.")
+    parser.add_argument("paths", nargs="+", help="exercise-log.jsonl / .json files, or directories of them")
+    parser.add_argument("-o", "--out", help="summary file (.json or .npz)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk", type=int, default=CHUNK_ENTRIES, help="entries per vectorized chunk")
+    parser.add_argument("--top", type=int, default=10, help="rows of each table to print")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    tables = summarize(args.paths, jobs=args.jobs, chunk=args.chunk)
+    files = tables["files"]
+    if not files["path"]:
+        print("Error: no exercise logs found", file=sys.stderr)
+        return 1
+
+    print(f"{len(files['path'])} logs, {sum(files['entries'])} entries, "
+          f"{sum(files['bad'])} unreadable ({time.perf_counter() - start:.2f}s)")
+    for table, key in (("types", "name"), ("days", "date")):
+        cols = tables[table]
+        print(f"\n{table}:")
+        for i in range(min(args.top, len(cols[key]))):
+            print(f"  {cols[key][i]:<24} {cols['count'][i]:>8} {cols['total_duration'][i] / 60:>10.1f} min "
+                  f"{cols['users'][i]:>6} users")
+
+    if args.out:
+        write_summary(tables, args.out)
+        print(f"\nWrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""Streaming per-type and per-day breakdowns of exercise logs.
+
+Reads both formats ExerciseLog has written: the append-only JSONL log (one
+entry per line) and the legacy {"version", "entries": [...]} document, which
+is decoded one entry at a time instead of with json.load. Entries are
+gathered into fixed-size column chunks (name code, day code, duration) and
+each chunk is reduced with numpy bincount, so memory stays constant however
+long a log is. The breakdowns match TypeBreakdown and DailyTrend in
+exercise_log.go: days are the writer's local dates, taken from the offset in
+completed_at.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+CHUNK_ENTRIES = 65536
+READ_SIZE = 1 << 20
+MAX_ENTRY = 1 << 16  # a legacy entry that doesn't decode within this is corrupt
+LOG_SUFFIXES = (".jsonl", ".json")
+
+
+class Totals:
+    """Count and total duration per key, merged chunk by chunk."""
+
+    def __init__(self):
+        self.codes = {}
+        self.count = np.zeros(0, dtype=np.int64)
+        self.duration = np.zeros(0, dtype=np.float64)
+
+    def code(self, key):
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.codes)
+        return code
+
+    def add(self, codes, durations):
+        n = len(self.codes)
+        if len(self.count) < n:
+            self.count = np.pad(self.count, (0, n - len(self.count)))
+            self.duration = np.pad(self.duration, (0, n - len(self.duration)))
+        self.count += np.bincount(codes, minlength=n)
+        self.duration += np.bincount(codes, weights=durations, minlength=n)
+
+    def items(self):
+        """(key, count, total_duration) for every key seen."""
+        return [(key, int(self.count[c]), float(self.duration[c])) for key, c in self.codes.items()]
+
+
+def iter_jsonl(f):
+    for line in f:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def iter_legacy(f):
+    """Yield the raw entries of a legacy log without loading the document.
+
+    An entry that won't decode, even with MAX_ENTRY bytes after it, is
+    yielded as None and reading resumes at the next "{": entries are flat
+    objects. A truncated last entry ends up the same way.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    while True:
+        i = buf.find('"entries"')
+        j = buf.find("[", i) if i >= 0 else -1
+        if j >= 0:
+            buf = buf[j + 1:]
+            break
+        more = f.read(READ_SIZE)
+        if not more:
+            return
+        buf += more
+
+    pos = 0
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos == len(buf):
+            more = f.read(READ_SIZE)
+            if not more:
+                return
+            buf, pos = more, 0
+            continue
+        if buf[pos] == "]":
+            return
+        try:
+            entry, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if len(buf) - pos < MAX_ENTRY:
+                more = f.read(READ_SIZE)
+                if more:
+                    buf, pos = buf[pos:] + more, 0
+                    continue
+            yield None
+            pos = buf.find("{", pos + 1)
+            while pos < 0:
+                buf = f.read(READ_SIZE)
+                if not buf:
+                    return
+                pos = buf.find("{")
+            continue
+        yield entry
+        pos = end
+        if pos > READ_SIZE:
+            buf, pos = buf[pos:], 0
+
+
+def iter_entries(path):
+    """Yield (entry dict or None for an unreadable line) from either format."""
+    with open(path, encoding="utf-8") as f:
+        head = f.read(64)
+        f.seek(0)
+        if '"version"' in head or '"entries"' in head:
+            yield from iter_legacy(f)
+            return
+        for line in iter_jsonl(f):
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield None
+
+
+def summarize_file(path, chunk=CHUNK_ENTRIES):
+    """Per-type and per-day totals of one log, plus a little metadata."""
+    types, days = Totals(), Totals()
+    names = np.empty(chunk, dtype=np.int64)
+    dates = np.empty(chunk, dtype=np.int64)
+    durations = np.empty(chunk, dtype=np.float64)
+    n = entries = bad = 0
+
+    def flush():
+        types.add(names[:n], durations[:n])
+        days.add(dates[:n], durations[:n])
+
+    for entry in iter_entries(path):
+        try:
+            name = entry["name"]
+            day = entry["completed_at"][:10]
+            duration = float(entry.get("duration", 0))
+        except (TypeError, KeyError, ValueError):
+            bad += 1
+            continue
+        names[n] = types.code(name)
+        dates[n] = days.code(day)
+        durations[n] = duration
+        n += 1
+        entries += 1
+        if n == chunk:
+            flush()
+            n = 0
+    flush()
+
+    return {
+        "path": path,
+        "entries": entries,
+        "bad": bad,
+        "types": types.items(),
+        "days": days.items(),
+    }
+
+
+def find_logs(paths):
+    """Expand directories into the log files beneath them."""
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith(LOG_SUFFIXES):
+                        yield os.path.join(dirpath, name)
+        else:
+            yield path
+
+
+def summarize(paths, jobs=None, chunk=CHUNK_ENTRIES):
+    """Summaries for many logs, one process per CPU, merged into fleet tables.
+
+    Returns a dict of columnar tables: "types" and "days" with count,
+    total_duration and users (logs that contain the key), sorted the way the
+    game shows them, and "files" with per-log entry counts.
+    """
+    files = list(find_logs(paths))
+    types, days = {}, {}
+    table_files = {"path": [], "entries": [], "bad": [], "first_day": [], "last_day": []}
+
+    def merge(into, rows):
+        for key, count, duration in rows:
+            total = into.setdefault(key, [0, 0.0, 0])
+            total[0] += count
+            total[1] += duration
+            total[2] += 1
+
+    if jobs == 1 or len(files) < 2:
+        results = (summarize_file(p, chunk) for p in files)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        results = pool.map(summarize_file, files, [chunk] * len(files), chunksize=max(1, len(files) // 64))
+    try:
+        for result in results:
+            merge(types, result["types"])
+            merge(days, result["days"])
+            dates = sorted(d for d, _, _ in result["days"])
+            table_files["path"].append(result["path"])
+            table_files["entries"].append(result["entries"])
+            table_files["bad"].append(result["bad"])
+            table_files["first_day"].append(dates[0] if dates else "")
+            table_files["last_day"].append(dates[-1] if dates else "")
+    finally:
+        if pool:
+            pool.shutdown()
+
+    def columns(totals, key_name, keys):
+        return {
+            key_name: keys,
+            "count": [totals[k][0] for k in keys],
+            "total_duration": [round(totals[k][1], 3) for k in keys],
+            "users": [totals[k][2] for k in keys],
+        }
+
+    return {
+        # TypeBreakdown: total duration desc; DailyTrend: most recent first
+        "types": columns(types, "name", sorted(types, key=lambda k: (-types[k][1], k))),
+        "days": columns(days, "date", sorted(days, reverse=True)),
+        "files": table_files,
+    }
+
+
+def write_summary(tables, path):
+    """Write tables column by column: .npz for numpy, otherwise JSON."""
+    if path.endswith(".npz"):
+        arrays = {f"{table}/{col}": np.asarray(values) for table, cols in tables.items() for col, values in cols.items()}
+        np.savez_compressed(path, **arrays)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "tables": tables}, f, separators=(",", ":"))
+        f.write("\n")
@@ -0,0 +1 @@
+"""README art generators."""
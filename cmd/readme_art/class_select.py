@@ -1,240 +1,316 @@
 #!/usr/bin/env python3
-"""Generate a pixel-art 'SELECT YOUR CLASS' menu for the README."""
+"""Generate a pixel-art 'SELECT YOUR CLASS' menu for the README.
+
+Classes, stats, verdicts, tags, palettes and output variants come from
+class_select.json. Geometry is laid out in 1x logical pixels and drawn
+directly at each variant's scale; text is rendered at the scaled font size
+from a per-(font, size) glyph cache, so it stays crisp instead of being
+NEAREST-upscaled. Fonts are vendored in fonts/, so the art renders the same
+on every machine.
+
+Usage:
+    python cmd/readme_art/class_select.py                  # variants in class_select.json
+    python cmd/readme_art/class_select.py --locale en --theme retro --scale 1 2 4
+"""
+
+import argparse
+import json
+import os
 
 from PIL import Image, ImageDraw, ImageFont
-import os
 
-SCALE = 2
-W, H = 460, 370
-
-# Retro palette
-BG = (18, 14, 28)
-BORDER = (120, 100, 160)
-BORDER_HI = (180, 160, 220)
-BORDER_DARK = (60, 50, 80)
-TITLE_COLOR = (255, 220, 60)
-LABEL_A = (255, 90, 70)
-LABEL_B = (90, 200, 255)
-LABEL_C = (80, 200, 100)
-TEXT = (200, 195, 210)
-DIM = (160, 155, 175)
-ACCENT = (255, 170, 50)
-SELECT = (60, 220, 90)
-DIVIDER = (60, 50, 80)
-
-# Tag colors
-TAG_MUST_BG = (180, 40, 30)
-TAG_MUST_FG = (255, 255, 255)
-TAG_SHOULD_BG = (30, 110, 170)
-TAG_SHOULD_FG = (255, 255, 255)
-TAG_DONT_BG = (55, 55, 65)
-TAG_DONT_FG = (140, 140, 150)
-
-img = Image.new("RGB", (W, H), BG)
-draw = ImageDraw.Draw(img)
-
-font_path = None
-for p in [
-    "/System/Library/Fonts/Menlo.ttc",
-    "/System/Library/Fonts/Monaco.dfont",
-    "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-]:
-    if os.path.exists(p):
-        font_path = p
-        break
-
-if font_path:
-    font_sm = ImageFont.truetype(font_path, 11)
-    font_md = ImageFont.truetype(font_path, 13)
-    font_tag = ImageFont.truetype(font_path, 10)
-    font_title = ImageFont.truetype(font_path, 16)
-else:
-    font_sm = ImageFont.load_default()
-    font_md = font_sm
-    font_tag = font_sm
-    font_title = font_sm
-
-
-def draw_border(x, y, w, h):
-    draw.rectangle([x, y, x + w, y + h], outline=BORDER_DARK)
-    draw.rectangle([x + 2, y + 2, x + w - 2, y + h - 2], outline=BORDER)
-    draw.line([(x + 2, y + 2), (x + w - 2, y + 2)], fill=BORDER_HI)
-    draw.line([(x + 2, y + 2), (x + 2, y + h - 2)], fill=BORDER_HI)
-    draw.line([(x + 3, y + h - 2), (x + w - 2, y + h - 2)], fill=BORDER_DARK)
-    draw.line([(x + w - 2, y + 3), (x + w - 2, y + h - 2)], fill=BORDER_DARK)
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.normpath(os.path.join(HERE, "..", ".."))
+DATA_PATH = os.path.join(HERE, "class_select.json")
+FONT_DIR = os.path.join(HERE, "fonts")
+OUT_PATH = os.path.join(ROOT, "assets", "class_select.png")
+
+
+def load_data(path=DATA_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def hex_color(value):
+    value = value.lstrip("#")
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def font_path(name):
+    """Path of a vendored font; a missing one is an error, not a fallback."""
+    path = os.path.join(FONT_DIR, name)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"font {name} is missing from {FONT_DIR}")
+    return path
+
+
+# =========================================================================
+# GLYPH ATLAS
+# =========================================================================
+
+class GlyphAtlas:
+    """Rasterized glyph masks for one font at one pixel size.
+
+    Each glyph is rendered once on first use; drawing a string is then just a
+    masked paste per character, with no FreeType work at draw time.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.glyphs = {}
+
+    def glyph(self, ch):
+        g = self.glyphs.get(ch)
+        if g is None:
+            left, top, right, bottom = self.font.getbbox(ch)
+            mask = None
+            if right > left and bottom > top:
+                mask = Image.new("L", (right - left, bottom - top), 0)
+                ImageDraw.Draw(mask).text((-left, -top), ch, fill=255, font=self.font)
+            g = (mask, left, top, self.font.getlength(ch))
+            self.glyphs[ch] = g
+        return g
+
+    def length(self, text):
+        return sum(self.glyph(ch)[3] for ch in text)
+
+    def draw(self, img, x, y, text, color):
+        pen = x
+        for ch in text:
+            mask, left, top, advance = self.glyph(ch)
+            if mask is not None:
+                img.paste(color, (int(pen) + left, y + top), mask)
+            pen += advance
+
+
+_atlases = {}
+
+
+def get_atlas(font_path, size):
+    """Shared atlas for (font_path, size), built on first request."""
+    key = (font_path, size)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(ImageFont.truetype(font_path, size))
+    return atlas
+
+
+# =========================================================================
+# CANVAS
+# =========================================================================
+
+class Canvas:
+    """An RGB image addressed in 1x logical pixels, drawn at `scale`."""
+
+    def __init__(self, w, h, scale, bg, font_path, font_sizes):
+        self.w, self.h, self.scale = w, h, scale
+        self.img = Image.new("RGB", (w * scale, h * scale), bg)
+        self.draw = ImageDraw.Draw(self.img)
+        self.fonts = {key: get_atlas(font_path, size * scale) for key, size in font_sizes.items()}
+
+    def fill(self, x0, y0, x1, y1, color):
+        """Fill the inclusive logical box (x0, y0)-(x1, y1)."""
+        s = self.scale
+        self.draw.rectangle([x0 * s, y0 * s, (x1 + 1) * s - 1, (y1 + 1) * s - 1], fill=color)
+
+    def outline(self, x0, y0, x1, y1, color):
+        self.fill(x0, y0, x1, y0, color)
+        self.fill(x0, y1, x1, y1, color)
+        self.fill(x0, y0, x0, y1, color)
+        self.fill(x1, y0, x1, y1, color)
+
+    def line(self, p0, p1, color):
+        """Axis-aligned line between two logical points (inclusive)."""
+        (x0, y0), (x1, y1) = p0, p1
+        self.fill(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1), color)
+
+    def point(self, x, y, color):
+        if 0 <= x < self.w and 0 <= y < self.h:
+            self.fill(x, y, x, y, color)
+
+    def textlength(self, text, font):
+        return self.fonts[font].length(text) / self.scale
+
+    def text(self, x, y, text, color, font):
+        s = self.scale
+        self.fonts[font].draw(self.img, int(x * s), int(y * s), text, color)
+
+
+# =========================================================================
+# DRAWING
+# =========================================================================
+
+def draw_border(c, theme, x, y, w, h):
+    c.outline(x, y, x + w, y + h, theme["border_dark"])
+    c.outline(x + 2, y + 2, x + w - 2, y + h - 2, theme["border"])
+    c.line((x + 2, y + 2), (x + w - 2, y + 2), theme["border_hi"])
+    c.line((x + 2, y + 2), (x + 2, y + h - 2), theme["border_hi"])
+    c.line((x + 3, y + h - 2), (x + w - 2, y + h - 2), theme["border_dark"])
+    c.line((x + w - 2, y + 3), (x + w - 2, y + h - 2), theme["border_dark"])
     for corner in [(x+1, y+1), (x+w-1, y+1), (x+1, y+h-1), (x+w-1, y+h-1)]:
-        img.putpixel(corner, BORDER)
+        c.point(*corner, theme["border"])
 
 
-def draw_divider(y):
-    for x in range(20, W - 20, 6):
-        draw.line([(x, y), (x + 3, y)], fill=DIVIDER)
+def draw_divider(c, theme, y):
+    for x in range(20, c.w - 20, 6):
+        c.line((x, y), (x + 3, y), theme["divider"])
 
 
-def draw_selector(x, y):
+def draw_selector(c, theme, x, y):
     for i in range(5):
-        draw.line([(x + i, y - i + 4), (x + i, y + i - 4)], fill=SELECT)
+        c.line((x + i, y - i + 4), (x + i, y + i - 4), theme["select"])
 
 
-def draw_star(cx, cy, color):
+def draw_star(c, cx, cy, color):
     pts = [(cx, cy-2), (cx-1, cy-1), (cx+1, cy-1),
            (cx-2, cy), (cx, cy), (cx+2, cy),
            (cx-1, cy+1), (cx+1, cy+1), (cx, cy+2)]
     for px, py in pts:
-        if 0 <= px < W and 0 <= py < H:
-            img.putpixel((px, py), color)
+        c.point(px, py, color)
 
 
-def draw_tag(x, y, text, bg, fg):
+def draw_tag(c, x, y, text, bg, fg):
     """Draw a pill-shaped tag badge."""
-    tw = int(draw.textlength(text, font=font_tag))
+    tw = int(c.textlength(text, "tag"))
     pad_x, pad_y = 5, 2
     tag_w = tw + pad_x * 2
     tag_h = 12 + pad_y
     # Background with 1px border radius feel
-    draw.rectangle([x + 1, y, x + tag_w - 1, y + tag_h], fill=bg)
-    draw.rectangle([x, y + 1, x + tag_w, y + tag_h - 1], fill=bg)
+    c.fill(x + 1, y, x + tag_w - 1, y + tag_h, bg)
+    c.fill(x, y + 1, x + tag_w, y + tag_h - 1, bg)
     # Text centered
-    draw.text((x + pad_x, y + pad_y), text, fill=fg, font=font_tag)
+    c.text(x + pad_x, y + pad_y, text, fg, "tag")
     return tag_w
 
 
-# ============================================================
-# MAIN BORDER
-# ============================================================
-draw_border(6, 6, W - 12, H - 12)
-
-# ============================================================
-# TITLE
-# ============================================================
-title = "IS THIS FOR ME?"
-tw = draw.textlength(title, font=font_title)
-tx = (W - tw) // 2
-draw.text((tx, 16), title, fill=TITLE_COLOR, font=font_title)
-draw_star(int(tx - 12), 24, TITLE_COLOR)
-draw_star(int(tx + tw + 12), 24, TITLE_COLOR)
-draw.line([(20, 36), (W - 20, 36)], fill=BORDER)
-
-# ============================================================
-# CLASS A: THE BROKEN VETERAN — MUST USE
-# ============================================================
-ya = 46
-
-draw_selector(16, ya + 8)
-draw.text((30, ya), "[A]", fill=LABEL_A, font=font_md)
-draw.rectangle([56, ya + 1, 60, ya + 11], fill=LABEL_A)
-draw.text((62, ya), "THE BROKEN VETERAN", fill=LABEL_A, font=font_md)
-
-# MUST USE tag
-tag_x = 62 + int(draw.textlength("THE BROKEN VETERAN", font=font_md)) + 8
-draw_tag(tag_x, ya, "MUST USE", TAG_MUST_BG, TAG_MUST_FG)
-
-stats_a = [
-    ("Age", "30+"),
-    ("Got children", "yes"),
-    ("Body status", "back pain, neck crunches"),
-]
-for i, (key, val) in enumerate(stats_a):
-    sy = ya + 20 + i * 15
-    draw.line([(36, ya + 16), (36, sy + 6)], fill=DIM)
-    draw.line([(36, sy + 6), (42, sy + 6)], fill=DIM)
-    draw.text((46, sy), key, fill=DIM, font=font_sm)
-    vx = 210
-    draw.text((vx, sy), val, fill=TEXT, font=font_sm)
-
-vy = ya + 20 + len(stats_a) * 15 + 4
-draw.line([(36, vy - 10), (36, vy + 6)], fill=DIM)
-draw.text((36, vy + 2), "└►", fill=ACCENT, font=font_sm)
-draw.text((58, vy), "VERDICT:", fill=ACCENT, font=font_md)
-draw.text((140, vy), "you need this yesterday", fill=LABEL_A, font=font_md)
-
-# ============================================================
-# DIVIDER
-# ============================================================
-d1y = vy + 22
-draw_divider(d1y)
-
-# ============================================================
-# CLASS B: THE OPTIMIST — SHOULD USE
-# ============================================================
-yb = d1y + 10
-
-draw.text((30, yb), "[B]", fill=LABEL_B, font=font_md)
-draw.rectangle([56, yb + 1, 60, yb + 11], fill=LABEL_B)
-draw.text((62, yb), "THE TICKING CLOCK", fill=LABEL_B, font=font_md)
-
-tag_x = 62 + int(draw.textlength("THE TICKING CLOCK", font=font_md)) + 8
-draw_tag(tag_x, yb, "SHOULD USE", TAG_SHOULD_BG, TAG_SHOULD_FG)
-
-stats_b = [
-    ("Age", "25-30"),
-    ("Got children", "not yet"),
-    ("Body status", "fine (for now)"),
-]
-for i, (key, val) in enumerate(stats_b):
-    sy = yb + 20 + i * 15
-    draw.line([(36, yb + 16), (36, sy + 6)], fill=DIM)
-    draw.line([(36, sy + 6), (42, sy + 6)], fill=DIM)
-    draw.text((46, sy), key, fill=DIM, font=font_sm)
-    vx = 210
-    draw.text((vx, sy), val, fill=TEXT, font=font_sm)
-
-vy2 = yb + 20 + len(stats_b) * 15 + 4
-draw.line([(36, vy2 - 10), (36, vy2 + 6)], fill=DIM)
-draw.text((36, vy2 + 2), "└►", fill=ACCENT, font=font_sm)
-draw.text((58, vy2), "VERDICT:", fill=ACCENT, font=font_md)
-draw.text((140, vy2), "install now, thank yourself", fill=LABEL_B, font=font_md)
-draw.text((140, vy2 + 14), "in 6 months", fill=LABEL_B, font=font_md)
-
-# ============================================================
-# DIVIDER
-# ============================================================
-d2y = vy2 + 32
-draw_divider(d2y)
-
-# ============================================================
-# CLASS C: THE TOURIST — DON'T USE
-# ============================================================
-yc = d2y + 10
-
-draw.text((30, yc), "[C]", fill=LABEL_C, font=font_md)
-draw.rectangle([56, yc + 1, 60, yc + 11], fill=LABEL_C)
-draw.text((62, yc), "THE YOUNG BLOKE", fill=LABEL_C, font=font_md)
-
-tag_x = 62 + int(draw.textlength("THE YOUNG BLOKE", font=font_md)) + 8
-draw_tag(tag_x, yc, "DON'T USE", TAG_DONT_BG, TAG_DONT_FG)
-
-stats_c = [
-    ("Age", "< 25"),
-    ("Got children", "lol no"),
-    ("Body status", "runs 5km at dawn"),
-]
-for i, (key, val) in enumerate(stats_c):
-    sy = yc + 20 + i * 15
-    draw.line([(36, yc + 16), (36, sy + 6)], fill=DIM)
-    draw.line([(36, sy + 6), (42, sy + 6)], fill=DIM)
-    draw.text((46, sy), key, fill=DIM, font=font_sm)
-    vx = 210
-    draw.text((vx, sy), val, fill=TEXT, font=font_sm)
-
-vy3 = yc + 20 + len(stats_c) * 15 + 4
-draw.line([(36, vy3 - 10), (36, vy3 + 6)], fill=DIM)
-draw.text((36, vy3 + 2), "└►", fill=ACCENT, font=font_sm)
-draw.text((58, vy3), "VERDICT:", fill=ACCENT, font=font_md)
-draw.text((140, vy3), "why are you even here?", fill=LABEL_C, font=font_md)
-
-# ============================================================
-# BOTTOM CONTROLS
-# ============================================================
-ctrl_y = H - 24
-ctrl_text = "▲▼ to select    ENTER to continue"
-cw = draw.textlength(ctrl_text, font=font_sm)
-draw.text(((W - cw) // 2, ctrl_y), ctrl_text, fill=DIM, font=font_sm)
-
-# ============================================================
+def draw_class(c, theme, locale, index, cls, y, value_x, verdict_x):
+    """Draw one class block (header, tag, stat tree, verdict). Returns the y after it."""
+    color = theme["labels"][index % len(theme["labels"])]
+    tag = theme["tags"][cls["tag"]]
+
+    if index == 0:
+        draw_selector(c, theme, 16, y + 8)
+    c.text(30, y, f"[{chr(ord('A') + index)}]", color, "md")
+    c.fill(56, y + 1, 60, y + 11, color)
+    c.text(62, y, cls["name"], color, "md")
+
+    tag_x = 62 + int(c.textlength(cls["name"], "md")) + 8
+    draw_tag(c, tag_x, y, locale["tags"][cls["tag"]], tag["bg"], tag["fg"])
+
+    for i, (key, val) in enumerate(zip(locale["stats"], cls["values"])):
+        sy = y + 20 + i * 15
+        c.line((36, y + 16), (36, sy + 6), theme["dim"])
+        c.line((36, sy + 6), (42, sy + 6), theme["dim"])
+        c.text(46, sy, key, theme["dim"], "sm")
+        c.text(value_x, sy, val, theme["text"], "sm")
+
+    vy = y + 20 + len(locale["stats"]) * 15 + 4
+    c.line((36, vy - 10), (36, vy + 6), theme["dim"])
+    c.text(36, vy + 2, "└►", theme["accent"], "sm")
+    c.text(58, vy, locale["verdict"], theme["accent"], "md")
+    for i, line in enumerate(cls["verdict"]):
+        c.text(verdict_x, vy + i * 14, line, color, "md")
+    return vy + 12 + 10 * len(cls["verdict"])
+
+
+def resolve_theme(raw):
+    theme = {k: hex_color(v) for k, v in raw.items() if isinstance(v, str)}
+    theme["labels"] = [hex_color(v) for v in raw["labels"]]
+    theme["tags"] = {k: {"bg": hex_color(v["bg"]), "fg": hex_color(v["fg"])} for k, v in raw["tags"].items()}
+    return theme
+
+
+def render(data, locale="en", theme="retro", scale=1):
+    """Render one variant of the class select menu at the given scale."""
+    w, h = data["size"]
+    loc = data["locales"][locale]
+    th = resolve_theme(data["themes"][theme])
+    font = font_path(loc.get("font", data["font"]))
+    c = Canvas(w, h, scale, th["bg"], font, data["font_sizes"])
+
+    # Columns grow if a locale's labels don't fit the default layout
+    value_x = max(210, 46 + max(int(c.textlength(k, "sm")) for k in loc["stats"]) + 12)
+    verdict_x = max(140, 58 + int(c.textlength(loc["verdict"], "md")) + 12)
+
+    # ============================================================
+    # MAIN BORDER
+    # ============================================================
+    draw_border(c, th, 6, 6, w - 12, h - 12)
+
+    # ============================================================
+    # TITLE
+    # ============================================================
+    tw = c.textlength(loc["title"], "title")
+    tx = int((w - tw) // 2)
+    c.text(tx, 16, loc["title"], th["title"], "title")
+    draw_star(c, int(tx - 12), 24, th["title"])
+    draw_star(c, int(tx + tw + 12), 24, th["title"])
+    c.line((20, 36), (w - 20, 36), th["border"])
+
+    # ============================================================
+    # CLASSES
+    # ============================================================
+    y = 46
+    for i, cls in enumerate(loc["classes"]):
+        end = draw_class(c, th, loc, i, cls, y, value_x, verdict_x)
+        if i < len(loc["classes"]) - 1:
+            draw_divider(c, th, end)
+        y = end + 10
+
+    # ============================================================
+    # BOTTOM CONTROLS
+    # ============================================================
+    cw = c.textlength(loc["controls"], "sm")
+    c.text(int((w - cw) // 2), h - 24, loc["controls"], th["dim"], "sm")
+
+    return c.img
+
+
+# =========================================================================
 # OUTPUT
-# ============================================================
-scaled = img.resize((W * SCALE, H * SCALE), Image.NEAREST)
-out_path = "assets/class_select.png"
-scaled.save(out_path)
-print(f"Generated {out_path} ({W * SCALE}x{H * SCALE})")
+# =========================================================================
+
+def variant_path(variant):
+    """Output path for a variant: its explicit "out" or a name derived from it."""
+    if variant.get("out"):
+        return os.path.join(ROOT, variant["out"])
+    name = f"class_select_{variant['locale']}_{variant['theme']}_{variant['scale']}x.png"
+    return os.path.join(variant.get("out_dir") or os.path.join(ROOT, "assets"), name)
+
+
+def render_variants(data, variants):
+    """Render and save each variant, sharing glyph atlases. Returns written paths."""
+    paths = []
+    for v in variants:
+        img = render(data, v["locale"], v["theme"], v["scale"])
+        path = variant_path(v)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        img.save(path)
+        print(f"Generated {os.path.relpath(path, ROOT)} ({img.width}x{img.height})")
+        paths.append(path)
+    return paths
+
+
+def main():
+    data = load_data()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--locale", nargs="+", help=f"locales ({', '.join(data['locales'])})")
+    parser.add_argument("--theme", nargs="+", help=f"themes ({', '.join(data['themes'])})")
+    parser.add_argument("--scale", nargs="+", type=int, help="output scales")
+    parser.add_argument("--out-dir", help="directory for ad-hoc variants (default: assets/)")
+    args = parser.parse_args()
+
+    if args.locale or args.theme or args.scale:
+        variants = [
+            {"locale": loc, "theme": theme, "scale": scale, "out_dir": args.out_dir}
+            for loc in args.locale or [data["variants"][0]["locale"]]
+            for theme in args.theme or [data["variants"][0]["theme"]]
+            for scale in args.scale or [data["variants"][0]["scale"]]
+        ]
+    else:
+        variants = data["variants"]
+    render_variants(data, variants)
+
+
+if __name__ == "__main__":
+    main()
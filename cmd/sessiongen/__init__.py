@@ -0,0 +1,7 @@
+"""Synthetic Claude Code sessions for exercising the watcher.
+
+Run from the cmd/ directory:
+
+    python -m sessiongen write session.jsonl --turns 500   # one-shot file
+    python -m sessiongen live --project ~/code/demo        # append in real time
+"""
@@ -0,0 +1,95 @@
+"""Command line entry point: python -m sessiongen <command>."""
+import argparse
+import os
+import sys
+import time
+
+from .generator import SessionGenerator, encode
+
+
+def project_file(project, session_id):
+    """Where Claude Code keeps a project's conversation, as watcher.go finds it."""
+    encoded = os.path.abspath(project).replace("/", "-")
+    directory = os.path.join(os.path.expanduser("~"), ".claude", "projects", encoded)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, session_id + ".jsonl")
+
+
+def make_generator(args):
+    return SessionGenerator(seed=args.seed, large_result=args.large_result, error_rate=args.error_rate)
+
+
+def cmd_write(args):
+    gen = make_generator(args)
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    count = size = 0
+    try:
+        for line in gen.lines(args.turns):
+            data = encode(line)
+            out.write(data)
+            count += 1
+            size += len(data.encode("utf-8"))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{count} lines, {size / 1024 / 1024:.1f} MiB", file=sys.stderr)
+    return 0
+
+
+def cmd_live(args):
+    gen = make_generator(args)
+    path = args.out or project_file(args.project, gen.session_id)
+    interval = 1 / args.rate if args.rate > 0 else 0
+    print(f"Appending to {path} at {args.rate:g} lines/s (Ctrl-C to stop)", file=sys.stderr)
+
+    count = 0
+    try:
+        with open(path, "ab") as f:
+            for line in gen.lines(args.turns or None):
+                data = encode(line).encode("utf-8")
+                if args.split and gen.rng.random() < 0.5:
+                    # Flush half a line first, like a writer caught mid-append
+                    cut = gen.rng.randrange(1, len(data))
+                    f.write(data[:cut])
+                    f.flush()
+                    time.sleep(interval / 2)
+                    data = data[cut:]
+                f.write(data)
+                f.flush()
+                count += 1
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    print(f"{count} lines written", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sessiongen", description="Synthetic Claude Code sessions.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--seed", type=int, default=1)
+    common.add_argument("--large-result", type=int, default=256 * 1024, help="size of the largest tool outputs in bytes")
+    common.add_argument("--error-rate", type=float, default=0.05, help="fraction of tool calls that fail")
+
+    p = sub.add_parser("write", parents=[common], help="write a whole session to a file")
+    p.add_argument("out", help="output .jsonl path, or - for stdout")
+    p.add_argument("-n", "--turns", type=int, default=200, help="user prompts to generate")
+    p.set_defaults(func=cmd_write)
+
+    p = sub.add_parser("live", parents=[common], help="append a session in real time")
+    target = p.add_mutually_exclusive_group(required=True)
+    target.add_argument("--out", help="file to append to")
+    target.add_argument("--project", help="append to a new conversation of this project directory")
+    p.add_argument("-r", "--rate", type=float, default=20, help="lines per second (0: as fast as possible)")
+    p.add_argument("-n", "--turns", type=int, default=0, help="stop after this many prompts (0: run forever)")
+    p.add_argument("--split", action="store_true", help="sometimes flush lines in two writes")
+    p.set_defaults(func=cmd_live)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""Generate conversation JSONL in the shapes watcher.go parses.
+
+Every line carries the envelope Claude Code writes (uuids, cwd, session id,
+timestamps), and tool results are duplicated into toolUseResult the way the
+real logs do, so line sizes and key order are realistic. Turns are drawn from
+a weighted mix of scenarios: tool streaks, plan mode, Task subagents, todo
+updates, git pushes, plain chat and compaction, with permission-mode changes
+and the occasional tool error. Output is fully determined by the seed.
+"""
+import json
+import random
+import uuid
+from datetime import datetime, timedelta
+
+VERSION = "2.0.14"
+MODEL = "claude-sonnet-4-5"
+
+# Scenario weights for SessionGenerator.turn()
+SCENARIOS = {
+    "streak": 10,
+    "plan": 2,
+    "agents": 3,
+    "todo": 2,
+    "push": 1,
+    "chat": 3,
+    "compact": 1,
+}
+
+PERMISSION_MODES = ("default", "acceptEdits", "bypassPermissions", "plan")
+
+PROMPTS = [
+    "fix the failing test in the parser",
+    "add a --verbose flag to the cli",
+    "why is the build slow? think hard about it",
+    "refactor the config loader to use the new schema",
+    "write docs for the exporter",
+    "ultrathink: redesign the cache eviction",
+    "bump the dependency and make sure nothing breaks",
+    "can you clean up the logging",
+]
+
+FILES = [
+    "main.go", "watcher.go", "renderer.go", "config.go", "internal/cache/lru.go",
+    "cmd/tool/main.py", "README.md", "docs/design.md", "pkg/api/handler.go",
+]
+
+AGENT_TYPES = ("Explore", "general-purpose", "Plan", "code-reviewer")
+
+# Source text for tool outputs: quotes, backslashes, tabs and non-ASCII make
+# sure consumers hit the escaped-string paths
+_OUTPUT_LINES = [
+    'func (w *Watcher) parseLine(line []byte) []Event {',
+    '\tif err := json.Unmarshal(data, &msg); err != nil { return "bad \\"quote\\"" }',
+    '    path = "C:\\\\Users\\\\dev\\\\project"  # windows path',
+    'PASS ok  \tclaude-gym/internal\t0.042s',
+    'résumé café naïve — “smart quotes” ✓',
+    '{"nested": {"json": [1, 2, 3], "escaped": "a\\nb"}}',
+    '',
+]
+
+
+class SessionGenerator:
+    """Produces one conversation as a sequence of JSON-ready dicts."""
+
+    def __init__(self, seed=0, cwd="/home/dev/project", large_result=256 * 1024, error_rate=0.05):
+        self.rng = random.Random(seed)
+        self.cwd = cwd
+        self.large_result = large_result
+        self.error_rate = error_rate
+        self.session_id = self._uuid()
+        self.parent = None
+        self.clock = datetime(2025, 1, 6, 9, 0, 0)
+        self.mode = "default"
+        self.context = 18000
+        self._text = self._output_block(max(large_result, 4096))
+
+    def _uuid(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _tool_id(self):
+        return "toolu_" + "".join(self.rng.choice("0123456789abcdefABCDEF") for _ in range(24))
+
+    def _output_block(self, size):
+        lines = []
+        total = 0
+        while total < size:
+            line = self.rng.choice(_OUTPUT_LINES)
+            lines.append(line)
+            total += len(line) + 1
+        return "\n".join(lines)
+
+    def _output(self, size):
+        start = self.rng.randrange(0, max(1, len(self._text) - size))
+        return self._text[start:start + size]
+
+    def _envelope(self, kind, **fields):
+        self.clock += timedelta(milliseconds=self.rng.randint(200, 9000))
+        line = {
+            "parentUuid": self.parent,
+            "isSidechain": False,
+            "userType": "external",
+            "cwd": self.cwd,
+            "sessionId": self.session_id,
+            "version": VERSION,
+            "gitBranch": "main",
+            "type": kind,
+        }
+        line.update(fields)
+        line["uuid"] = self._uuid()
+        line["timestamp"] = self.clock.strftime("%Y-%m-%dT%H:%M:%S.") + f"{self.clock.microsecond // 1000:03d}Z"
+        self.parent = line["uuid"]
+        return line
+
+    def _usage(self):
+        self.context += self.rng.randint(200, 4000)
+        return {
+            "input_tokens": self.rng.randint(1, 12),
+            "cache_creation_input_tokens": self.rng.randint(0, 3000),
+            "cache_read_input_tokens": self.context,
+            "output_tokens": self.rng.randint(20, 900),
+            "service_tier": "standard",
+        }
+
+    def _assistant(self, content):
+        return self._envelope("assistant", message={
+            "model": MODEL,
+            "id": "msg_" + self._uuid().replace("-", "")[:24],
+            "type": "message",
+            "role": "assistant",
+            "content": content,
+            "stop_reason": None,
+            "stop_sequence": None,
+            "usage": self._usage(),
+        }, requestId="req_" + self._uuid().replace("-", "")[:24])
+
+    def prompt(self, text, mode=None):
+        if mode:
+            self.mode = mode
+        return [self._envelope("user", message={"role": "user", "content": text}, permissionMode=self.mode)]
+
+    def tool_call(self, name, tool_input, result, is_error=False):
+        """Assistant tool_use followed by its user tool_result."""
+        tool_id = self._tool_id()
+        use = self._assistant([{"type": "tool_use", "id": tool_id, "name": name, "input": tool_input}])
+        return [use, self.tool_result(tool_id, result, is_error)]
+
+    def tool_result(self, tool_id, result, is_error=False):
+        item = {"tool_use_id": tool_id, "type": "tool_result", "content": result}
+        if is_error:
+            item["is_error"] = True
+        return self._envelope(
+            "user",
+            message={"role": "user", "content": [item]},
+            toolUseResult={"stdout": result, "stderr": "", "interrupted": False, "isImage": False},
+        )
+
+    def _result_size(self):
+        # Mostly small outputs with a long tail of huge file reads and logs
+        r = self.rng.random()
+        if r < 0.05:
+            return self.large_result
+        if r < 0.25:
+            return self.rng.randint(4096, max(4096, self.large_result // 8))
+        return self.rng.randint(40, 2000)
+
+    def _random_tool(self):
+        path = f"{self.cwd}/{self.rng.choice(FILES)}"
+        error = self.rng.random() < self.error_rate
+        name, tool_input = self.rng.choice([
+            ("Read", {"file_path": path}),
+            ("Grep", {"pattern": "func .*Event", "path": self.cwd}),
+            ("Glob", {"pattern": "**/*.go"}),
+            ("Edit", {"file_path": path, "old_string": "foo()", "new_string": "bar()"}),
+            ("Write", {"file_path": path, "content": self._output(self.rng.randint(200, 6000))}),
+            ("Bash", {"command": "go test ./...", "description": "Run tests"}),
+            ("WebFetch", {"url": "https://example.com/docs", "prompt": "summarize"}),
+        ])
+        if error:
+            result = "<tool_use_error>File has not been read yet. Read it first before writing to it.</tool_use_error>"
+        else:
+            result = self._output(self._result_size())
+        return self.tool_call(name, tool_input, result, is_error=error)
+
+    def _thinking(self):
+        text = " ".join(self.rng.choice(PROMPTS) for _ in range(self.rng.randint(2, 40)))
+        return self._assistant([{"type": "thinking", "thinking": text, "signature": "sig" + self._uuid()}])
+
+    def _finish(self):
+        return [
+            self._assistant([{"type": "text", "text": "Done. " + self.rng.choice(PROMPTS).capitalize() + " is handled."}]),
+            self._envelope("system", subtype="stop_hook_summary", hookCount=0, hookInfos=[], level="suggestion"),
+        ]
+
+    def _snapshot(self):
+        return {
+            "type": "file-history-snapshot",
+            "messageId": self._uuid(),
+            "snapshot": {"trackedFileBackups": {f: {"version": 1} for f in FILES[:4]}},
+            "isSnapshotUpdate": False,
+        }
+
+    def turn(self):
+        """One user prompt and everything Claude does in response."""
+        scenario = self.rng.choices(list(SCENARIOS), weights=list(SCENARIOS.values()))[0]
+        mode = self.rng.choice(PERMISSION_MODES[:3]) if self.rng.random() < 0.15 else None
+        lines = [self._snapshot()] + self.prompt(self.rng.choice(PROMPTS), mode)
+
+        if self.rng.random() < 0.5:
+            lines.append(self._thinking())
+
+        if scenario == "streak":
+            for _ in range(self.rng.randint(3, 12)):
+                lines += self._random_tool()
+
+        elif scenario == "plan":
+            lines += self.tool_call("EnterPlanMode", {}, "Entered plan mode.")
+            for _ in range(self.rng.randint(2, 6)):
+                lines += self._random_tool()
+            if self.rng.random() < 0.7:
+                lines += self.tool_call("ExitPlanMode", {"plan": "1. Do it\n2. Test it"}, "User has approved your plan.")
+                self.mode = "acceptEdits"
+                for _ in range(self.rng.randint(2, 6)):
+                    lines += self._random_tool()
+            else:
+                lines += self.tool_call("ExitPlanMode", {"plan": "1. Do it"}, "User rejected the plan.", is_error=True)
+
+        elif scenario == "agents":
+            uses = []
+            for _ in range(self.rng.randint(1, 4)):
+                uses.append({
+                    "type": "tool_use",
+                    "id": self._tool_id(),
+                    "name": "Task",
+                    "input": {
+                        "description": "Investigate " + self.rng.choice(FILES),
+                        "subagent_type": self.rng.choice(AGENT_TYPES),
+                        "prompt": self.rng.choice(PROMPTS),
+                    },
+                })
+            lines.append(self._assistant(uses))
+            for use in self.rng.sample(uses, len(uses)):
+                lines.append(self.tool_result(use["id"], self._output(self._result_size())))
+
+        elif scenario == "todo":
+            todos = [
+                {"content": p, "status": self.rng.choice(("pending", "in_progress", "completed")), "activeForm": p}
+                for p in self.rng.sample(PROMPTS, 4)
+            ]
+            lines += self.tool_call("TodoWrite", {"todos": todos}, "Todos have been modified successfully.")
+            for _ in range(self.rng.randint(1, 4)):
+                lines += self._random_tool()
+
+        elif scenario == "push":
+            lines += self._random_tool()
+            lines += self.tool_call("Bash", {"command": "git push origin main"}, "To github.com:dev/project.git\n   a1b2c3d..e4f5a6b  main -> main")
+
+        elif scenario == "compact":
+            lines.append(self._envelope(
+                "system",
+                subtype="compact_boundary",
+                content="Conversation compacted",
+                compactMetadata={"trigger": "auto", "preTokens": self.context},
+            ))
+            lines.append({"type": "summary", "summary": "Refactoring the watcher and fixing tests", "leafUuid": self.parent})
+            self.context = 18000
+
+        lines += self._finish()
+        return lines
+
+    def lines(self, turns=None):
+        """Yield line dicts for the given number of turns (None: forever)."""
+        n = 0
+        while turns is None or n < turns:
+            yield from self.turn()
+            n += 1
+
+
+def encode(line):
+    """Serialize a line the way Claude Code does: compact, UTF-8, one per row."""
+    return json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n"
@@ -11,6 +11,15 @@ type Config struct {
 	Scale      int  `json:"scale"`
 	Fullscreen bool `json:"fullscreen"`
 	Debug      bool `json:"debug"`
+
+	// PosePlayback assembles rigged exercises from exercise_poses.json at
+	// runtime, interpolating between frames, instead of sampling the sheet
+	PosePlayback bool `json:"pose_playback"`
+
+	// SpriteScale picks the exercise sheet rendered natively at 2x (built
+	// and bundled by `python -m devsprite build`); 0 or 1 is the 1x sheet.
+	// Frames are drawn at 2x, so higher values fall back to 2
+	SpriteScale int `json:"sprite_scale"`
 }
 
 // DefaultConfig returns a config with sensible defaults
@@ -22,14 +31,19 @@ func DefaultConfig() *Config {
 	}
 }
 
-// LoadConfig loads configuration from a JSON file
+// LoadConfig loads configuration from a JSON file, falling back to the
+// config.json embedded in the binary
 func LoadConfig(path string) *Config {
 	config := DefaultConfig()
 
 	data, err := os.ReadFile(path)
 	if err != nil {
-		// File doesn't exist, use defaults
-		return config
+		embedded, ok := bundledAsset("config.json")
+		if !ok {
+			// File doesn't exist, use defaults
+			return config
+		}
+		data = embedded
 	}
 
 	if err := json.Unmarshal(data, config); err != nil {
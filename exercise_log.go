@@ -1,11 +1,13 @@
 package main
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"os"
 	"path/filepath"
 	"sort"
+	"strings"
 	"time"
 )
 
@@ -24,95 +26,252 @@ type TypeSummary struct {
 	TotalDuration float32
 }
 
-// ExerciseLog manages persistent exercise history
+// ExerciseLog manages persistent exercise history. On disk it is JSONL, one
+// LogEntry per line, so saving only appends the new entries. The per-type and
+// per-day aggregates the log screens draw are kept up to date on every append
+// and sorted lazily, so reading them doesn't depend on the history length.
 type ExerciseLog struct {
 	Version  int        `json:"version"`
 	Entries  []LogEntry `json:"entries"`
 	filePath string
+	pending  int // Entries not yet appended to disk (the last pending ones)
+
+	byType map[string]*TypeSummary
+	byDay  map[string]*DayBucket
+
+	// Sorted views, rebuilt on first use after a change
+	typeSorted  []TypeSummary
+	daySorted   []DayBucket
+	todaySorted []TypeSummary
+	todayKey    string
 }
 
 // logFilePath returns the platform-standard path for the exercise log:
-//   macOS:  ~/Library/Application Support/claude-gym/exercise-log.json
-//   Linux:  ~/.config/claude-gym/exercise-log.json
+//   macOS:  ~/Library/Application Support/claude-gym/exercise-log.jsonl
+//   Linux:  ~/.config/claude-gym/exercise-log.jsonl
 func logFilePath() string {
 	configDir, err := os.UserConfigDir()
 	if err != nil {
 		home, err := os.UserHomeDir()
 		if err != nil {
-			return "claude-gym-log.json"
+			return "claude-gym-log.jsonl"
 		}
-		return filepath.Join(home, ".claude-gym", "exercise-log.json")
+		return filepath.Join(home, ".claude-gym", "exercise-log.jsonl")
 	}
-	return filepath.Join(configDir, "claude-gym", "exercise-log.json")
+	return filepath.Join(configDir, "claude-gym", "exercise-log.jsonl")
+}
+
+// legacyLogPath is where versions before the JSONL log kept the whole history
+// as one JSON document
+func legacyLogPath(path string) string {
+	return strings.TrimSuffix(path, ".jsonl") + ".json"
 }
 
-// LoadExerciseLog reads the log from disk, returning an empty log on error
+// LoadExerciseLog reads the log from disk, returning an empty log on error.
+// A legacy JSON log is migrated, and a log with unreadable lines (an append
+// cut short by a crash) is compacted so only valid entries remain.
 func LoadExerciseLog() *ExerciseLog {
 	path := logFilePath()
 	log := &ExerciseLog{
 		Version:  1,
 		filePath: path,
 	}
+	defer log.rebuildAggregates()
 
 	data, err := os.ReadFile(path)
 	if err != nil {
+		log.migrateLegacy()
 		return log
 	}
 
-	if err := json.Unmarshal(data, log); err != nil {
-		fmt.Fprintf(os.Stderr, "Warning: corrupt exercise log, starting fresh\n")
-		log.Entries = nil
+	bad := 0
+	for len(data) > 0 {
+		line := data
+		if i := bytes.IndexByte(data, '\n'); i >= 0 {
+			line, data = data[:i], data[i+1:]
+		} else {
+			data = nil
+		}
+		if len(bytes.TrimSpace(line)) == 0 {
+			continue
+		}
+		var e LogEntry
+		if err := json.Unmarshal(line, &e); err != nil {
+			bad++
+			continue
+		}
+		log.Entries = append(log.Entries, e)
+	}
+	if bad > 0 {
+		fmt.Fprintf(os.Stderr, "Warning: skipped %d corrupt exercise log lines\n", bad)
+		if err := log.compact(); err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: couldn't compact exercise log: %v\n", err)
+		}
 	}
-	log.filePath = path
 	return log
 }
 
-// Save writes the log to disk
+// migrateLegacy imports a legacy JSON log and rewrites it as JSONL, keeping
+// the old file as a .bak
+func (l *ExerciseLog) migrateLegacy() {
+	legacy := legacyLogPath(l.filePath)
+	data, err := os.ReadFile(legacy)
+	if err != nil {
+		return
+	}
+	var old ExerciseLog
+	if err := json.Unmarshal(data, &old); err != nil {
+		fmt.Fprintf(os.Stderr, "Warning: corrupt exercise log, starting fresh\n")
+		return
+	}
+	l.Entries = old.Entries
+	if err := l.compact(); err != nil {
+		fmt.Fprintf(os.Stderr, "Warning: couldn't migrate exercise log: %v\n", err)
+		return
+	}
+	os.Rename(legacy, legacy+".bak")
+}
+
+// Save appends entries added since the last save. The new lines go out in a
+// single O_APPEND write, so a crash leaves at most one torn line, which the
+// next load drops.
 func (l *ExerciseLog) Save() error {
-	dir := filepath.Dir(l.filePath)
-	if err := os.MkdirAll(dir, 0755); err != nil {
+	if l.pending == 0 {
+		return nil
+	}
+	if err := os.MkdirAll(filepath.Dir(l.filePath), 0755); err != nil {
 		return err
 	}
-	data, err := json.MarshalIndent(l, "", "  ")
+
+	var buf bytes.Buffer
+	enc := json.NewEncoder(&buf)
+	for _, e := range l.Entries[len(l.Entries)-l.pending:] {
+		if err := enc.Encode(e); err != nil {
+			return err
+		}
+	}
+
+	f, err := os.OpenFile(l.filePath, os.O_WRONLY|os.O_APPEND|os.O_CREATE, 0644)
 	if err != nil {
 		return err
 	}
-	return os.WriteFile(l.filePath, data, 0644)
+	if _, err := f.Write(buf.Bytes()); err != nil {
+		f.Close()
+		return err
+	}
+	if err := f.Close(); err != nil {
+		return err
+	}
+	l.pending = 0
+	return nil
+}
+
+// compact rewrites the whole log from memory, atomically via a rename
+func (l *ExerciseLog) compact() error {
+	if err := os.MkdirAll(filepath.Dir(l.filePath), 0755); err != nil {
+		return err
+	}
+	var buf bytes.Buffer
+	enc := json.NewEncoder(&buf)
+	for _, e := range l.Entries {
+		if err := enc.Encode(e); err != nil {
+			return err
+		}
+	}
+	tmp := l.filePath + ".tmp"
+	if err := os.WriteFile(tmp, buf.Bytes(), 0644); err != nil {
+		return err
+	}
+	if err := os.Rename(tmp, l.filePath); err != nil {
+		return err
+	}
+	l.pending = 0
+	return nil
 }
 
 // AddEntries appends completed exercises with current timestamp
 func (l *ExerciseLog) AddEntries(exercises []CompletedExercise) {
 	now := time.Now()
 	for _, ex := range exercises {
-		l.Entries = append(l.Entries, LogEntry{
+		e := LogEntry{
 			Name:        ex.Name,
 			Reps:        ex.Reps,
 			Duration:    ex.Duration,
 			CompletedAt: now,
-		})
+		}
+		l.Entries = append(l.Entries, e)
+		l.pending++
+		l.aggregate(e)
 	}
 }
 
 // Clear empties the log and saves
 func (l *ExerciseLog) Clear() error {
 	l.Entries = nil
-	return l.Save()
+	l.rebuildAggregates()
+	return l.compact()
 }
 
-// TodayEntries returns entries from today (local time)
-func (l *ExerciseLog) TodayEntries() []LogEntry {
-	now := time.Now()
-	year, month, day := now.Date()
-	loc := now.Location()
-	startOfDay := time.Date(year, month, day, 0, 0, 0, 0, loc)
-
-	var result []LogEntry
+// rebuildAggregates recomputes the aggregates from scratch (load and clear)
+func (l *ExerciseLog) rebuildAggregates() {
+	l.byType = make(map[string]*TypeSummary)
+	l.byDay = make(map[string]*DayBucket)
 	for _, e := range l.Entries {
-		if e.CompletedAt.In(loc).After(startOfDay) || e.CompletedAt.In(loc).Equal(startOfDay) {
-			result = append(result, e)
-		}
+		l.aggregate(e)
 	}
-	return result
+	l.invalidate()
+}
+
+// aggregate folds one entry into the per-type and per-day totals
+func (l *ExerciseLog) aggregate(e LogEntry) {
+	if l.byType == nil {
+		l.byType = make(map[string]*TypeSummary)
+		l.byDay = make(map[string]*DayBucket)
+	}
+
+	ts, ok := l.byType[e.Name]
+	if !ok {
+		ts = &TypeSummary{Name: e.Name}
+		l.byType[e.Name] = ts
+	}
+	ts.Count++
+	ts.TotalDuration += e.Duration
+
+	day := startOfDay(e.CompletedAt)
+	key := day.Format("2006-01-02")
+	b, ok := l.byDay[key]
+	if !ok {
+		b = &DayBucket{Date: day}
+		l.byDay[key] = b
+	}
+	b.Count++
+	b.TotalDuration += e.Duration
+
+	l.invalidate()
+}
+
+func (l *ExerciseLog) invalidate() {
+	l.typeSorted = nil
+	l.daySorted = nil
+	l.todaySorted = nil
+	l.todayKey = ""
+}
+
+// startOfDay returns local midnight of the day t falls on
+func startOfDay(t time.Time) time.Time {
+	local := t.In(time.Now().Location())
+	return time.Date(local.Year(), local.Month(), local.Day(), 0, 0, 0, 0, local.Location())
+}
+
+// TodayEntries returns entries from today (local time). Entries are appended
+// in time order, so only today's tail of the log is scanned.
+func (l *ExerciseLog) TodayEntries() []LogEntry {
+	today := startOfDay(time.Now())
+	i := len(l.Entries)
+	for i > 0 && !l.Entries[i-1].CompletedAt.Before(today) {
+		i--
+	}
+	return l.Entries[i:]
 }
 
 // DayBucket holds aggregated stats for one calendar day
@@ -122,42 +281,33 @@ type DayBucket struct {
 	TotalDuration float32 // seconds
 }
 
-// DailyTrend returns per-day stats sorted most recent first
+// DailyTrend returns per-day stats sorted most recent first. The slice is
+// cached until the log changes; callers must not modify it.
 func (l *ExerciseLog) DailyTrend() []DayBucket {
-	if len(l.Entries) == 0 {
+	if len(l.byDay) == 0 {
 		return nil
 	}
-
-	loc := time.Now().Location()
-	buckets := make(map[string]*DayBucket)
-
-	for _, e := range l.Entries {
-		local := e.CompletedAt.In(loc)
-		day := time.Date(local.Year(), local.Month(), local.Day(), 0, 0, 0, 0, loc)
-		key := day.Format("2006-01-02")
-		b, ok := buckets[key]
-		if !ok {
-			b = &DayBucket{Date: day}
-			buckets[key] = b
+	if l.daySorted == nil {
+		l.daySorted = make([]DayBucket, 0, len(l.byDay))
+		for _, b := range l.byDay {
+			l.daySorted = append(l.daySorted, *b)
 		}
-		b.Count++
-		b.TotalDuration += e.Duration
-	}
-
-	result := make([]DayBucket, 0, len(buckets))
-	for _, b := range buckets {
-		result = append(result, *b)
+		sort.Slice(l.daySorted, func(i, j int) bool {
+			return l.daySorted[i].Date.After(l.daySorted[j].Date)
+		})
 	}
-	sort.Slice(result, func(i, j int) bool {
-		return result[i].Date.After(result[j].Date)
-	})
-	return result
+	return l.daySorted
 }
 
-// TodayBreakdown returns per-exercise-type stats for today, sorted by total duration desc
+// TodayBreakdown returns per-exercise-type stats for today, sorted by total
+// duration desc. Cached until the log changes or the day rolls over.
 func (l *ExerciseLog) TodayBreakdown() []TypeSummary {
-	entries := l.TodayEntries()
-	return typeBreakdownFromEntries(entries)
+	key := startOfDay(time.Now()).Format("2006-01-02")
+	if l.todaySorted == nil || l.todayKey != key {
+		l.todaySorted = typeBreakdownFromEntries(l.TodayEntries())
+		l.todayKey = key
+	}
+	return l.todaySorted
 }
 
 func typeBreakdownFromEntries(entries []LogEntry) []TypeSummary {
@@ -171,7 +321,11 @@ func typeBreakdownFromEntries(entries []LogEntry) []TypeSummary {
 		ts.Count++
 		ts.TotalDuration += e.Duration
 	}
+	return sortedTypes(byName)
+}
 
+// sortedTypes flattens per-type totals, sorted by total duration desc
+func sortedTypes(byName map[string]*TypeSummary) []TypeSummary {
 	result := make([]TypeSummary, 0, len(byName))
 	for _, ts := range byName {
 		result = append(result, *ts)
@@ -182,25 +336,11 @@ func typeBreakdownFromEntries(entries []LogEntry) []TypeSummary {
 	return result
 }
 
-// TypeBreakdown returns per-exercise-type stats sorted by total duration desc
+// TypeBreakdown returns per-exercise-type stats sorted by total duration
+// desc. The slice is cached until the log changes; callers must not modify it.
 func (l *ExerciseLog) TypeBreakdown() []TypeSummary {
-	byName := make(map[string]*TypeSummary)
-	for _, e := range l.Entries {
-		ts, ok := byName[e.Name]
-		if !ok {
-			ts = &TypeSummary{Name: e.Name}
-			byName[e.Name] = ts
-		}
-		ts.Count++
-		ts.TotalDuration += e.Duration
+	if l.typeSorted == nil {
+		l.typeSorted = sortedTypes(l.byType)
 	}
-
-	result := make([]TypeSummary, 0, len(byName))
-	for _, ts := range byName {
-		result = append(result, *ts)
-	}
-	sort.Slice(result, func(i, j int) bool {
-		return result[i].TotalDuration > result[j].TotalDuration
-	})
-	return result
+	return l.typeSorted
 }
@@ -0,0 +1,179 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"reflect"
+	"strings"
+	"testing"
+	"time"
+)
+
+// tempLogPath points the exercise log at a temp dir and returns its path
+func tempLogPath(t *testing.T) string {
+	t.Helper()
+	dir := t.TempDir()
+	t.Setenv("HOME", dir)
+	t.Setenv("XDG_CONFIG_HOME", dir)
+	path := logFilePath()
+	if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+		t.Fatal(err)
+	}
+	return path
+}
+
+// logLines encodes entries as JSONL, as Save writes them
+func logLines(t *testing.T, entries ...LogEntry) string {
+	t.Helper()
+	var sb strings.Builder
+	enc := json.NewEncoder(&sb)
+	for _, e := range entries {
+		if err := enc.Encode(e); err != nil {
+			t.Fatal(err)
+		}
+	}
+	return sb.String()
+}
+
+func entryNames(entries []LogEntry) []string {
+	names := make([]string, len(entries))
+	for i, e := range entries {
+		names[i] = e.Name
+	}
+	return names
+}
+
+func TestSaveAfterTornLastLine(t *testing.T) {
+	path := tempLogPath(t)
+	at := time.Date(2026, 3, 1, 9, 0, 0, 0, time.Local)
+	data := logLines(t,
+		LogEntry{Name: "Squats", Reps: "10", Duration: 20, CompletedAt: at},
+		LogEntry{Name: "Plank", Reps: "30s", Duration: 30, CompletedAt: at},
+	) + `{"name":"Push-ups","re` // an append cut short by a crash
+	if err := os.WriteFile(path, []byte(data), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	log := LoadExerciseLog()
+	if got := entryNames(log.Entries); !reflect.DeepEqual(got, []string{"Squats", "Plank"}) {
+		t.Fatalf("loaded %v", got)
+	}
+
+	// Without compacting on load, this line would be glued to the torn one
+	log.AddEntries([]CompletedExercise{{Name: "Lunges", Reps: "8", Duration: 25}})
+	if err := log.Save(); err != nil {
+		t.Fatal(err)
+	}
+
+	reloaded := LoadExerciseLog()
+	if got := entryNames(reloaded.Entries); !reflect.DeepEqual(got, []string{"Squats", "Plank", "Lunges"}) {
+		t.Fatalf("after save, reloaded %v", got)
+	}
+	raw, err := os.ReadFile(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if strings.Contains(string(raw), "Push-ups") {
+		t.Fatalf("torn line survived:\n%s", raw)
+	}
+}
+
+func TestLoadMigratesLegacyLog(t *testing.T) {
+	path := tempLogPath(t)
+	at := time.Date(2025, 11, 20, 18, 30, 0, 0, time.Local)
+	legacy, err := json.Marshal(ExerciseLog{Version: 1, Entries: []LogEntry{
+		{Name: "Squats", Reps: "10", Duration: 20, CompletedAt: at},
+		{Name: "Wall Sit", Reps: "45s", Duration: 45, CompletedAt: at.Add(time.Minute)},
+	}})
+	if err != nil {
+		t.Fatal(err)
+	}
+	legacyPath := legacyLogPath(path)
+	if err := os.WriteFile(legacyPath, legacy, 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	log := LoadExerciseLog()
+	if got := entryNames(log.Entries); !reflect.DeepEqual(got, []string{"Squats", "Wall Sit"}) {
+		t.Fatalf("migrated %v", got)
+	}
+	if _, err := os.Stat(legacyPath); !os.IsNotExist(err) {
+		t.Fatalf("legacy log still in place (err %v)", err)
+	}
+	if _, err := os.Stat(legacyPath + ".bak"); err != nil {
+		t.Fatalf("legacy log not kept as .bak: %v", err)
+	}
+
+	// The JSONL log now stands on its own
+	reloaded := LoadExerciseLog()
+	if !reflect.DeepEqual(entryNames(reloaded.Entries), entryNames(log.Entries)) {
+		t.Fatalf("reloaded %v", entryNames(reloaded.Entries))
+	}
+	if !reloaded.Entries[1].CompletedAt.Equal(at.Add(time.Minute)) {
+		t.Fatalf("completed_at = %v", reloaded.Entries[1].CompletedAt)
+	}
+}
+
+func TestAggregatesAfterAppendAndClear(t *testing.T) {
+	path := tempLogPath(t)
+	yesterday := time.Now().AddDate(0, 0, -1)
+	if err := os.WriteFile(path, []byte(logLines(t,
+		LogEntry{Name: "Squats", Reps: "10", Duration: 20, CompletedAt: yesterday},
+	)), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	log := LoadExerciseLog()
+	if got := log.TypeBreakdown(); !reflect.DeepEqual(got, []TypeSummary{{"Squats", 1, 20}}) {
+		t.Fatalf("loaded breakdown %+v", got)
+	}
+	if got := log.DailyTrend(); len(got) != 1 || got[0].Count != 1 {
+		t.Fatalf("loaded trend %+v", got)
+	}
+
+	// Appends fold into the cached views without a reload
+	log.AddEntries([]CompletedExercise{
+		{Name: "Plank", Reps: "30s", Duration: 30},
+		{Name: "Squats", Reps: "10", Duration: 15},
+	})
+	wantTypes := []TypeSummary{{"Squats", 2, 35}, {"Plank", 1, 30}}
+	if got := log.TypeBreakdown(); !reflect.DeepEqual(got, wantTypes) {
+		t.Fatalf("breakdown after append %+v, want %+v", got, wantTypes)
+	}
+	trend := log.DailyTrend()
+	if len(trend) != 2 {
+		t.Fatalf("trend after append %+v", trend)
+	}
+	if !trend[0].Date.Equal(startOfDay(time.Now())) || trend[0].Count != 2 || trend[0].TotalDuration != 45 {
+		t.Fatalf("today's bucket %+v", trend[0])
+	}
+	if trend[1].Count != 1 || trend[1].TotalDuration != 20 {
+		t.Fatalf("yesterday's bucket %+v", trend[1])
+	}
+
+	// The incremental totals match ones rebuilt from disk
+	if err := log.Save(); err != nil {
+		t.Fatal(err)
+	}
+	reloaded := LoadExerciseLog()
+	if got := reloaded.TypeBreakdown(); !reflect.DeepEqual(got, wantTypes) {
+		t.Fatalf("reloaded breakdown %+v, want %+v", got, wantTypes)
+	}
+	if got := reloaded.DailyTrend(); !reflect.DeepEqual(got, trend) {
+		t.Fatalf("reloaded trend %+v, want %+v", got, trend)
+	}
+
+	if err := log.Clear(); err != nil {
+		t.Fatal(err)
+	}
+	if got := log.TypeBreakdown(); len(got) != 0 {
+		t.Fatalf("breakdown after clear %+v", got)
+	}
+	if got := log.DailyTrend(); got != nil {
+		t.Fatalf("trend after clear %+v", got)
+	}
+	if got := LoadExerciseLog().Entries; len(got) != 0 {
+		t.Fatalf("cleared log reloaded %d entries", len(got))
+	}
+}
@@ -2,6 +2,7 @@ package main
 
 import (
 	"encoding/json"
+	"errors"
 	"fmt"
 	"os"
 )
@@ -25,20 +26,45 @@ type CompletedExercise struct {
 	Duration float32 // seconds spent on this exercise
 }
 
+// LoadDefaultExercises loads exercises.json from next to the executable or
+// cwd, falling back to the catalog embedded in the binary. Like config.json,
+// a file on disk wins so users can edit it; one that doesn't parse is
+// reported and skipped.
+func LoadDefaultExercises() ([]ExerciseConfig, error) {
+	var err error
+	for _, path := range []string{getAssetPath("../exercises.json"), "exercises.json"} {
+		var exercises []ExerciseConfig
+		if exercises, err = LoadExercises(path); err == nil {
+			return exercises, nil
+		}
+		if !errors.Is(err, os.ErrNotExist) {
+			fmt.Fprintf(os.Stderr, "Warning: %v\n", err)
+		}
+	}
+	if data, ok := bundledAsset("exercises.json"); ok {
+		return ParseExercises(data, "embedded exercises.json")
+	}
+	return nil, err
+}
+
 // LoadExercises reads exercise configs from a JSON file
 func LoadExercises(path string) ([]ExerciseConfig, error) {
 	data, err := os.ReadFile(path)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read exercises file: %w", err)
 	}
+	return ParseExercises(data, path)
+}
 
+// ParseExercises decodes exercise configs; source names them in errors
+func ParseExercises(data []byte, source string) ([]ExerciseConfig, error) {
 	var exercises []ExerciseConfig
 	if err := json.Unmarshal(data, &exercises); err != nil {
-		return nil, fmt.Errorf("failed to parse exercises: %w", err)
+		return nil, fmt.Errorf("failed to parse exercises in %s: %w", source, err)
 	}
 
 	if len(exercises) == 0 {
-		return nil, fmt.Errorf("no exercises found in %s", path)
+		return nil, fmt.Errorf("no exercises found in %s", source)
 	}
 
 	return exercises, nil
@@ -0,0 +1,98 @@
+package main
+
+import "time"
+
+const (
+	activeFPS    = 60
+	minimizedFPS = 2
+
+	// wakeLinger keeps the full frame rate for a moment after input, so what
+	// follows a key press stays smooth even if it doesn't change the mode
+	wakeLinger = 2 * time.Second
+
+	// inputPollInterval is how often a wait longer than it checks for
+	// window input, which only the main loop can poll: the most a key press
+	// waits while idle or minimized. Full-rate frames are shorter and poll
+	// in EndDrawing only.
+	inputPollInterval = 50 * time.Millisecond
+)
+
+// FramePacer paces the main loop in place of rl.SetTargetFPS. While Claude is
+// working or the UI is animating it runs at activeFPS. Otherwise nothing on
+// screen changes faster than the sprite animation, so it drops to that
+// cadence, and to minimizedFPS while the window is minimized. Between frames
+// it sleeps on the watcher's event channel rather than in raylib, so a new
+// event wakes it straight away, and checks for window input every
+// inputPollInterval so a key press doesn't wait out a slow frame.
+type FramePacer struct {
+	idleInterval time.Duration
+	last         time.Time // Start of the current frame
+	awakeUntil   time.Time
+}
+
+// NewFramePacer creates a pacer whose idle frame interval is the sprite frame
+// duration in seconds
+func NewFramePacer(idleFrame float32) *FramePacer {
+	return &FramePacer{
+		idleInterval: time.Duration(float64(idleFrame) * float64(time.Second)),
+	}
+}
+
+// Tick starts a frame and returns the seconds since the previous one
+func (p *FramePacer) Tick() float32 {
+	now := time.Now()
+	if p.last.IsZero() {
+		p.last = now
+		return 1.0 / activeFPS
+	}
+	dt := now.Sub(p.last).Seconds()
+	p.last = now
+	return float32(dt)
+}
+
+// Wake holds the full frame rate for wakeLinger
+func (p *FramePacer) Wake() {
+	p.awakeUntil = time.Now().Add(wakeLinger)
+}
+
+// interval returns how long the current frame should last
+func (p *FramePacer) interval(busy, minimized bool) time.Duration {
+	switch {
+	case minimized && !busy:
+		return time.Second / minimizedFPS
+	case busy || time.Now().Before(p.awakeUntil):
+		return time.Second / activeFPS
+	default:
+		return p.idleInterval
+	}
+}
+
+// Wait sleeps until the next frame is due, an event arrives or input reports
+// window input, whichever comes first. busy is true while Claude is active or
+// the UI is animating; input (may be nil) polls the window and is called
+// every inputPollInterval of the wait, never at its end. Returns the event
+// that cut the wait short, if any, for the caller to handle.
+func (p *FramePacer) Wait(busy, minimized bool, events <-chan Event, input func() bool) (Event, bool) {
+	deadline := p.last.Add(p.interval(busy, minimized))
+	for {
+		remaining := time.Until(deadline)
+		if remaining <= 0 {
+			return Event{}, false
+		}
+		slice := remaining
+		if input != nil {
+			slice = min(remaining, inputPollInterval)
+		}
+
+		timer := time.NewTimer(slice)
+		select {
+		case evt := <-events:
+			timer.Stop()
+			return evt, true
+		case <-timer.C:
+		}
+		if slice < remaining && input() {
+			return Event{}, false
+		}
+	}
+}
@@ -4,7 +4,7 @@ go 1.25.4
 
 require (
 	github.com/ebitengine/purego v0.7.1 // indirect
-	github.com/fsnotify/fsnotify v1.9.0 // indirect
+	github.com/fsnotify/fsnotify v1.9.0
 	github.com/gen2brain/raylib-go/raylib v0.55.1 // indirect
 	golang.org/x/exp v0.0.0-20240506185415-9bf2ced13842 // indirect
 	golang.org/x/sys v0.20.0 // indirect
@@ -10,7 +10,6 @@ import (
 	"time"
 
 	"github.com/fsnotify/fsnotify"
-	rl "github.com/gen2brain/raylib-go/raylib"
 )
 
 // HotReloader watches asset files and triggers reloads
@@ -90,11 +89,7 @@ func (hr *HotReloader) watchLoop() {
 			}
 			debounce[event.Name] = time.Now()
 
-			// Check what kind of file changed
-			ext := strings.ToLower(filepath.Ext(event.Name))
-
-			if ext == ".png" {
-				// PNG file changed - queue for reload
+			if isReloadableAsset(event.Name) {
 				fmt.Printf("Asset changed: %s\n", event.Name)
 				hr.reloadQueue <- event.Name
 			}
@@ -108,6 +103,19 @@ func (hr *HotReloader) watchLoop() {
 	}
 }
 
+// isReloadableAsset reports whether a change to path should trigger a reload:
+// sheet images, texture blobs and sprite manifests, and the pose rig JSON.
+// The rig's parts atlas is written before its JSON (write_rig), so only the
+// JSON triggers a rig reload, once both are complete.
+func isReloadableAsset(path string) bool {
+	base := filepath.Base(path)
+	ext := strings.ToLower(filepath.Ext(base))
+	if strings.HasPrefix(base, "exercise_poses") {
+		return ext == ".json"
+	}
+	return ext == ".png" || ext == ".cgtx" || (ext == ".json" && strings.HasPrefix(base, "exercise_spritesheet"))
+}
+
 // ProcessReloads should be called from the main thread to process pending reloads
 // Returns true if any textures were reloaded
 func (hr *HotReloader) ProcessReloads() bool {
@@ -130,14 +138,23 @@ func (hr *HotReloader) reloadTexture(path string) {
 	// Normalize the path
 	path = filepath.Clean(path)
 
-	// Reload spritesheet if it matches
-	if strings.Contains(path, "spritesheet.png") {
-		if hr.renderer.spriteSheet.ID != 0 {
-			rl.UnloadTexture(hr.renderer.spriteSheet)
+	// Reload spritesheet pages (and manifest) if it matches
+	base := filepath.Base(path)
+	if strings.HasPrefix(base, "exercise_spritesheet") && !strings.HasSuffix(base, "_preview.png") {
+		if err := hr.renderer.reloadSprites(); err != nil {
+			fmt.Printf("Warning: couldn't reload spritesheet: %v\n", err)
+			return
 		}
-		hr.renderer.spriteSheet = rl.LoadTexture(path)
-		hr.renderer.hasSprites = true
 		fmt.Printf("Reloaded: spritesheet\n")
+	} else if strings.HasPrefix(base, "exercise_poses") {
+		if hr.renderer.poses == nil {
+			return // pose playback is off
+		}
+		if err := hr.renderer.reloadPoses(); err != nil {
+			fmt.Printf("Warning: couldn't reload pose rig: %v\n", err)
+			return
+		}
+		fmt.Printf("Reloaded: pose rig\n")
 	} else {
 		fmt.Printf("Unknown asset type, skipping: %s\n", path)
 	}
@@ -147,8 +164,9 @@ func (hr *HotReloader) reloadTexture(path string) {
 func (hr *HotReloader) ForceReloadAll() {
 	fmt.Println("Force reloading all textures...")
 
-	// Queue sprite sheet
-	hr.reloadQueue <- getAssetPath("developer/exercise_spritesheet.png")
+	// Queue sprite sheet and pose rig
+	hr.reloadQueue <- getAssetPath(spriteSheetAsset)
+	hr.reloadQueue <- getAssetPath(poseRigAsset)
 }
 
 // Stop stops the hot reloader
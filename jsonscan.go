@@ -0,0 +1,213 @@
+package main
+
+import (
+	"bytes"
+	"encoding/json"
+	"errors"
+)
+
+// Minimal JSON scanning for the watcher's fast path. Values are returned as
+// raw sub-slices of the input without decoding or copying; strings are
+// skipped with bytes.IndexByte, so multi-megabyte tool outputs cost a memchr
+// instead of a full json.Unmarshal. The scanner is lenient: it finds value
+// boundaries but does not validate everything json.Unmarshal would. Where a
+// line's shape matters it agrees with json.Unmarshal: escaped keys are
+// decoded, and data after an object or array makes it a syntax error
+// (watcher_parse_test.go checks both paths give the same events).
+
+var errJSONSyntax = errors.New("json scan: syntax error")
+
+func skipSpace(data []byte, i int) int {
+	for i < len(data) {
+		switch data[i] {
+		case ' ', '\t', '\n', '\r':
+			i++
+		default:
+			return i
+		}
+	}
+	return i
+}
+
+// skipString returns the index just past the string whose opening quote is
+// at data[i]
+func skipString(data []byte, i int) (int, error) {
+	start := i + 1
+	i = start
+	for {
+		j := bytes.IndexByte(data[i:], '"')
+		if j < 0 {
+			return 0, errJSONSyntax
+		}
+		i += j
+		// The quote is escaped if an odd number of backslashes precede it
+		k := i - 1
+		for k >= start && data[k] == '\\' {
+			k--
+		}
+		if (i-1-k)%2 == 0 {
+			return i + 1, nil
+		}
+		i++
+	}
+}
+
+// closeAt checks that the bracket at data[i] ends data, give or take
+// trailing whitespace
+func closeAt(data []byte, i int) error {
+	if skipSpace(data, i+1) != len(data) {
+		return errJSONSyntax
+	}
+	return nil
+}
+
+// skipValue returns the index just past the value starting at or after data[i]
+func skipValue(data []byte, i int) (int, error) {
+	i = skipSpace(data, i)
+	if i >= len(data) {
+		return 0, errJSONSyntax
+	}
+	switch data[i] {
+	case '"':
+		return skipString(data, i)
+	case '{', '[':
+		depth := 0
+		for i < len(data) {
+			switch data[i] {
+			case '"':
+				end, err := skipString(data, i)
+				if err != nil {
+					return 0, err
+				}
+				i = end
+				continue
+			case '{', '[':
+				depth++
+			case '}', ']':
+				depth--
+				if depth == 0 {
+					return i + 1, nil
+				}
+			}
+			i++
+		}
+		return 0, errJSONSyntax
+	default:
+		// Number, true, false or null
+		for i < len(data) {
+			switch data[i] {
+			case ',', '}', ']', ' ', '\t', '\n', '\r':
+				return i, nil
+			}
+			i++
+		}
+		return i, nil
+	}
+}
+
+// eachMember calls fn with the key and raw value of every member of the JSON
+// object in data, stopping early if fn returns false. Keys are raw too unless
+// they hold escapes, which are decoded.
+func eachMember(data []byte, fn func(key, value []byte) bool) error {
+	i := skipSpace(data, 0)
+	if i >= len(data) || data[i] != '{' {
+		return errJSONSyntax
+	}
+	i = skipSpace(data, i+1)
+	if i < len(data) && data[i] == '}' {
+		return closeAt(data, i)
+	}
+	for {
+		if i >= len(data) || data[i] != '"' {
+			return errJSONSyntax
+		}
+		end, err := skipString(data, i)
+		if err != nil {
+			return err
+		}
+		key := data[i+1 : end-1]
+		if bytes.IndexByte(key, '\\') >= 0 {
+			key = []byte(jsonString(data[i:end]))
+		}
+		i = skipSpace(data, end)
+		if i >= len(data) || data[i] != ':' {
+			return errJSONSyntax
+		}
+		vstart := skipSpace(data, i+1)
+		vend, err := skipValue(data, vstart)
+		if err != nil {
+			return err
+		}
+		if !fn(key, data[vstart:vend]) {
+			return nil
+		}
+		i = skipSpace(data, vend)
+		if i >= len(data) {
+			return errJSONSyntax
+		}
+		if data[i] == '}' {
+			return closeAt(data, i)
+		}
+		if data[i] != ',' {
+			return errJSONSyntax
+		}
+		i = skipSpace(data, i+1)
+	}
+}
+
+// eachElement calls fn with every raw element of the JSON array in data
+func eachElement(data []byte, fn func(value []byte)) error {
+	i := skipSpace(data, 0)
+	if i >= len(data) || data[i] != '[' {
+		return errJSONSyntax
+	}
+	i = skipSpace(data, i+1)
+	if i < len(data) && data[i] == ']' {
+		return closeAt(data, i)
+	}
+	for {
+		vstart := skipSpace(data, i)
+		vend, err := skipValue(data, vstart)
+		if err != nil {
+			return err
+		}
+		fn(data[vstart:vend])
+		i = skipSpace(data, vend)
+		if i >= len(data) {
+			return errJSONSyntax
+		}
+		if data[i] == ']' {
+			return closeAt(data, i)
+		}
+		if data[i] != ',' {
+			return errJSONSyntax
+		}
+		i++
+	}
+}
+
+// isJSONString reports whether a raw value is a string
+func isJSONString(value []byte) bool {
+	return len(value) >= 2 && value[0] == '"'
+}
+
+// jsonString decodes a raw string value; anything else yields ""
+func jsonString(value []byte) string {
+	if !isJSONString(value) {
+		return ""
+	}
+	inner := value[1 : len(value)-1]
+	if bytes.IndexByte(inner, '\\') < 0 {
+		return string(inner)
+	}
+	var s string
+	if err := json.Unmarshal(value, &s); err != nil {
+		return ""
+	}
+	return s
+}
+
+// jsonTrue reports whether a raw value is the literal true
+func jsonTrue(value []byte) bool {
+	return string(value) == "true"
+}
@@ -67,17 +67,48 @@ func printUsage() {
 Usage:
   cgym                    Watch the current directory's latest conversation
   cgym watch [dir]        Watch a specific directory's conversation
+  cgym watch <dir>...     Watch several projects in one window
+  cgym watch --all        Watch every project with Claude Code conversations
   cgym replay <file>      Replay an existing conversation JSONL file
+  cgym replay --batch <file>...
+                          Replay files headless at full speed and print a report
 
 Options:
   -s, --speed <ms>      Replay speed in milliseconds (default: 200)
+  -j, --workers <n>     Batch replay parsing goroutines (default: all CPUs)
+  --json                Print batch replay reports as JSON lines
   -h, --help            Show this help message`)
 }
 
+// runBatchReplay reports on each file and returns the process exit code
+func runBatchReplay(files []string, workers int, asJSON bool) int {
+	code := 0
+	for _, file := range files {
+		report, err := BatchReport(file, workers)
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "Error: %v\n", err)
+			code = 1
+			continue
+		}
+		if asJSON {
+			report.PrintJSON(os.Stdout)
+		} else {
+			report.Print(os.Stdout)
+		}
+	}
+	return code
+}
+
 func main() {
 	watcher := NewWatcher()
 	var err error
 
+	// What the main loop reads events from, and what to report watching;
+	// multi-project watching replaces both
+	events := watcher.Events
+	stop := watcher.Stop
+	var watching []string
+
 	args := os.Args[1:]
 
 	if len(args) == 0 {
@@ -95,9 +126,42 @@ func main() {
 			os.Exit(0)
 
 		case "watch":
+			var dirs []string
+			all := false
+			for _, arg := range args[1:] {
+				if arg == "--all" {
+					all = true
+				} else {
+					dirs = append(dirs, arg)
+				}
+			}
+
+			if all || len(dirs) > 1 {
+				// One window for several projects
+				multi := NewMultiWatcher()
+				if all {
+					err = multi.AddAllProjects()
+				}
+				for _, dir := range dirs {
+					if err == nil {
+						err = multi.AddProject(dir)
+					}
+				}
+				if err == nil {
+					err = multi.Start()
+				}
+				events = multi.Events
+				stop = multi.Stop
+				watching = multi.Files()
+				if len(watching) == 0 {
+					watching = []string{claudeProjectsRoot()}
+				}
+				break
+			}
+
 			dir := "."
-			if len(args) > 1 {
-				dir = args[1]
+			if len(dirs) > 0 {
+				dir = dirs[0]
 			}
 			err = watcher.FindProjectConversation(dir)
 			if err != nil {
@@ -107,26 +171,44 @@ func main() {
 			err = watcher.StartLive()
 
 		case "replay":
-			if len(args) < 2 {
-				fmt.Fprintln(os.Stderr, "Error: replay requires a file path")
-				printUsage()
-				os.Exit(1)
-			}
-			filePath := args[1]
+			var files []string
+			batch, asJSON, workers := false, false, 0
 
-			for i := 2; i < len(args); i++ {
-				if args[i] == "-s" || args[i] == "--speed" {
+			for i := 1; i < len(args); i++ {
+				switch args[i] {
+				case "-s", "--speed":
 					if i+1 < len(args) {
+						i++
 						var speed int
-						fmt.Sscanf(args[i+1], "%d", &speed)
+						fmt.Sscanf(args[i], "%d", &speed)
 						if speed > 0 {
 							watcher.ReplaySpeed = time.Duration(speed) * time.Millisecond
 						}
 					}
+				case "-j", "--workers":
+					if i+1 < len(args) {
+						i++
+						fmt.Sscanf(args[i], "%d", &workers)
+					}
+				case "--batch":
+					batch = true
+				case "--json":
+					asJSON = true
+				default:
+					files = append(files, args[i])
 				}
 			}
 
-			err = watcher.StartReplay(filePath)
+			if len(files) == 0 {
+				fmt.Fprintln(os.Stderr, "Error: replay requires a file path")
+				printUsage()
+				os.Exit(1)
+			}
+
+			if batch {
+				os.Exit(runBatchReplay(files, workers, asJSON))
+			}
+			err = watcher.StartReplay(files[0])
 
 		case "studio":
 			runStudio()
@@ -147,14 +229,22 @@ func main() {
 		os.Exit(1)
 	}
 
-	fmt.Printf("Watching: %s\n", watcher.FilePath)
+	// Stopping saves the last read offsets, so a restart resumes there
+	defer stop()
+
+	if watching == nil {
+		watching = []string{watcher.FilePath}
+	}
+	for _, file := range watching {
+		fmt.Printf("Watching: %s\n", file)
+	}
 
 	rl.SetConfigFlags(rl.FlagWindowResizable)
 	rl.InitWindow(screenWidth*windowScale, screenHeight*windowScale, windowTitle)
 	defer rl.CloseWindow()
 
-	rl.SetExitKey(0) // Disable Esc closing the window — we use Esc for menu navigation
-	rl.SetTargetFPS(60)
+	rl.SetExitKey(0)   // Disable Esc closing the window — we use Esc for menu navigation
+	rl.SetTargetFPS(0) // Paced by FramePacer instead
 
 	target := rl.LoadRenderTexture(screenWidth, screenHeight)
 	defer rl.UnloadRenderTexture(target)
@@ -165,17 +255,12 @@ func main() {
 	appState := NewAppState()
 
 	// Load exercises
-	exercisePath := getAssetPath("../exercises.json")
-	exercises, exErr := LoadExercises(exercisePath)
+	exercises, exErr := LoadDefaultExercises()
 	if exErr != nil {
-		// Try current directory
-		exercises, exErr = LoadExercises("exercises.json")
-		if exErr != nil {
-			fmt.Fprintf(os.Stderr, "Warning: %v (using defaults)\n", exErr)
-			exercises = []ExerciseConfig{
-				{Name: "Chair Dips", AnimRow: 3, Reps: "10 reps"},
-				{Name: "Arm Circles", AnimRow: 4, Reps: "20 forward + 20 backward"},
-			}
+		fmt.Fprintf(os.Stderr, "Warning: %v (using defaults)\n", exErr)
+		exercises = []ExerciseConfig{
+			{Name: "Chair Dips", AnimRow: 3, Reps: "10 reps"},
+			{Name: "Arm Circles", AnimRow: 4, Reps: "20 forward + 20 backward"},
 		}
 	}
 
@@ -183,22 +268,36 @@ func main() {
 	exerciseLog := LoadExerciseLog()
 	menuState.ExerciseLog = exerciseLog
 
-	for !rl.WindowShouldClose() {
-		dt := rl.GetFrameTime()
+	pacer := NewFramePacer(animations.FrameDuration())
+	var pending Event
+	hasPending := false
 
-		// Process events from watcher
-		select {
-		case event := <-watcher.Events:
-			appState.HandleEvent(event)
-			menuState.HandleEvent(event, animations)
-		default:
+	for !rl.WindowShouldClose() {
+		dt := pacer.Tick()
+
+		// Process events from watcher, starting with one that ended the last wait
+		if !hasPending {
+			select {
+			case pending = <-events:
+				hasPending = true
+			default:
+			}
+		}
+		if hasPending {
+			appState.HandleEvent(pending)
+			menuState.HandleEvent(pending, animations)
+			hasPending = false
 		}
 
 		// Handle input — menu takes priority
-		menuState.HandleInput(animations)
+		if menuState.HandleInput(animations) {
+			pacer.Wake()
+		}
 
-		// Update systems
-		animations.Update(dt)
+		// Update systems. Sprites advance at most one frame per update, so cap
+		// their step at a frame to keep slow (idle or minimized) frames from
+		// piling up time to fast-forward through later.
+		animations.Update(min(dt, animations.FrameDuration()))
 		appState.Update(dt)
 		menuState.Update(dt, animations)
 		renderer.UpdateTimer(dt)
@@ -223,5 +322,19 @@ func main() {
 		rl.DrawTexturePro(target.Texture, sourceRec, destRec, rl.Vector2{}, 0, rl.White)
 
 		rl.EndDrawing()
+
+		// Full rate only while something is moving; an event, a key press, a
+		// close request or the window being restored wakes the wait early.
+		// Input is checked before each poll too, so a press EndDrawing just
+		// polled isn't overwritten before HandleInput sees it.
+		busy := appState.IsActive || menuState.Mode != ModeIdle || menuState.CatAlert
+		minimized := rl.IsWindowMinimized()
+		pending, hasPending = pacer.Wait(busy, minimized, events, func() bool {
+			if menuKeyPressed() {
+				return true
+			}
+			rl.PollInputEvents()
+			return menuKeyPressed() || rl.WindowShouldClose() || rl.IsWindowMinimized() != minimized
+		})
 	}
 }
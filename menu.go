@@ -133,6 +133,24 @@ func (m *MenuState) HandleInput(anim *AnimationSystem) bool {
 	return false
 }
 
+// menuKeys are every key HandleInput reacts to, in any mode
+var menuKeys = []int32{
+	rl.KeyEscape, rl.KeyTab, rl.KeyEnter, rl.KeySpace,
+	rl.KeyUp, rl.KeyDown, rl.KeyLeft, rl.KeyRight,
+	rl.KeyW, rl.KeyS, rl.KeyY, rl.KeyN,
+}
+
+// menuKeyPressed reports whether a key HandleInput reacts to went down in
+// the last input poll, without consuming it
+func menuKeyPressed() bool {
+	for _, key := range menuKeys {
+		if rl.IsKeyPressed(key) {
+			return true
+		}
+	}
+	return false
+}
+
 func (m *MenuState) handleIdleInput(anim *AnimationSystem) bool {
 	if rl.IsKeyPressed(rl.KeyTab) {
 		m.PrevMode = m.Mode
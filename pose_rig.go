@@ -0,0 +1,360 @@
+package main
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"image"
+	"image/color"
+	"image/draw"
+	"image/png"
+	"math"
+	"os"
+	"path"
+	"path/filepath"
+)
+
+const (
+	poseRigAsset   = "developer/exercise_poses.json"
+	poseRigVersion = 1
+)
+
+// PoseRig holds the exercises that can be assembled at runtime instead of
+// sampled from the sprite sheet: per-joint keyframe tracks, and layers of
+// part sprites and limbs drawn from them. It is written by
+// cmd/devsprite/pose.py, and Render follows the same pixel rules, so whole
+// frames match the baked sheet exactly while in-between times give smooth
+// motion. Only one frame-sized buffer is kept, however many exercises are
+// rigged.
+type PoseRig struct {
+	Version     int             `json:"version"`
+	FrameWidth  int             `json:"frame_width"`
+	FrameHeight int             `json:"frame_height"`
+	PartsFile   string          `json:"parts_file"`
+	Parts       []PosePart      `json:"parts"`
+	Animations  []PoseAnimation `json:"animations"`
+
+	atlas  *image.NRGBA
+	parts  map[string]image.Rectangle
+	byAnim map[AnimationType]*PoseAnimation
+	pixels []color.RGBA // Frame buffer reused by Render
+}
+
+// PosePart locates one part sprite in the parts atlas
+type PosePart struct {
+	Name string `json:"name"`
+	X    int    `json:"x"`
+	Y    int    `json:"y"`
+	W    int    `json:"w"`
+	H    int    `json:"h"`
+}
+
+// PoseAnimation is the rig of one AnimationType
+type PoseAnimation struct {
+	Index  int                     `json:"index"`
+	Name   string                  `json:"name"`
+	Frames int                     `json:"frames"`
+	Tracks map[string][][3]float64 `json:"tracks"` // (frame, x, y) keyframes
+	Layers []PoseLayer             `json:"layers"`
+}
+
+// PoseLayer is a part sprite ("part") or a limb ("segment", "arm")
+type PoseLayer struct {
+	Kind   string     `json:"kind"`
+	Part   string     `json:"part"`
+	DX     int        `json:"dx"`
+	DY     int        `json:"dy"`
+	A      string     `json:"a"`
+	B      string     `json:"b"`
+	HalfW  float64    `json:"half_w"`
+	Colors [][4]uint8 `json:"colors"`
+	At     string     `json:"at"`     // Joint the layer hangs from; frame origin if empty
+	Frames []int      `json:"frames"` // Whole frames the layer shows on; all if empty
+
+	shown []bool
+}
+
+// LoadPoseRig reads the pose rig and its parts atlas, from the embedded bundle
+// when it has them
+func LoadPoseRig() (*PoseRig, error) {
+	data, embedded := bundledAsset(poseRigAsset)
+	dir := ""
+	if !embedded {
+		rigPath := getAssetPath(poseRigAsset)
+		var err error
+		if data, err = os.ReadFile(rigPath); err != nil {
+			return nil, fmt.Errorf("failed to read pose rig: %w", err)
+		}
+		dir = filepath.Dir(rigPath)
+	}
+
+	var rig PoseRig
+	if err := json.Unmarshal(data, &rig); err != nil {
+		return nil, fmt.Errorf("failed to parse pose rig: %w", err)
+	}
+	if rig.Version != poseRigVersion {
+		return nil, fmt.Errorf("unsupported pose rig version %d", rig.Version)
+	}
+
+	var atlasData []byte
+	if embedded {
+		var ok bool
+		if atlasData, ok = bundledAsset(path.Join(path.Dir(poseRigAsset), rig.PartsFile)); !ok {
+			return nil, fmt.Errorf("pose parts %s missing from bundle", rig.PartsFile)
+		}
+	} else {
+		var err error
+		if atlasData, err = os.ReadFile(filepath.Join(dir, rig.PartsFile)); err != nil {
+			return nil, fmt.Errorf("failed to read pose parts: %w", err)
+		}
+	}
+	img, err := png.Decode(bytes.NewReader(atlasData))
+	if err != nil {
+		return nil, fmt.Errorf("failed to decode pose parts: %w", err)
+	}
+	rig.atlas = image.NewNRGBA(img.Bounds())
+	draw.Draw(rig.atlas, rig.atlas.Bounds(), img, img.Bounds().Min, draw.Src)
+
+	if err := rig.index(); err != nil {
+		return nil, err
+	}
+	return &rig, nil
+}
+
+// index validates the rig and builds its lookup tables
+func (rig *PoseRig) index() error {
+	if rig.FrameWidth <= 0 || rig.FrameHeight <= 0 {
+		return fmt.Errorf("pose rig has no frame size")
+	}
+	rig.parts = make(map[string]image.Rectangle, len(rig.Parts))
+	for _, p := range rig.Parts {
+		r := image.Rect(p.X, p.Y, p.X+p.W, p.Y+p.H)
+		if !r.In(rig.atlas.Bounds()) {
+			return fmt.Errorf("pose part %s lies outside the atlas", p.Name)
+		}
+		rig.parts[p.Name] = r
+	}
+
+	rig.byAnim = make(map[AnimationType]*PoseAnimation, len(rig.Animations))
+	for i := range rig.Animations {
+		anim := &rig.Animations[i]
+		if anim.Frames <= 0 {
+			return fmt.Errorf("pose animation %s has no frames", anim.Name)
+		}
+		for name, keys := range anim.Tracks {
+			if len(keys) == 0 {
+				return fmt.Errorf("pose animation %s: joint %s has no keyframes", anim.Name, name)
+			}
+		}
+		for j := range anim.Layers {
+			layer := &anim.Layers[j]
+			joints := []string{layer.At}
+			switch layer.Kind {
+			case "part":
+				if _, ok := rig.parts[layer.Part]; !ok {
+					return fmt.Errorf("pose animation %s uses unknown part %s", anim.Name, layer.Part)
+				}
+			case "segment", "arm":
+				want := 3
+				if layer.Kind == "arm" {
+					want = 2
+				}
+				if len(layer.Colors) != want {
+					return fmt.Errorf("pose animation %s: %s layer needs %d colors", anim.Name, layer.Kind, want)
+				}
+				joints = append(joints, layer.A, layer.B)
+			default:
+				return fmt.Errorf("pose animation %s: unknown layer kind %q", anim.Name, layer.Kind)
+			}
+			for _, joint := range joints {
+				if _, ok := anim.Tracks[joint]; joint != "" && !ok {
+					return fmt.Errorf("pose animation %s uses unknown joint %s", anim.Name, joint)
+				}
+			}
+			if len(layer.Frames) > 0 {
+				layer.shown = make([]bool, anim.Frames)
+				for _, f := range layer.Frames {
+					if f >= 0 && f < anim.Frames {
+						layer.shown[f] = true
+					}
+				}
+			}
+		}
+		rig.byAnim[AnimationType(anim.Index)] = anim
+	}
+	rig.pixels = make([]color.RGBA, rig.FrameWidth*rig.FrameHeight)
+	return nil
+}
+
+// Has reports whether an animation is rigged
+func (rig *PoseRig) Has(anim AnimationType) bool {
+	_, ok := rig.byAnim[anim]
+	return ok
+}
+
+// Render assembles an animation at time t, in frames (fractional times
+// interpolate), into the rig's frame buffer and returns it. The buffer is
+// overwritten by the next call.
+func (rig *PoseRig) Render(anim AnimationType, t float64) []color.RGBA {
+	for i := range rig.pixels {
+		rig.pixels[i] = color.RGBA{}
+	}
+	a, ok := rig.byAnim[anim]
+	if !ok {
+		return rig.pixels
+	}
+
+	period := float64(a.Frames)
+	whole := int(math.Floor(t)) % a.Frames
+	if whole < 0 {
+		whole += a.Frames
+	}
+	joint := func(name string) (float64, float64) {
+		return trackAt(a.Tracks[name], t, period)
+	}
+
+	for i := range a.Layers {
+		layer := &a.Layers[i]
+		if layer.shown != nil && !layer.shown[whole] {
+			continue
+		}
+		ox, oy := 0, 0
+		if layer.At != "" {
+			x, y := joint(layer.At)
+			ox, oy = int(math.RoundToEven(x)), int(math.RoundToEven(y))
+		}
+		switch layer.Kind {
+		case "part":
+			rig.blitPart(rig.parts[layer.Part], ox+layer.DX, oy+layer.DY)
+		case "segment":
+			x1, y1 := joint(layer.A)
+			x2, y2 := joint(layer.B)
+			rig.fillSegment(layer, ox, oy, x1, y1, x2, y2)
+		case "arm":
+			x1, y1 := joint(layer.A)
+			x2, y2 := joint(layer.B)
+			rig.thickLine(layer, ox, oy,
+				int(math.RoundToEven(x1)), int(math.RoundToEven(y1)),
+				int(math.RoundToEven(x2)), int(math.RoundToEven(y2)))
+		}
+	}
+	return rig.pixels
+}
+
+// trackAt interpolates a looping keyframe track the way numpy.interp does with
+// period set: linearly between keys, wrapping from the last key to the first
+func trackAt(keys [][3]float64, t, period float64) (float64, float64) {
+	if len(keys) == 1 {
+		return keys[0][1], keys[0][2]
+	}
+	t = math.Mod(t, period)
+	if t < 0 {
+		t += period
+	}
+	n := len(keys)
+	j := n - 1
+	for j >= 0 && keys[j][0] > t {
+		j--
+	}
+	var k0, k1 [3]float64
+	switch {
+	case j < 0:
+		k0, k1 = keys[n-1], keys[0]
+		k0[0] -= period
+	case j == n-1:
+		k0, k1 = keys[n-1], keys[0]
+		k1[0] += period
+	default:
+		k0, k1 = keys[j], keys[j+1]
+	}
+	if t == k0[0] {
+		return k0[1], k0[2]
+	}
+	// float64() conversions keep the compiler from fusing multiply-adds, so
+	// results round exactly like numpy's
+	dt := t - k0[0]
+	span := k1[0] - k0[0]
+	x := float64((k1[1]-k0[1])/span*dt) + k0[1]
+	y := float64((k1[2]-k0[2])/span*dt) + k0[2]
+	return x, y
+}
+
+func (rig *PoseRig) set(x, y int, c color.RGBA) {
+	if x >= 0 && x < rig.FrameWidth && y >= 0 && y < rig.FrameHeight {
+		rig.pixels[y*rig.FrameWidth+x] = c
+	}
+}
+
+// blitPart copies a part's opaque pixels with its top-left at (x, y)
+func (rig *PoseRig) blitPart(src image.Rectangle, x, y int) {
+	for sy := src.Min.Y; sy < src.Max.Y; sy++ {
+		for sx := src.Min.X; sx < src.Max.X; sx++ {
+			c := rig.atlas.NRGBAAt(sx, sy)
+			if c.A != 0 {
+				rig.set(x+sx-src.Min.X, y+sy-src.Min.Y, color.RGBA{R: c.R, G: c.G, B: c.B, A: c.A})
+			}
+		}
+	}
+}
+
+// fillSegment is _fill_body_segment from generate_exercises.py: pixels within
+// half_w + 0.3 of the axis and up to 0.7 past either end, highlight on the
+// -perpendicular edge and shade on the +perpendicular edge
+func (rig *PoseRig) fillSegment(layer *PoseLayer, ox, oy int, x1, y1, x2, y2 float64) {
+	dx, dy := x2-x1, y2-y1
+	length := math.Sqrt(float64(dx*dx) + float64(dy*dy))
+	if length < 0.1 {
+		return
+	}
+	ux, uy := dx/length, dy/length
+	halfW := layer.HalfW
+	fill, shade, highlight := rgba(layer.Colors[0]), rgba(layer.Colors[1]), rgba(layer.Colors[2])
+	for y := 0; y < rig.FrameHeight; y++ {
+		vy := float64(y-oy) - y1
+		for x := 0; x < rig.FrameWidth; x++ {
+			vx := float64(x-ox) - x1
+			along := float64(vx*ux) + float64(vy*uy)
+			perp := float64(vx*-uy) + float64(vy*ux)
+			if along < -0.7 || along > length+0.7 || math.Abs(perp) > halfW+0.3 {
+				continue
+			}
+			c := fill
+			if perp < -(halfW - 1.2) {
+				c = highlight
+			} else if perp > halfW-1.2 {
+				c = shade
+			}
+			rig.set(x, y, c)
+		}
+	}
+}
+
+// thickLine is _draw_thick_arm from generate_exercises.py: max(|dx|, |dy|)
+// steps, with the second pixel below shallow lines and right of steep ones
+func (rig *PoseRig) thickLine(layer *PoseLayer, ox, oy, x1, y1, x2, y2 int) {
+	dx, dy := x2-x1, y2-y1
+	steps := max(absInt(dx), absInt(dy), 1)
+	c1, c2 := rgba(layer.Colors[0]), rgba(layer.Colors[1])
+	for i := 0; i <= steps; i++ {
+		t := float64(i) / float64(steps)
+		x := ox + int(math.RoundToEven(float64(x1)+float64(float64(dx)*t)))
+		y := oy + int(math.RoundToEven(float64(y1)+float64(float64(dy)*t)))
+		rig.set(x, y, c1)
+		if absInt(dx) >= absInt(dy) {
+			rig.set(x, y+1, c2)
+		} else {
+			rig.set(x+1, y, c2)
+		}
+	}
+}
+
+func rgba(c [4]uint8) color.RGBA {
+	return color.RGBA{R: c[0], G: c[1], B: c[2], A: c[3]}
+}
+
+func absInt(v int) int {
+	if v < 0 {
+		return -v
+	}
+	return v
+}
@@ -4,13 +4,26 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"sync"
 
 	rl "github.com/gen2brain/raylib-go/raylib"
 )
 
+// assetPaths memoizes getAssetPath; asset locations don't move while running
+var assetPaths sync.Map
+
 // getAssetPath returns the path to an asset file, checking both relative to
 // the executable (for npm installs) and relative to cwd (for development)
 func getAssetPath(relativePath string) string {
+	if p, ok := assetPaths.Load(relativePath); ok {
+		return p.(string)
+	}
+	p := resolveAssetPath(relativePath)
+	assetPaths.Store(relativePath, p)
+	return p
+}
+
+func resolveAssetPath(relativePath string) string {
 	if exe, err := os.Executable(); err == nil {
 		exeDir := filepath.Dir(exe)
 		if resolved, err := filepath.EvalSymlinks(exe); err == nil {
@@ -36,13 +49,23 @@ const (
 
 // Renderer handles all drawing operations
 type Renderer struct {
-	config      *Config
-	spriteSheet rl.Texture2D
-	hasSprites  bool
+	config     *Config
+	sprites    *SpritePages
+	hasSprites bool
+
+	// Runtime-assembled exercises (config pose_playback); poseTexture is the
+	// one frame-sized texture they are uploaded to
+	poses       *PoseRig
+	poseTexture rl.Texture2D
 
 	// Biome timer (for animations like clock, code scroll)
 	biomeTimer float32
 
+	// Static biome geometry baked by prepareBiome; drawn each frame under the
+	// animated parts
+	biomeLayer      rl.RenderTexture2D
+	biomeLayerValid bool
+
 	// ClaudeOffsetX allows biomes to shift the character horizontally
 	ClaudeOffsetX float32
 
@@ -58,22 +81,97 @@ func NewRenderer(config *Config) *Renderer {
 		config: config,
 	}
 
-	// Load developer character sprite sheet
-	spritePath := getAssetPath("developer/exercise_spritesheet.png")
-	if _, err := os.Stat(spritePath); err == nil {
-		r.spriteSheet = rl.LoadTexture(spritePath)
-		r.hasSprites = true
-		fmt.Println("Loaded sprite sheet from:", spritePath)
+	// Developer character sprite sheet pages load on first draw
+	if err := r.reloadSprites(); err == nil {
+		fmt.Printf("Found sprite sheet (%d pages)\n", r.sprites.PageCount())
 	} else {
 		fmt.Println("No sprite sheet found, using placeholder graphics")
 	}
+	if config.PosePlayback {
+		if err := r.reloadPoses(); err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: pose playback disabled: %v\n", err)
+		}
+	}
 
 	return r
 }
 
-// UpdateTimer advances the biome animation timer
+// reloadSprites re-reads the sprite manifest and drops any resident pages;
+// pages load again on their next draw
+func (r *Renderer) reloadSprites() error {
+	sprites, err := LoadSpritePages(r.config.SpriteScale)
+	if err != nil {
+		return err
+	}
+	if r.sprites != nil {
+		r.sprites.Unload()
+	}
+	r.sprites = sprites
+	r.hasSprites = true
+	r.InvalidateBiome()
+	return nil
+}
+
+// reloadPoses re-reads the pose rig; rigged exercises then draw from it
+// instead of the sprite sheet
+func (r *Renderer) reloadPoses() error {
+	poses, err := LoadPoseRig()
+	if err != nil {
+		return err
+	}
+	r.poses = poses
+	return nil
+}
+
+// UpdateTimer advances the biome animation timer and rebakes the static biome
+// layer if needed. Call it before BeginTextureMode: the bake renders to its own
+// texture, and raylib can't nest texture modes.
 func (r *Renderer) UpdateTimer(dt float32) {
 	r.biomeTimer += dt
+	if r.sprites != nil {
+		r.sprites.Update(dt)
+	}
+	if rl.IsWindowResized() {
+		r.InvalidateBiome()
+	}
+	r.prepareBiome()
+}
+
+// InvalidateBiome drops the baked biome layer; it is rebaked on the next
+// UpdateTimer
+func (r *Renderer) InvalidateBiome() {
+	r.biomeLayerValid = false
+}
+
+// prepareBiome bakes the static biome geometry into biomeLayer, so a frame
+// costs one texture draw plus the animated parts instead of hundreds of
+// rectangles
+func (r *Renderer) prepareBiome() {
+	if r.biomeLayerValid {
+		return
+	}
+	if r.biomeLayer.ID == 0 {
+		r.biomeLayer = rl.LoadRenderTexture(screenWidth, screenHeight)
+	}
+
+	rl.BeginTextureMode(r.biomeLayer)
+	rl.ClearBackground(rl.Color{R: 24, G: 20, B: 37, A: 255}) // Same as the frame target
+	r.drawOfficeStatic()
+	rl.EndTextureMode()
+
+	// Blending translucent shapes also blends the texture's alpha channel, which
+	// would let the frame's clear color show through the layer; everything here
+	// is drawn over an opaque background, so make it opaque again
+	img := rl.LoadImageFromTexture(r.biomeLayer.Texture)
+	pixels := rl.LoadImageColors(img)
+	for i := range pixels {
+		pixels[i].A = 255
+	}
+	rl.UpdateTexture(r.biomeLayer.Texture, pixels)
+	rl.UnloadImageColors(pixels)
+	rl.UnloadImage(img)
+
+	r.biomeLayerValid = true
 }
 
 // Draw renders the current animation state with menu overlays
@@ -135,11 +233,24 @@ func (r *Renderer) drawDebug(state *AnimationState) {
 	rl.DrawText(frameText, 5, 15, 8, rl.Green)
 	fpsText := fmt.Sprintf("FPS: %d", rl.GetFPS())
 	rl.DrawText(fpsText, 5, 25, 8, rl.Green)
+	if r.sprites != nil {
+		pagesText := fmt.Sprintf("Pages: %d/%d", r.sprites.ResidentPages(), r.sprites.PageCount())
+		rl.DrawText(pagesText, 5, 35, 8, rl.Green)
+	}
 }
 
 // Unload frees all loaded textures
 func (r *Renderer) Unload() {
-	if r.spriteSheet.ID != 0 {
-		rl.UnloadTexture(r.spriteSheet)
+	if r.sprites != nil {
+		r.sprites.Unload()
+	}
+	if r.poseTexture.ID != 0 {
+		rl.UnloadTexture(r.poseTexture)
+		r.poseTexture = rl.Texture2D{}
+	}
+	if r.biomeLayer.ID != 0 {
+		rl.UnloadRenderTexture(r.biomeLayer)
+		r.biomeLayer = rl.RenderTexture2D{}
+		r.biomeLayerValid = false
 	}
 }
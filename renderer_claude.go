@@ -1,6 +1,10 @@
 package main
 
-import rl "github.com/gen2brain/raylib-go/raylib"
+import (
+	"image/color"
+
+	rl "github.com/gen2brain/raylib-go/raylib"
+)
 
 func (r *Renderer) drawClaude(state *AnimationState) {
 	scaledW := float32(spriteFrameWidth * claudeScale)
@@ -10,17 +14,7 @@ func (r *Renderer) drawClaude(state *AnimationState) {
 	x := float32(screenWidth/2) - scaledW/2 + r.ClaudeOffsetX
 	y := float32(160) - scaledH + 10
 
-	if r.hasSprites {
-		frameX := float32(state.Frame * spriteFrameWidth)
-		frameY := float32(int(state.CurrentAnim) * spriteFrameHeight)
-
-		sourceRec := rl.Rectangle{
-			X:      frameX,
-			Y:      frameY,
-			Width:  spriteFrameWidth,
-			Height: spriteFrameHeight,
-		}
-
+	if tex, sourceRec, ok := r.frameSource(state); ok {
 		destRec := rl.Rectangle{
 			X:      x,
 			Y:      y,
@@ -28,12 +22,41 @@ func (r *Renderer) drawClaude(state *AnimationState) {
 			Height: scaledH,
 		}
 
-		rl.DrawTexturePro(r.spriteSheet, sourceRec, destRec, rl.Vector2{}, 0, rl.White)
+		rl.DrawTexturePro(tex, sourceRec, destRec, rl.Vector2{}, 0, rl.White)
 	} else {
 		r.drawPlaceholderClaude(int(x), int(y), state)
 	}
 }
 
+// frameSource returns the sheet page and source rectangle for the current
+// frame, or the runtime-assembled frame when the animation is rigged
+func (r *Renderer) frameSource(state *AnimationState) (rl.Texture2D, rl.Rectangle, bool) {
+	if r.poses != nil && r.poses.Has(state.CurrentAnim) {
+		return r.poseFrame(state)
+	}
+	if !r.hasSprites {
+		return rl.Texture2D{}, rl.Rectangle{}, false
+	}
+	return r.sprites.Frame(state.CurrentAnim, state.Frame)
+}
+
+// poseFrame assembles the current frame from the pose rig at the exact time
+// between sprite frames and uploads it to poseTexture
+func (r *Renderer) poseFrame(state *AnimationState) (rl.Texture2D, rl.Rectangle, bool) {
+	w, h := r.poses.FrameWidth, r.poses.FrameHeight
+	if r.poseTexture.ID == 0 {
+		img := rl.GenImageColor(w, h, color.RGBA{})
+		r.poseTexture = rl.LoadTextureFromImage(img)
+		rl.UnloadImage(img)
+		if r.poseTexture.ID == 0 {
+			return rl.Texture2D{}, rl.Rectangle{}, false
+		}
+	}
+	pixels := r.poses.Render(state.CurrentAnim, float64(state.Frame)+float64(state.Progress))
+	rl.UpdateTexture(r.poseTexture, pixels)
+	return r.poseTexture, rl.Rectangle{Width: float32(w), Height: float32(h)}, true
+}
+
 func (r *Renderer) drawPlaceholderClaude(x, y int, state *AnimationState) {
 	color := rl.Color{R: 217, G: 119, B: 87, A: 255}
 	bobOffset := 0
@@ -0,0 +1,286 @@
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+	"path"
+	"path/filepath"
+
+	rl "github.com/gen2brain/raylib-go/raylib"
+)
+
+const (
+	spriteManifestAsset = "developer/exercise_spritesheet.json"
+	spriteSheetAsset    = "developer/exercise_spritesheet.png"
+
+	// spritePageIdleSeconds is how long a sheet page may go undrawn before
+	// its texture is released from GPU memory
+	spritePageIdleSeconds = 10
+
+	// maxSpriteScale is the finest sheet worth loading: frames are drawn at
+	// claudeScale, so a finer sheet is sampled back down and looks the same
+	maxSpriteScale = claudeScale
+)
+
+// SpriteManifest maps animations to sheet pages. It is written next to the
+// pages by cmd/devsprite/generate_exercises.py; animations are listed in
+// AnimationType order.
+type SpriteManifest struct {
+	Version     int               `json:"version"`
+	FrameWidth  int               `json:"frame_width"`
+	FrameHeight int               `json:"frame_height"`
+	Frames      int               `json:"frames"`
+	Pages       []SpritePageInfo  `json:"pages"`
+	Animations  []SpritePlacement `json:"animations"`
+}
+
+// SpritePageInfo describes one sheet page image
+type SpritePageInfo struct {
+	File   string `json:"file"`
+	Blob   string `json:"blob,omitempty"` // pre-decoded .cgtx copy of File
+	Width  int    `json:"width"`
+	Height int    `json:"height"`
+}
+
+// SpritePlacement locates one animation's frame strip
+type SpritePlacement struct {
+	Name string `json:"name"`
+	Page int    `json:"page"`
+	Row  int    `json:"row"`
+}
+
+type spritePage struct {
+	path      string // PNG on disk
+	pngAsset  string // assets-relative PNG, read from the bundle or resolved to path on first use
+	blobPath  string // .cgtx on disk
+	blobAsset string // .cgtx in the embedded bundle
+	texture   rl.Texture2D
+	lastUsed  float32
+	failed    bool // load failed; don't retry every frame
+}
+
+// SpritePages loads sheet pages the first time an animation on them is drawn
+// and unloads pages that have sat unused, so only the pages holding active
+// animations stay resident on the GPU. With the generator's "rows" layout each
+// exercise is its own page, so GPU memory follows the exercises in use.
+type SpritePages struct {
+	manifest SpriteManifest
+	pages    []spritePage
+	clock    float32
+}
+
+// spriteManifestName returns the manifest of the sheet rendered at scale
+func spriteManifestName(scale int) string {
+	if scale <= 1 {
+		return spriteManifestAsset
+	}
+	return fmt.Sprintf("developer/exercise_spritesheet_%dx.json", scale)
+}
+
+// LoadSpritePages reads the sprite manifest, from the embedded bundle when it
+// has one. A scale above 1 selects the natively rendered sheet of that scale
+// (at most maxSpriteScale), falling back to the 1x sheet if it wasn't built. Without a manifest, a
+// lone exercise_spritesheet.png is treated as a single page with row =
+// animation. No textures are loaded until the first Frame call.
+func LoadSpritePages(scale int) (*SpritePages, error) {
+	manifestAsset := spriteManifestAsset
+	if scale > maxSpriteScale {
+		fmt.Fprintf(os.Stderr, "Warning: sprite_scale %d is above %d, using the %dx sheet\n", scale, maxSpriteScale, maxSpriteScale)
+		scale = maxSpriteScale
+	}
+	if scale > 1 {
+		scaled := spriteManifestName(scale)
+		if _, ok := bundledAsset(scaled); ok {
+			manifestAsset = scaled
+		} else if _, err := os.Stat(getAssetPath(scaled)); err == nil {
+			manifestAsset = scaled
+		} else {
+			fmt.Fprintf(os.Stderr, "Warning: no %dx sprite sheet, using 1x\n", scale)
+		}
+	}
+
+	var manifestPath string
+	data, embedded := bundledAsset(manifestAsset)
+	if !embedded {
+		var err error
+		manifestPath = getAssetPath(manifestAsset)
+		data, err = os.ReadFile(manifestPath)
+		if os.IsNotExist(err) {
+			sheetPath := getAssetPath(spriteSheetAsset)
+			if _, err := os.Stat(sheetPath); err != nil {
+				return nil, fmt.Errorf("no sprite manifest or sheet: %w", err)
+			}
+			return &SpritePages{
+				manifest: SpriteManifest{FrameWidth: spriteFrameWidth, FrameHeight: spriteFrameHeight},
+				pages:    []spritePage{{path: sheetPath}},
+			}, nil
+		}
+		if err != nil {
+			return nil, fmt.Errorf("failed to read sprite manifest: %w", err)
+		}
+	}
+
+	var m SpriteManifest
+	if err := json.Unmarshal(data, &m); err != nil {
+		return nil, fmt.Errorf("failed to parse sprite manifest: %w", err)
+	}
+	if m.Version != 1 {
+		return nil, fmt.Errorf("unsupported sprite manifest version %d", m.Version)
+	}
+	if len(m.Pages) == 0 {
+		return nil, fmt.Errorf("sprite manifest lists no pages")
+	}
+	for _, a := range m.Animations {
+		if a.Page < 0 || a.Page >= len(m.Pages) {
+			return nil, fmt.Errorf("animation %s is on missing page %d", a.Name, a.Page)
+		}
+	}
+
+	assetDir := path.Dir(manifestAsset)
+	dir := filepath.Dir(manifestPath)
+	sp := &SpritePages{manifest: m, pages: make([]spritePage, len(m.Pages))}
+	for i, p := range m.Pages {
+		page := &sp.pages[i]
+		if embedded {
+			// PNG path is only resolved if the bundled blob fails
+			page.pngAsset = path.Join(assetDir, p.File)
+			if p.Blob != "" {
+				page.blobAsset = path.Join(assetDir, p.Blob)
+			}
+			continue
+		}
+		page.path = filepath.Join(dir, p.File)
+		if p.Blob != "" {
+			page.blobPath = filepath.Join(dir, p.Blob)
+		}
+	}
+	return sp, nil
+}
+
+// PageCount returns the number of sheet pages
+func (sp *SpritePages) PageCount() int {
+	return len(sp.pages)
+}
+
+// ResidentPages returns how many pages currently hold a GPU texture
+func (sp *SpritePages) ResidentPages() int {
+	n := 0
+	for i := range sp.pages {
+		if sp.pages[i].texture.ID != 0 {
+			n++
+		}
+	}
+	return n
+}
+
+// placement returns the page and row of an animation
+func (sp *SpritePages) placement(anim AnimationType) (int, int, bool) {
+	if len(sp.manifest.Animations) == 0 {
+		return 0, int(anim), true // single legacy sheet
+	}
+	if int(anim) < 0 || int(anim) >= len(sp.manifest.Animations) {
+		return 0, 0, false
+	}
+	a := sp.manifest.Animations[anim]
+	return a.Page, a.Row, true
+}
+
+// Frame returns the texture and source rectangle for one animation frame,
+// loading its page if needed. ok is false if the frame can't be drawn.
+func (sp *SpritePages) Frame(anim AnimationType, frame int) (tex rl.Texture2D, src rl.Rectangle, ok bool) {
+	pageIdx, row, ok := sp.placement(anim)
+	if !ok {
+		return tex, src, false
+	}
+
+	page := &sp.pages[pageIdx]
+	if page.failed {
+		return tex, src, false
+	}
+	if page.texture.ID == 0 {
+		page.texture = page.load()
+		if page.texture.ID == 0 {
+			fmt.Fprintf(os.Stderr, "Warning: couldn't load sprite page %s\n", page.source())
+			page.failed = true
+			return tex, src, false
+		}
+	}
+	page.lastUsed = sp.clock
+
+	fw := float32(sp.manifest.FrameWidth)
+	fh := float32(sp.manifest.FrameHeight)
+	src = rl.Rectangle{
+		X:      float32(frame) * fw,
+		Y:      float32(row) * fh,
+		Width:  fw,
+		Height: fh,
+	}
+	return page.texture, src, true
+}
+
+// source names the page in warnings: its bundled blob, or its PNG
+func (page *spritePage) source() string {
+	if page.blobAsset != "" {
+		return "bundled " + page.blobAsset
+	}
+	if page.path != "" {
+		return page.path
+	}
+	return page.pngAsset
+}
+
+// load uploads the page, preferring its pre-decoded blob (embedded or on
+// disk) over decoding the PNG (embedded or on disk)
+func (page *spritePage) load() rl.Texture2D {
+	var data []byte
+	var name string
+	if page.blobAsset != "" {
+		data, _ = bundledAsset(page.blobAsset)
+		name = "bundled " + page.blobAsset
+	} else if page.blobPath != "" {
+		var err error
+		if data, err = os.ReadFile(page.blobPath); err != nil && !os.IsNotExist(err) {
+			fmt.Fprintf(os.Stderr, "Warning: %v, falling back to PNG\n", err)
+		}
+		name = page.blobPath
+	}
+	if data != nil {
+		tex, err := uploadTextureBlob(data, name)
+		if err == nil {
+			return tex
+		}
+		fmt.Fprintf(os.Stderr, "Warning: %v, falling back to PNG\n", err)
+	}
+	if page.path == "" {
+		if data, ok := bundledAsset(page.pngAsset); ok {
+			img := rl.LoadImageFromMemory(".png", data, int32(len(data)))
+			defer rl.UnloadImage(img)
+			return rl.LoadTextureFromImage(img)
+		}
+		page.path = getAssetPath(page.pngAsset)
+	}
+	return rl.LoadTexture(page.path)
+}
+
+// Update advances the page clock and unloads pages idle for too long
+func (sp *SpritePages) Update(dt float32) {
+	sp.clock += dt
+	for i := range sp.pages {
+		page := &sp.pages[i]
+		if page.texture.ID != 0 && sp.clock-page.lastUsed > spritePageIdleSeconds {
+			rl.UnloadTexture(page.texture)
+			page.texture = rl.Texture2D{}
+		}
+	}
+}
+
+// Unload frees every resident page
+func (sp *SpritePages) Unload() {
+	for i := range sp.pages {
+		if sp.pages[i].texture.ID != 0 {
+			rl.UnloadTexture(sp.pages[i].texture)
+			sp.pages[i].texture = rl.Texture2D{}
+		}
+	}
+}
@@ -8,6 +8,10 @@ import (
 	rl "github.com/gen2brain/raylib-go/raylib"
 )
 
+// preferDiskAssets makes debug builds read assets from disk so hot reload
+// sees edits instead of the embedded bundle
+const preferDiskAssets = true
+
 // Studio mode - clean asset development environment
 func runStudio() {
 	fmt.Println("Claude Gym Studio")
@@ -7,6 +7,9 @@ import (
 	"os"
 )
 
+// preferDiskAssets is false in release builds: embedded assets win
+const preferDiskAssets = false
+
 func runStudio() {
 	fmt.Println("Studio mode is not available in release builds.")
 	fmt.Println("Build with: go build -tags debug -o cgym . && ./cgym studio")
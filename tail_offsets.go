@@ -0,0 +1,131 @@
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"sort"
+	"time"
+)
+
+const (
+	// offsetSaveInterval throttles writes of the offsets file during bursts
+	offsetSaveInterval = 2 * time.Second
+
+	// maxTrackedFiles bounds the offsets file; least recently read go first
+	maxTrackedFiles = 64
+)
+
+// TailOffset is the resume point for one conversation file: the byte offset
+// just past its last complete line
+type TailOffset struct {
+	Offset    int64     `json:"offset"`
+	UpdatedAt time.Time `json:"updated_at"`
+}
+
+// TailOffsets persists how far each conversation file has been read. A nil
+// *TailOffsets is valid and remembers nothing.
+type TailOffsets struct {
+	Version  int                   `json:"version"`
+	Files    map[string]TailOffset `json:"files"`
+	filePath string
+	dirty    bool
+	lastSave time.Time
+}
+
+// tailOffsetsPath stores offsets next to the exercise log
+func tailOffsetsPath() string {
+	return filepath.Join(filepath.Dir(logFilePath()), "tail-offsets.json")
+}
+
+// LoadTailOffsets reads saved offsets, returning an empty set on error
+func LoadTailOffsets() *TailOffsets {
+	path := tailOffsetsPath()
+	o := &TailOffsets{Version: 1, Files: make(map[string]TailOffset), filePath: path}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return o
+	}
+	if err := json.Unmarshal(data, o); err != nil || o.Files == nil {
+		fmt.Fprintf(os.Stderr, "Warning: corrupt tail offsets, starting fresh\n")
+		o.Files = make(map[string]TailOffset)
+	}
+	o.filePath = path
+	return o
+}
+
+// Get returns the saved offset for a conversation file
+func (o *TailOffsets) Get(path string) (int64, bool) {
+	if o == nil {
+		return 0, false
+	}
+	off, ok := o.Files[path]
+	return off.Offset, ok
+}
+
+// Set records a new offset; it is written out by the next MaybeSave
+func (o *TailOffsets) Set(path string, offset int64) {
+	if o == nil {
+		return
+	}
+	if cur, ok := o.Files[path]; ok && cur.Offset == offset {
+		return
+	}
+	o.Files[path] = TailOffset{Offset: offset, UpdatedAt: time.Now()}
+	o.dirty = true
+}
+
+// MaybeSave writes pending offsets if the last save was long enough ago
+func (o *TailOffsets) MaybeSave() {
+	if o != nil && o.dirty && time.Since(o.lastSave) >= offsetSaveInterval {
+		if err := o.Save(); err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: couldn't save tail offsets: %v\n", err)
+		}
+	}
+}
+
+// Flush writes pending offsets now, however recently they were last saved
+func (o *TailOffsets) Flush() {
+	if o != nil && o.dirty {
+		if err := o.Save(); err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: couldn't save tail offsets: %v\n", err)
+		}
+	}
+}
+
+// Save writes the offsets to disk, dropping the least recently read files
+// beyond maxTrackedFiles
+func (o *TailOffsets) Save() error {
+	if len(o.Files) > maxTrackedFiles {
+		paths := make([]string, 0, len(o.Files))
+		for p := range o.Files {
+			paths = append(paths, p)
+		}
+		sort.Slice(paths, func(i, j int) bool {
+			return o.Files[paths[i]].UpdatedAt.After(o.Files[paths[j]].UpdatedAt)
+		})
+		for _, p := range paths[maxTrackedFiles:] {
+			delete(o.Files, p)
+		}
+	}
+
+	if err := os.MkdirAll(filepath.Dir(o.filePath), 0755); err != nil {
+		return err
+	}
+	data, err := json.Marshal(o)
+	if err != nil {
+		return err
+	}
+	tmp := o.filePath + ".tmp"
+	if err := os.WriteFile(tmp, data, 0644); err != nil {
+		return err
+	}
+	if err := os.Rename(tmp, o.filePath); err != nil {
+		return err
+	}
+	o.dirty = false
+	o.lastSave = time.Now()
+	return nil
+}
@@ -0,0 +1,92 @@
+package main
+
+import (
+	"encoding/binary"
+	"fmt"
+	"hash/crc32"
+
+	rl "github.com/gen2brain/raylib-go/raylib"
+)
+
+// Texture blobs (.cgtx) are pre-decoded sprite sheet pages written by
+// cmd/devsprite/texblob.py. Loading one is a file read, a checksum and a GPU
+// upload; there is no PNG inflate. See texblob.py for the layout.
+const (
+	blobMagic         = "CGTX"
+	blobVersion       = 1
+	blobHeaderSize    = 32
+	blobFormatRGBA8   = 1
+	blobFormatIndexed = 2
+)
+
+// TextureBlob is a decoded .cgtx page
+type TextureBlob struct {
+	Width       int
+	Height      int
+	FrameWidth  int
+	FrameHeight int
+	Pixels      []byte // RGBA8, Width*Height*4
+}
+
+// parseTextureBlob validates a .cgtx image and expands it to RGBA.
+// path names the blob in errors.
+func parseTextureBlob(data []byte, path string) (*TextureBlob, error) {
+	if len(data) < blobHeaderSize || string(data[:4]) != blobMagic {
+		return nil, fmt.Errorf("%s: not a texture blob", path)
+	}
+
+	le := binary.LittleEndian
+	if v := le.Uint16(data[4:]); v != blobVersion {
+		return nil, fmt.Errorf("%s: unsupported blob version %d", path, v)
+	}
+	format := le.Uint16(data[6:])
+	blob := &TextureBlob{
+		Width:       int(le.Uint32(data[8:])),
+		Height:      int(le.Uint32(data[12:])),
+		FrameWidth:  int(le.Uint16(data[16:])),
+		FrameHeight: int(le.Uint16(data[18:])),
+	}
+	entries := int(le.Uint16(data[24:]))
+	body := data[blobHeaderSize:]
+	if crc32.ChecksumIEEE(body) != le.Uint32(data[28:]) {
+		return nil, fmt.Errorf("%s: checksum mismatch", path)
+	}
+
+	n := blob.Width * blob.Height
+	switch format {
+	case blobFormatRGBA8:
+		if len(body) != n*4 {
+			return nil, fmt.Errorf("%s: truncated pixel data", path)
+		}
+		blob.Pixels = body
+	case blobFormatIndexed:
+		if len(body) != n+entries*4 {
+			return nil, fmt.Errorf("%s: truncated pixel data", path)
+		}
+		palette := body[n:]
+		blob.Pixels = make([]byte, n*4)
+		for i, idx := range body[:n] {
+			if int(idx) >= entries {
+				return nil, fmt.Errorf("%s: palette index %d out of range", path, idx)
+			}
+			copy(blob.Pixels[i*4:i*4+4], palette[int(idx)*4:])
+		}
+	default:
+		return nil, fmt.Errorf("%s: unknown blob format %d", path, format)
+	}
+	return blob, nil
+}
+
+// uploadTextureBlob uploads a .cgtx page straight to a GPU texture
+func uploadTextureBlob(data []byte, path string) (rl.Texture2D, error) {
+	blob, err := parseTextureBlob(data, path)
+	if err != nil {
+		return rl.Texture2D{}, err
+	}
+	img := rl.NewImage(blob.Pixels, int32(blob.Width), int32(blob.Height), 1, rl.UncompressedR8g8b8a8)
+	tex := rl.LoadTextureFromImage(img)
+	if tex.ID == 0 {
+		return tex, fmt.Errorf("%s: texture upload failed", path)
+	}
+	return tex, nil
+}
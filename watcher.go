@@ -4,10 +4,8 @@ import (
 	"bufio"
 	"encoding/json"
 	"fmt"
-	"io"
 	"os"
 	"path/filepath"
-	"sort"
 	"strings"
 	"time"
 )
@@ -42,6 +40,37 @@ const (
 	EventTurnComplete      // Claude finished tool streak and is presenting results (user's turn)
 )
 
+func (t EventType) String() string {
+	names := map[EventType]string{
+		EventSystemInit:           "SystemInit",
+		EventThinking:             "Thinking",
+		EventReading:              "Reading",
+		EventBash:                 "Bash",
+		EventWriting:              "Writing",
+		EventSuccess:              "Success",
+		EventError:                "Error",
+		EventIdle:                 "Idle",
+		EventQuest:                "Quest",
+		EventCompact:              "Compact",
+		EventThinkHard:            "ThinkHard",
+		EventSpawnAgent:           "SpawnAgent",
+		EventAgentComplete:        "AgentComplete",
+		EventTodoUpdate:           "TodoUpdate",
+		EventAskUser:              "AskUser",
+		EventEnemyHit:             "EnemyHit",
+		EventVictoryPose:          "VictoryPose",
+		EventGitPush:              "GitPush",
+		EventPlanStart:            "PlanStart",
+		EventPlanApproved:         "PlanApproved",
+		EventPermissionEscalation: "PermissionEscalation",
+		EventTurnComplete:         "TurnComplete",
+	}
+	if name, ok := names[t]; ok {
+		return name
+	}
+	return "Unknown"
+}
+
 // TokenUsage tracks context window usage for mana bar
 type TokenUsage struct {
 	InputTokens         int `json:"input_tokens"`
@@ -105,6 +134,9 @@ type ClaudeMessage struct {
 		Content json.RawMessage `json:"content"` // Can be string or array
 		Usage   *TokenUsage     `json:"usage,omitempty"`
 	} `json:"message,omitempty"`
+
+	// items is Message.Content decoded by scanLine
+	items []ContentItem
 }
 
 // ContentItem represents a single content item in message.content array
@@ -149,6 +181,11 @@ type Watcher struct {
 	ReplaySpeed time.Duration // Delay between events in replay mode
 	lastPos     int64         // Last read position for tailing
 	lastModTime time.Time     // Last modification time of current file
+	dirModTime  time.Time     // ProjectDir's mtime at the last full scan
+	tail        tailState     // Open file handle and reused read buffers
+	offsets     *TailOffsets  // Persisted per-file read positions
+	stop        chan struct{} // Closed by Stop to end the tail goroutine
+	done        chan struct{} // Closed once the tail goroutine has returned
 
 	// State tracking
 	LastTokenUsage     *TokenUsage
@@ -166,6 +203,20 @@ func NewWatcher() *Watcher {
 		Events:           make(chan Event, 100),
 		ReplaySpeed:      200 * time.Millisecond, // Default replay speed
 		ActiveTaskAgents: make(map[string]string),
+		stop:             make(chan struct{}),
+	}
+}
+
+// Stop ends live tailing and waits for the tail loop to save its offsets; no
+// events are sent after it returns
+func (w *Watcher) Stop() {
+	select {
+	case <-w.stop:
+	default:
+		close(w.stop)
+	}
+	if w.done != nil {
+		<-w.done
 	}
 }
 
@@ -179,7 +230,7 @@ func (w *Watcher) FindProjectConversation(projectDir string) error {
 	}
 
 	encoded := strings.ReplaceAll(absPath, "/", "-")
-	claudeProjectDir := filepath.Join(os.Getenv("HOME"), ".claude", "projects", encoded)
+	claudeProjectDir := filepath.Join(claudeProjectsRoot(), encoded)
 	w.ProjectDir = claudeProjectDir
 
 	// Check if project directory exists
@@ -198,36 +249,54 @@ func (w *Watcher) FindProjectConversation(projectDir string) error {
 	return nil
 }
 
+// claudeProjectsRoot is the directory holding every project's conversations
+func claudeProjectsRoot() string {
+	return filepath.Join(os.Getenv("HOME"), ".claude", "projects")
+}
+
 // findNewestConversation finds the most recently modified conversation file
+// in a single pass, stat'ing each entry once. It also records the directory's
+// own mtime so the polling loop can skip rescans while nothing was created.
 func (w *Watcher) findNewestConversation() (string, time.Time, error) {
+	// Stat the directory before listing it, so a file created in between
+	// shows up as a directory change on the next check
+	if dirInfo, err := os.Stat(w.ProjectDir); err == nil {
+		w.dirModTime = dirInfo.ModTime()
+	}
+
 	entries, err := os.ReadDir(w.ProjectDir)
 	if err != nil {
 		return "", time.Time{}, fmt.Errorf("failed to read project directory: %w", err)
 	}
 
-	var jsonlFiles []os.DirEntry
+	var newest string
+	var newestMod time.Time
 	for _, entry := range entries {
-		if !entry.IsDir() && strings.HasSuffix(entry.Name(), ".jsonl") {
-			// Skip agent files - they're subagent sessions
-			if !strings.HasPrefix(entry.Name(), "agent-") {
-				jsonlFiles = append(jsonlFiles, entry)
-			}
+		// Skip agent files - they're subagent sessions
+		if entry.IsDir() || !isConversationFile(entry.Name()) {
+			continue
+		}
+		info, err := entry.Info()
+		if err != nil {
+			continue // removed since the listing
+		}
+		if newest == "" || info.ModTime().After(newestMod) {
+			newest = entry.Name()
+			newestMod = info.ModTime()
 		}
 	}
 
-	if len(jsonlFiles) == 0 {
+	if newest == "" {
 		return "", time.Time{}, fmt.Errorf("no conversation files found in %s", w.ProjectDir)
 	}
+	return filepath.Join(w.ProjectDir, newest), newestMod, nil
+}
 
-	// Sort by modification time, newest first
-	sort.Slice(jsonlFiles, func(i, j int) bool {
-		infoI, _ := jsonlFiles[i].Info()
-		infoJ, _ := jsonlFiles[j].Info()
-		return infoI.ModTime().After(infoJ.ModTime())
-	})
-
-	info, _ := jsonlFiles[0].Info()
-	return filepath.Join(w.ProjectDir, jsonlFiles[0].Name()), info.ModTime(), nil
+// projectDirChanged reports whether entries were added to or removed from the
+// project directory since the last findNewestConversation
+func (w *Watcher) projectDirChanged() bool {
+	info, err := os.Stat(w.ProjectDir)
+	return err == nil && !info.ModTime().Equal(w.dirModTime)
 }
 
 // StartLive begins watching the conversation file for new events
@@ -236,84 +305,37 @@ func (w *Watcher) StartLive() error {
 		return fmt.Errorf("no file path set, call FindProjectConversation first")
 	}
 
-	w.Mode = ModeLive
-
-	// Open file and seek to end (we only want new events)
-	file, err := os.Open(w.FilePath)
-	if err != nil {
-		return fmt.Errorf("failed to open conversation file: %w", err)
+	// The handle stays open while watching
+	if err := w.startTail(LoadTailOffsets()); err != nil {
+		return err
 	}
-
-	// Seek to end
-	pos, err := file.Seek(0, io.SeekEnd)
-	if err != nil {
-		file.Close()
-		return fmt.Errorf("failed to seek to end: %w", err)
+	if err := w.openTail(w.FilePath, w.lastPos); err != nil {
+		return fmt.Errorf("failed to open conversation file: %w", err)
 	}
-	w.lastPos = pos
-	file.Close()
 
 	// Emit init event
 	w.Events <- Event{Type: EventSystemInit, Details: "Watching: " + filepath.Base(w.FilePath)}
 
-	go w.tailFile()
+	w.done = make(chan struct{})
+	go func() {
+		defer close(w.done)
+		w.tailFile()
+	}()
 	return nil
 }
 
-// tailFile continuously watches for new lines in the file
-func (w *Watcher) tailFile() {
-	ticker := time.NewTicker(100 * time.Millisecond)
-	defer ticker.Stop()
-
-	checkCounter := 0
-	const checkInterval = 20 // Check for newer files every 2 seconds (20 * 100ms)
-
-	for range ticker.C {
-		checkCounter++
-
-		// Periodically check if a newer conversation file was created
-		if checkCounter >= checkInterval {
-			checkCounter = 0
-			if w.checkForNewerFile() {
-				continue // Switched to new file, restart loop
-			}
-		}
-
-		file, err := os.Open(w.FilePath)
-		if err != nil {
-			continue
-		}
-
-		// Check if file has grown
-		info, err := file.Stat()
-		if err != nil {
-			file.Close()
-			continue
-		}
-
-		if info.Size() > w.lastPos {
-			// Seek to last position and read new content
-			file.Seek(w.lastPos, io.SeekStart)
-			scanner := bufio.NewScanner(file)
-
-			// Increase buffer for large lines
-			buf := make([]byte, 0, 1024*1024)
-			scanner.Buffer(buf, 10*1024*1024)
-
-			for scanner.Scan() {
-				line := scanner.Text()
-				if events := w.parseLine(line); len(events) > 0 {
-					for _, evt := range events {
-						w.Events <- evt
-					}
-				}
-			}
-
-			w.lastPos = info.Size()
-		}
-
-		file.Close()
+// startTail prepares live watching: reading starts at the end of the file (we
+// only want new events), or where the last run stopped if that is only a
+// little behind. The file itself is opened by the first read.
+func (w *Watcher) startTail(offsets *TailOffsets) error {
+	w.Mode = ModeLive
+	info, err := os.Stat(w.FilePath)
+	if err != nil {
+		return fmt.Errorf("failed to open conversation file: %w", err)
 	}
+	w.offsets = offsets
+	w.lastPos = w.resumeOffset(w.FilePath, info.Size(), resumeMaxGap, info.Size())
+	return nil
 }
 
 // checkForNewerFile checks if a newer conversation file exists and switches to it
@@ -329,37 +351,46 @@ func (w *Watcher) checkForNewerFile() bool {
 
 	// If we found a different file that's newer, switch to it
 	if filePath != w.FilePath && modTime.After(w.lastModTime) {
-		oldFile := filepath.Base(w.FilePath)
-		newFile := filepath.Base(filePath)
-
-		w.FilePath = filePath
-		w.lastModTime = modTime
-		w.lastPos = 0 // Start from beginning of new file
-
-		// If a plan approval was pending, the new conversation means the plan was approved
-		// (Claude Code rejects ExitPlanMode with is_error=True and starts a new conversation).
-		// Defer the trigger until we see the permission mode on the first user message.
-		if w.PendingPlanApproval != "" {
-			w.PlanApprovalPending = true
-			w.PendingPlanApproval = ""
-		}
+		w.switchTo(filePath, modTime)
+		return true
+	}
 
-		// Reset stale state from old conversation
-		w.LastPermissionMode = ""
-		w.EscalationArmed = false
+	return false
+}
 
-		// Notify about the switch
-		w.Events <- Event{
-			Type:    EventSystemInit,
-			Details: fmt.Sprintf("Switched: %s", newFile),
-		}
+// switchTo starts following a different conversation file from its beginning
+func (w *Watcher) switchTo(filePath string, modTime time.Time) {
+	oldFile := filepath.Base(w.FilePath)
+	newFile := filepath.Base(filePath)
 
-		// Log the switch
-		fmt.Printf("Switched from %s to %s\n", oldFile, newFile)
-		return true
+	w.closeTail()
+	w.FilePath = filePath
+	w.lastModTime = modTime
+	w.lastPos = 0 // Start from beginning of new file, or where we left it
+	if info, err := os.Stat(filePath); err == nil {
+		w.lastPos = w.resumeOffset(filePath, info.Size(), info.Size(), 0)
 	}
 
-	return false
+	// If a plan approval was pending, the new conversation means the plan was approved
+	// (Claude Code rejects ExitPlanMode with is_error=True and starts a new conversation).
+	// Defer the trigger until we see the permission mode on the first user message.
+	if w.PendingPlanApproval != "" {
+		w.PlanApprovalPending = true
+		w.PendingPlanApproval = ""
+	}
+
+	// Reset stale state from old conversation
+	w.LastPermissionMode = ""
+	w.EscalationArmed = false
+
+	// Notify about the switch
+	w.emit(Event{
+		Type:    EventSystemInit,
+		Details: fmt.Sprintf("Switched: %s", newFile),
+	})
+
+	// Log the switch
+	fmt.Printf("Switched from %s to %s\n", oldFile, newFile)
 }
 
 // StartReplay plays through an existing conversation file
@@ -383,7 +414,7 @@ func (w *Watcher) StartReplay(filePath string) error {
 		scanner.Buffer(buf, 10*1024*1024)
 
 		for scanner.Scan() {
-			line := scanner.Text()
+			line := scanner.Bytes()
 			if events := w.parseLine(line); len(events) > 0 {
 				for _, evt := range events {
 					w.Events <- evt
@@ -399,13 +430,22 @@ func (w *Watcher) StartReplay(filePath string) error {
 	return nil
 }
 
-// parseLine parses a JSON line and returns events if applicable
-func (w *Watcher) parseLine(line string) []Event {
-	var msg ClaudeMessage
-	if err := json.Unmarshal([]byte(line), &msg); err != nil {
+// parseLine parses a JSON line and returns events if applicable. Parsing is
+// two-stage: scanLine first reads only the top-level keys, skipping large
+// values (tool outputs, toolUseResult copies, file snapshots) without decoding
+// them, and lines whose type can't produce events stop there. The rest decode
+// just the fields the event logic reads.
+func (w *Watcher) parseLine(line []byte) []Event {
+	msg, ok := scanLine(line)
+	if !ok {
 		return nil
 	}
+	return w.handleMessage(msg)
+}
 
+// handleMessage turns a scanned line into events, updating the watcher's
+// cross-line state. Lines must be handled in file order.
+func (w *Watcher) handleMessage(msg ClaudeMessage) []Event {
 	var events []Event
 
 	switch msg.Type {
@@ -434,6 +474,75 @@ func (w *Watcher) parseLine(line string) []Event {
 	return events
 }
 
+// scanLine extracts the parts of a JSONL line that parseLine uses. It returns
+// false for malformed lines and for types that never produce events. It keeps
+// no state, so lines can be scanned in parallel. Message.Content and the
+// items' Input and Content alias line, so msg must not outlive it.
+func scanLine(line []byte) (ClaudeMessage, bool) {
+	var msg ClaudeMessage
+	var message, compact, summary []byte
+
+	err := eachMember(line, func(key, value []byte) bool {
+		switch string(key) {
+		case "type":
+			msg.Type = jsonString(value)
+		case "subtype":
+			msg.Subtype = jsonString(value)
+		case "permissionMode":
+			msg.PermissionMode = jsonString(value)
+		case "message":
+			message = value
+		case "compactMetadata":
+			compact = value
+		case "summary":
+			summary = value
+		}
+		return true
+	})
+	if err != nil {
+		return msg, false
+	}
+
+	switch msg.Type {
+	case "system":
+		if len(compact) > 0 {
+			var info CompactInfo
+			if json.Unmarshal(compact, &info) == nil {
+				msg.CompactMetadata = &info
+			}
+		}
+	case "summary":
+		msg.Summary = jsonString(summary)
+	case "assistant", "user":
+		if len(message) == 0 {
+			return msg, true
+		}
+		err := eachMember(message, func(key, value []byte) bool {
+			switch string(key) {
+			case "content":
+				msg.Message.Content = value
+			case "usage":
+				if msg.Type == "assistant" {
+					var usage TokenUsage
+					if json.Unmarshal(value, &usage) == nil {
+						msg.Message.Usage = &usage
+					}
+				}
+			}
+			return true
+		})
+		if err != nil {
+			return msg, false
+		}
+		msg.items = parseMessageContent(msg.Message.Content)
+	case "result":
+		// Subtype is all it needs
+	default:
+		return msg, false
+	}
+	return msg, true
+}
+
 // parseSystemMessage handles system type messages
 func (w *Watcher) parseSystemMessage(msg ClaudeMessage) []Event {
 	switch msg.Subtype {
@@ -472,10 +581,7 @@ func (w *Watcher) parseAssistantMessage(msg ClaudeMessage) []Event {
 		w.LastTokenUsage = msg.Message.Usage
 	}
 
-	// Parse content array
-	content := w.parseMessageContent(msg.Message.Content)
-
-	for _, item := range content {
+	for _, item := range msg.items {
 		switch item.Type {
 		case "tool_use":
 			// Fire escalation event on first tool_use after user prompt in elevated mode
@@ -530,13 +636,11 @@ func (w *Watcher) parseUserMessage(msg ClaudeMessage) []Event {
 		w.LastPermissionMode = msg.PermissionMode
 	}
 
-	content := w.parseMessageContent(msg.Message.Content)
-
 	// Check if this is a tool result or a user prompt
 	hasToolResult := false
 	hasError := false
 
-	for _, item := range content {
+	for _, item := range msg.items {
 		if item.Type == "tool_result" {
 			hasToolResult = true
 
@@ -570,7 +674,8 @@ func (w *Watcher) parseUserMessage(msg ClaudeMessage) []Event {
 				// Extract error content (could be string or array)
 				errorDetails := "Error"
 				if len(item.Content) > 0 {
-					errorDetails = truncate(string(item.Content), 40)
+					// Only the head is shown; don't copy a huge error output
+					errorDetails = truncate(string(item.Content[:min(len(item.Content), 256)]), 40)
 				}
 				events = append(events, Event{
 					Type:    EventError,
@@ -604,7 +709,7 @@ func (w *Watcher) parseUserMessage(msg ClaudeMessage) []Event {
 
 	// If not a tool result, this is a user prompt (quest!)
 	if !hasToolResult {
-		text := w.extractUserPromptText(msg.Message.Content)
+		text := extractUserPromptText(msg.items)
 		if text != "" {
 			// Check for think hard patterns
 			thinkLevel := detectThinkLevel(text)
@@ -646,45 +751,59 @@ func (w *Watcher) parseResultMessage(msg ClaudeMessage) []Event {
 	return nil
 }
 
-// parseMessageContent parses the message content which can be string or array
-func (w *Watcher) parseMessageContent(raw json.RawMessage) []ContentItem {
+// parseMessageContent parses the message content which can be string or array.
+// Input and Content alias raw; only the strings the events keep are copied.
+func parseMessageContent(raw json.RawMessage) []ContentItem {
 	if len(raw) == 0 {
 		return nil
 	}
 
-	// Try as array first
-	var items []ContentItem
-	if err := json.Unmarshal(raw, &items); err == nil {
-		return items
+	// A plain string is a user prompt
+	if isJSONString(raw) {
+		return []ContentItem{{Type: "text", Text: jsonString(raw)}}
 	}
 
-	// Try as string (user prompt)
-	var text string
-	if err := json.Unmarshal(raw, &text); err == nil {
-		return []ContentItem{{Type: "text", Text: text}}
+	var items []ContentItem
+	err := eachElement(raw, func(value []byte) {
+		var item ContentItem
+		eachMember(value, func(key, value []byte) bool {
+			switch string(key) {
+			case "type":
+				item.Type = jsonString(value)
+			case "id":
+				item.ID = jsonString(value)
+			case "name":
+				item.Name = jsonString(value)
+			case "text":
+				item.Text = jsonString(value)
+			case "thinking":
+				item.Thinking = jsonString(value)
+			case "input":
+				item.Input = value
+			case "is_error":
+				item.IsError = jsonTrue(value)
+			case "content":
+				item.Content = value
+			case "tool_use_id":
+				item.ToolUseID = jsonString(value)
+			}
+			return true
+		})
+		items = append(items, item)
+	})
+	if err != nil {
+		return nil
 	}
-
-	return nil
+	return items
 }
 
 // extractUserPromptText extracts the user's text from content
-func (w *Watcher) extractUserPromptText(raw json.RawMessage) string {
-	// Try as string first
-	var text string
-	if err := json.Unmarshal(raw, &text); err == nil {
-		return text
-	}
-
-	// Try as array
-	var items []ContentItem
-	if err := json.Unmarshal(raw, &items); err == nil {
-		for _, item := range items {
-			if item.Type == "text" && item.Text != "" {
-				return item.Text
-			}
+func extractUserPromptText(items []ContentItem) string {
+	for _, item := range items {
+		if item.Type == "text" && item.Text != "" {
+			return item.Text
 		}
 	}
-
 	return ""
 }
 
@@ -0,0 +1,174 @@
+package main
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"runtime"
+	"sort"
+	"sync"
+	"sync/atomic"
+	"time"
+)
+
+// batchBlock is how many lines a worker scans per claim
+const batchBlock = 256
+
+// ReplayReport aggregates a batch replay of one conversation file
+type ReplayReport struct {
+	File    string         `json:"file"`
+	Lines   int            `json:"lines"`
+	Parsed  int            `json:"parsed"` // lines of a type that can produce events
+	Events  int            `json:"events"`
+	ByType  map[string]int `json:"by_type"`
+	Prompts int            `json:"prompts"` // exercise prompts the menu would have shown
+	Elapsed time.Duration  `json:"elapsed_ns"`
+}
+
+// ReplayBatch parses a whole conversation file without pacing and calls fn
+// with every event in file order. Lines are scanned by up to workers
+// goroutines (0 means GOMAXPROCS); the stateful event logic then runs over
+// them sequentially, so the result is identical to a live or paced replay.
+// Returns the number of lines read and how many of them could produce events.
+func (w *Watcher) ReplayBatch(filePath string, workers int, fn func(Event)) (int, int, error) {
+	data, err := os.ReadFile(filePath)
+	if err != nil {
+		return 0, 0, fmt.Errorf("failed to read replay file: %w", err)
+	}
+	w.Mode = ModeReplay
+	w.FilePath = filePath
+
+	lines := splitLines(data)
+	msgs, ok := scanLines(lines, workers)
+
+	parsed := 0
+	for i := range msgs {
+		if !ok[i] {
+			continue
+		}
+		parsed++
+		for _, evt := range w.handleMessage(msgs[i]) {
+			fn(evt)
+		}
+	}
+	return len(lines), parsed, nil
+}
+
+// splitLines returns the non-empty lines of data, dropping ones longer than
+// the tail's maxLineSize the same way the live watcher does
+func splitLines(data []byte) [][]byte {
+	lines := make([][]byte, 0, bytes.Count(data, []byte{'\n'})+1)
+	for len(data) > 0 {
+		var line []byte
+		if i := bytes.IndexByte(data, '\n'); i >= 0 {
+			line, data = data[:i], data[i+1:]
+		} else {
+			line, data = data, nil
+		}
+		line = bytes.TrimRight(line, "\r")
+		if len(line) > 0 && len(line) <= maxLineSize {
+			lines = append(lines, line)
+		}
+	}
+	return lines
+}
+
+// scanLines runs scanLine over every line, in parallel blocks, keeping each
+// result at its line's index
+func scanLines(lines [][]byte, workers int) ([]ClaudeMessage, []bool) {
+	msgs := make([]ClaudeMessage, len(lines))
+	ok := make([]bool, len(lines))
+
+	if workers <= 0 {
+		workers = runtime.GOMAXPROCS(0)
+	}
+	workers = min(workers, (len(lines)+batchBlock-1)/batchBlock)
+	if workers <= 1 {
+		for i, line := range lines {
+			msgs[i], ok[i] = scanLine(line)
+		}
+		return msgs, ok
+	}
+
+	var next atomic.Int64
+	var wg sync.WaitGroup
+	for i := 0; i < workers; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for {
+				start := int(next.Add(batchBlock)) - batchBlock
+				if start >= len(lines) {
+					return
+				}
+				end := min(start+batchBlock, len(lines))
+				for i := start; i < end; i++ {
+					msgs[i], ok[i] = scanLine(lines[i])
+				}
+			}
+		}()
+	}
+	wg.Wait()
+	return msgs, ok
+}
+
+// BatchReport replays filePath through a fresh watcher and a headless menu
+// state machine, counting events and the exercise prompts they would trigger
+func BatchReport(filePath string, workers int) (*ReplayReport, error) {
+	start := time.Now()
+	report := &ReplayReport{File: filePath, ByType: make(map[string]int)}
+
+	w := NewWatcher()
+	menu := NewMenuState(nil)
+	anim := NewAnimationSystem()
+
+	lines, parsed, err := w.ReplayBatch(filePath, workers, func(evt Event) {
+		report.Events++
+		report.ByType[evt.Type.String()]++
+
+		prev := menu.Mode
+		menu.HandleEvent(evt, anim)
+		if menu.Mode == ModePrompting && prev != ModePrompting {
+			report.Prompts++
+		}
+	})
+	if err != nil {
+		return nil, err
+	}
+	report.Lines = lines
+	report.Parsed = parsed
+	report.Elapsed = time.Since(start)
+	return report, nil
+}
+
+// Print writes the report as a short human-readable summary
+func (r *ReplayReport) Print(out io.Writer) {
+	fmt.Fprintf(out, "%s: %d lines, %d events, %d prompts (%v)\n",
+		r.File, r.Lines, r.Events, r.Prompts, r.Elapsed.Round(time.Millisecond))
+
+	types := make([]string, 0, len(r.ByType))
+	for t := range r.ByType {
+		types = append(types, t)
+	}
+	sort.Slice(types, func(i, j int) bool {
+		if r.ByType[types[i]] != r.ByType[types[j]] {
+			return r.ByType[types[i]] > r.ByType[types[j]]
+		}
+		return types[i] < types[j]
+	})
+	for _, t := range types {
+		fmt.Fprintf(out, "  %-22s %d\n", t, r.ByType[t])
+	}
+}
+
+// PrintJSON writes the report as a single JSON line
+func (r *ReplayReport) PrintJSON(out io.Writer) error {
+	data, err := json.Marshal(r)
+	if err != nil {
+		return err
+	}
+	_, err = fmt.Fprintf(out, "%s\n", data)
+	return err
+}
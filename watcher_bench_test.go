@@ -0,0 +1,143 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"runtime"
+	"strconv"
+	"testing"
+	"time"
+)
+
+// Watcher load benchmarks. They replay testdata/session.jsonl, a small
+// session from cmd/sessiongen; for heavier runs point CGYM_BENCH_SESSION at a
+// bigger one:
+//
+//	cd cmd && python -m sessiongen write /tmp/big.jsonl -n 2000
+//	CGYM_BENCH_SESSION=/tmp/big.jsonl go test -run - -bench Watcher -benchmem
+
+func benchSession(b *testing.B) ([][]byte, int64) {
+	path := os.Getenv("CGYM_BENCH_SESSION")
+	if path == "" {
+		path = filepath.Join("testdata", "session.jsonl")
+	}
+	data, err := os.ReadFile(path)
+	if err != nil {
+		b.Skipf("no session to replay: %v", err)
+	}
+	return splitLines(data), int64(len(data))
+}
+
+func reportLineRate(b *testing.B, lines int) {
+	b.ReportMetric(float64(lines*b.N)/b.Elapsed().Seconds(), "lines/s")
+}
+
+// BenchmarkWatcherParseLine is the live hot path: every line through
+// parseLine and the stateful event logic
+func BenchmarkWatcherParseLine(b *testing.B) {
+	lines, size := benchSession(b)
+	b.SetBytes(size)
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	events := 0
+	for i := 0; i < b.N; i++ {
+		w := NewWatcher()
+		for _, line := range lines {
+			events += len(w.parseLine(line))
+		}
+	}
+	reportLineRate(b, len(lines))
+	b.ReportMetric(float64(events)/float64(b.N), "events/op")
+}
+
+// BenchmarkWatcherUnmarshalBaseline decodes every line with json.Unmarshal,
+// the way parseLine did before the byte-level pre-filter, for comparison
+func BenchmarkWatcherUnmarshalBaseline(b *testing.B) {
+	lines, size := benchSession(b)
+	b.SetBytes(size)
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		for _, line := range lines {
+			var msg ClaudeMessage
+			json.Unmarshal(line, &msg)
+		}
+	}
+	reportLineRate(b, len(lines))
+}
+
+// BenchmarkWatcherReplayBatch covers batch replay, sequential and parallel
+func BenchmarkWatcherReplayBatch(b *testing.B) {
+	path := os.Getenv("CGYM_BENCH_SESSION")
+	if path == "" {
+		path = filepath.Join("testdata", "session.jsonl")
+	}
+	lines, size := benchSession(b)
+
+	counts := []int{1}
+	if n := runtime.GOMAXPROCS(0); n > 1 {
+		counts = append(counts, n)
+	}
+	for _, workers := range counts {
+		b.Run("workers="+strconv.Itoa(workers), func(b *testing.B) {
+			b.SetBytes(size)
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				if _, _, err := NewWatcher().ReplayBatch(path, workers, func(Event) {}); err != nil {
+					b.Fatal(err)
+				}
+			}
+			reportLineRate(b, len(lines))
+		})
+	}
+}
+
+// BenchmarkWatcherTailLatency measures the time from appending a line to the
+// conversation file until its event arrives on Watcher.Events. Each iteration
+// appends the next session line as background load, then a probe line whose
+// event marks the end of the round trip.
+func BenchmarkWatcherTailLatency(b *testing.B) {
+	lines, _ := benchSession(b)
+
+	dir := b.TempDir()
+	path := filepath.Join(dir, "session.jsonl")
+	f, err := os.Create(path)
+	if err != nil {
+		b.Fatal(err)
+	}
+	defer f.Close()
+
+	w := NewWatcher()
+	w.FilePath = path
+	w.ProjectDir = dir
+	if err := w.openTail(path, 0); err != nil {
+		b.Fatal(err)
+	}
+	// offsets stay nil, so nothing is persisted outside the temp dir
+	go w.tailFile()
+	defer w.Stop()
+
+	probe := []byte(`{"type":"assistant","message":{"content":[{"type":"tool_use","id":"probe","name":"BenchProbe","input":{}}]}}` + "\n")
+
+	var buf []byte
+	var total time.Duration
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf = append(append(buf[:0], lines[i%len(lines)]...), '\n')
+		buf = append(buf, probe...)
+		start := time.Now()
+		if _, err := f.Write(buf); err != nil {
+			b.Fatal(err)
+		}
+		for evt := range w.Events {
+			if evt.ToolName == "BenchProbe" {
+				break
+			}
+		}
+		total += time.Since(start)
+	}
+	b.ReportMetric(float64(total.Microseconds())/float64(b.N), "µs/event")
+}
@@ -0,0 +1,334 @@
+package main
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"sort"
+	"time"
+
+	"github.com/fsnotify/fsnotify"
+)
+
+// tailIdleClose is how long a project's conversation may sit unchanged before
+// its file handle is closed; the next write reopens it at the saved position
+const tailIdleClose = 2 * time.Minute
+
+// MultiWatcher follows the newest conversation of several Claude projects from
+// one process. Each project keeps its own Watcher, and with it its own task
+// agents, plan approval and escalation state, but all of them share one event
+// channel, one fsnotify watcher and one goroutine, and files are only held
+// open while they are active.
+type MultiWatcher struct {
+	Events   chan Event
+	Root     string              // Set when following every project under claudeProjectsRoot
+	projects map[string]*Watcher // Claude project directory -> its watcher
+	offsets  *TailOffsets        // Shared, so every project persists into one file
+	watched  map[string]bool     // Project dirs with a notification watch: true, or false if adding it failed
+	stop     chan struct{}
+	done     chan struct{} // Closed once run has returned
+}
+
+// NewMultiWatcher creates an empty multi-project watcher
+func NewMultiWatcher() *MultiWatcher {
+	return &MultiWatcher{
+		Events:   make(chan Event, 100),
+		projects: make(map[string]*Watcher),
+		watched:  make(map[string]bool),
+		stop:     make(chan struct{}),
+	}
+}
+
+// AddProject follows the latest conversation of a project working directory
+func (m *MultiWatcher) AddProject(projectDir string) error {
+	w := m.newProjectWatcher()
+	if err := w.FindProjectConversation(projectDir); err != nil {
+		return err
+	}
+	m.projects[w.ProjectDir] = w
+	return nil
+}
+
+// AddAllProjects follows every project under ~/.claude/projects, including
+// projects created while running
+func (m *MultiWatcher) AddAllProjects() error {
+	root := claudeProjectsRoot()
+	entries, err := os.ReadDir(root)
+	if err != nil {
+		return fmt.Errorf("failed to read Claude projects: %w", err)
+	}
+	m.Root = root
+	for _, entry := range entries {
+		if entry.IsDir() {
+			m.addClaudeDir(filepath.Join(root, entry.Name()))
+		}
+	}
+	return nil
+}
+
+// addClaudeDir adds an encoded Claude project directory, which may not hold a
+// conversation yet
+func (m *MultiWatcher) addClaudeDir(dir string) *Watcher {
+	if w, ok := m.projects[dir]; ok {
+		return w
+	}
+	w := m.newProjectWatcher()
+	w.ProjectDir = dir
+	w.Mode = ModeLive
+	w.offsets = m.offsets
+	if filePath, modTime, err := w.findNewestConversation(); err == nil {
+		w.FilePath = filePath
+		w.lastModTime = modTime
+	}
+	m.projects[dir] = w
+	return w
+}
+
+func (m *MultiWatcher) newProjectWatcher() *Watcher {
+	w := NewWatcher()
+	w.Events = m.Events
+	w.stop = m.stop
+	return w
+}
+
+// Files lists the conversation files currently being followed
+func (m *MultiWatcher) Files() []string {
+	var files []string
+	for _, w := range m.projects {
+		if w.FilePath != "" {
+			files = append(files, w.FilePath)
+		}
+	}
+	sort.Strings(files)
+	return files
+}
+
+// Start begins watching every added project
+func (m *MultiWatcher) Start() error {
+	if len(m.projects) == 0 && m.Root == "" {
+		return fmt.Errorf("no projects to watch")
+	}
+
+	m.offsets = LoadTailOffsets()
+	for _, w := range m.projects {
+		w.Mode = ModeLive
+		w.offsets = m.offsets
+		if w.FilePath == "" {
+			continue
+		}
+		if err := w.startTail(m.offsets); err != nil {
+			return err
+		}
+	}
+
+	m.Events <- Event{Type: EventSystemInit, Details: fmt.Sprintf("Watching %d projects", len(m.projects))}
+
+	m.done = make(chan struct{})
+	go func() {
+		defer close(m.done)
+		m.run()
+	}()
+	return nil
+}
+
+// Stop ends watching and waits for the loop to save its offsets; no events
+// are sent after it returns
+func (m *MultiWatcher) Stop() {
+	select {
+	case <-m.stop:
+	default:
+		close(m.stop)
+	}
+	if m.done != nil {
+		<-m.done
+	}
+}
+
+// run is the shared event loop. Per-project state is only touched here, so the
+// project watchers need no locking.
+func (m *MultiWatcher) run() {
+	defer func() {
+		for _, w := range m.projects {
+			w.closeTail()
+		}
+	}()
+
+	fw, err := fsnotify.NewWatcher()
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Warning: file notifications unavailable (%v), polling instead\n", err)
+		m.poll()
+		return
+	}
+	defer fw.Close()
+
+	// Only active projects are watched: kqueue holds a descriptor for every
+	// file in a watched directory. The rest are checked on the resync tick.
+	rootWatched := false
+	if m.Root != "" {
+		if err := fw.Add(m.Root); err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: can't watch %s (%v), polling for new projects\n", m.Root, err)
+		} else {
+			rootWatched = true
+		}
+	}
+	for dir, w := range m.projects {
+		if recentlyActive(w) {
+			m.watch(fw, dir)
+		}
+	}
+
+	resync := time.NewTicker(resyncInterval)
+	defer resync.Stop()
+
+	for {
+		select {
+		case <-m.stop:
+			return
+
+		case event, ok := <-fw.Events:
+			if !ok {
+				return
+			}
+			if event.Op&(fsnotify.Write|fsnotify.Create) == 0 {
+				continue
+			}
+			dir := filepath.Dir(event.Name)
+			if m.Root != "" && dir == m.Root {
+				// A new project started: follow it from its first conversation
+				if info, err := os.Stat(event.Name); err == nil && info.IsDir() {
+					m.addClaudeDir(event.Name)
+					m.watch(fw, event.Name)
+				}
+				continue
+			}
+			w := m.projects[dir]
+			if w == nil {
+				continue
+			}
+			if filepath.Clean(event.Name) == filepath.Clean(w.FilePath) {
+				w.readNew()
+			} else if isConversationFile(event.Name) {
+				w.considerSwitch(event.Name)
+			}
+
+		case err, ok := <-fw.Errors:
+			if !ok {
+				return
+			}
+			fmt.Fprintf(os.Stderr, "Warning: watcher error: %v\n", err)
+
+		case <-resync.C:
+			if !rootWatched {
+				m.addNewProjects()
+			}
+			for dir, w := range m.projects {
+				watched := m.watched[dir]
+				if !watched && w.projectDirChanged() {
+					w.checkForNewerFile()
+				}
+				m.catchUp(w)
+				if active := recentlyActive(w); active && !watched {
+					m.watch(fw, dir)
+				} else if !active && watched {
+					fw.Remove(dir)
+					delete(m.watched, dir)
+				}
+			}
+			m.offsets.MaybeSave()
+		}
+	}
+}
+
+// watch adds a notification watch on a project directory. A directory that
+// can't be watched is reported once and left to the resync tick.
+func (m *MultiWatcher) watch(fw *fsnotify.Watcher, dir string) {
+	if _, tried := m.watched[dir]; tried {
+		return
+	}
+	err := fw.Add(dir)
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Warning: can't watch %s (%v), polling it instead\n", dir, err)
+	}
+	m.watched[dir] = err == nil
+}
+
+// recentlyActive reports whether a project's conversation was written within
+// tailIdleClose
+func recentlyActive(w *Watcher) bool {
+	return w.FilePath != "" && time.Since(w.lastModTime) < tailIdleClose
+}
+
+// poll is the fallback loop when notifications are unavailable, backing off
+// like Watcher.pollFile while every project is idle
+func (m *MultiWatcher) poll() {
+	interval := pollMin
+	var sinceDirCheck time.Duration
+
+	for {
+		select {
+		case <-m.stop:
+			return
+		case <-time.After(interval):
+		}
+
+		sinceDirCheck += interval
+		checkDirs := sinceDirCheck >= dirCheckInterval
+		if checkDirs {
+			sinceDirCheck = 0
+			m.addNewProjects()
+		}
+
+		active := false
+		for _, w := range m.projects {
+			if checkDirs && w.projectDirChanged() && w.checkForNewerFile() {
+				active = true
+			}
+			if m.catchUp(w) {
+				active = true
+			}
+		}
+
+		if active {
+			interval = pollMin
+		} else if interval < pollMax {
+			interval = min(interval*2, pollMax)
+		}
+		m.offsets.MaybeSave()
+	}
+}
+
+// addNewProjects picks up project directories created under Root
+func (m *MultiWatcher) addNewProjects() {
+	if m.Root == "" {
+		return
+	}
+	entries, err := os.ReadDir(m.Root)
+	if err != nil {
+		return
+	}
+	for _, entry := range entries {
+		if entry.IsDir() {
+			m.addClaudeDir(filepath.Join(m.Root, entry.Name()))
+		}
+	}
+}
+
+// catchUp reads anything new in a project's conversation, opening the file
+// only if it grew, and closes handles that have been idle for tailIdleClose.
+// Returns true if the file had grown.
+func (m *MultiWatcher) catchUp(w *Watcher) bool {
+	if w.FilePath == "" {
+		return false
+	}
+	if w.tail.file == nil {
+		info, err := os.Stat(w.FilePath)
+		if err != nil || info.Size() == w.lastPos {
+			return false
+		}
+	}
+	grew := w.readNew()
+	if !grew && w.tail.file != nil && time.Since(w.tail.active) > tailIdleClose {
+		w.closeTail()
+	}
+	return grew
+}
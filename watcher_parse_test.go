@@ -0,0 +1,128 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"reflect"
+	"testing"
+)
+
+// The watcher reads lines with a byte-level scan (scanLine over eachMember,
+// eachElement and skipString) instead of json.Unmarshal. These tests run both
+// on the same lines and require the same events and content items.
+
+// unmarshalEvents is the reference path: the whole line and its content
+// decoded with json.Unmarshal, as parseLine did before the scanner
+func unmarshalEvents(w *Watcher, line []byte) []Event {
+	var msg ClaudeMessage
+	if err := json.Unmarshal(line, &msg); err != nil {
+		return nil
+	}
+	msg.items = unmarshalContent(msg.Message.Content)
+	return w.handleMessage(msg)
+}
+
+// unmarshalContent is parseMessageContent done with json.Unmarshal
+func unmarshalContent(raw json.RawMessage) []ContentItem {
+	var items []ContentItem
+	if err := json.Unmarshal(raw, &items); err == nil {
+		return items
+	}
+	var text string
+	if err := json.Unmarshal(raw, &text); err == nil {
+		return []ContentItem{{Type: "text", Text: text}}
+	}
+	return nil
+}
+
+// checkContent compares both paths on the message content of a line
+func checkContent(t *testing.T, line []byte) {
+	t.Helper()
+	var msg ClaudeMessage
+	if json.Unmarshal(line, &msg) != nil || len(msg.Message.Content) == 0 {
+		return
+	}
+	got := parseMessageContent(msg.Message.Content)
+	want := unmarshalContent(msg.Message.Content)
+	if len(got) == 0 && len(want) == 0 {
+		return
+	}
+	if !reflect.DeepEqual(got, want) {
+		t.Errorf("content items differ\n scan:      %+v\n unmarshal: %+v", got, want)
+	}
+}
+
+func TestParseLineMatchesUnmarshalSession(t *testing.T) {
+	data, err := os.ReadFile(filepath.Join("testdata", "session.jsonl"))
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	// Events depend on earlier lines, so each path keeps its own watcher
+	scan, ref := NewWatcher(), NewWatcher()
+	total := 0
+	for n, line := range splitLines(data) {
+		got := scan.parseLine(line)
+		want := unmarshalEvents(ref, line)
+		if !reflect.DeepEqual(got, want) {
+			t.Fatalf("line %d: events differ\n scan:      %+v\n unmarshal: %+v", n+1, got, want)
+		}
+		checkContent(t, line)
+		total += len(got)
+	}
+	if total == 0 {
+		t.Fatal("session produced no events; the comparison proves nothing")
+	}
+}
+
+func TestParseLineMatchesUnmarshal(t *testing.T) {
+	tests := []struct {
+		name string
+		line string
+	}{
+		// Escapes
+		{"escaped key", `{"ty\u0070e":"assistant","message":{"content":[{"type":"text","text":"hi"}],"usage":{"input_tokens":5,"output_tokens":1}}}`},
+		{"escaped key in content item", `{"type":"assistant","message":{"content":[{"\u0074ype":"tool_use","id":"toolu_1","name":"Bash","input":{"command":"ls"}}]}}`},
+		{"escaped strings", `{"type":"assistant","message":{"content":[{"type":"text","text":"say \"hi\" \\ caf\u00e9\n"}]}}`},
+		{"string ending in backslash", `{"type":"user","message":{"content":"C:\\dir\\"}}`},
+		{"escaped quote in skipped value", `{"type":"user","toolUseResult":{"stdout":"a \"}\" b \\\""},"message":{"content":"go on"}}`},
+		{"escaped summary", `{"type":"summary","summary":"Fixed \"cache\"\tbug"}`},
+
+		// Nesting
+		{"nested arrays in tool input", `{"type":"assistant","message":{"content":[{"type":"tool_use","id":"t2","name":"TodoWrite","input":{"todos":[{"content":"a","status":"in_progress","activeForm":"Doing a"}],"matrix":[[1,[2,3]],[]]}}]}}`},
+		{"tool result with array content", `{"type":"user","message":{"content":[{"type":"tool_result","tool_use_id":"t2","is_error":true,"content":[{"type":"text","text":"boom"},[["x"]]]}]}}`},
+		{"brackets inside strings", `{"type":"assistant","message":{"content":[{"type":"text","text":"]}[{"}]}}`},
+		{"empty content", `{"type":"assistant","message":{"content":[]}}`},
+
+		// Unknown fields and layout
+		{"unknown fields", `{"futureField":{"a":[1,{"b":"]}"}],"c":null},"type":"summary","summary":"Refactored the cache","extra":[true,false,-1.5e3]}`},
+		{"unknown types", `{"type":"file-history-snapshot","snapshot":{"trackedFileBackups":{}}}`},
+		{"whitespace", " { \"type\" : \"result\" ,\t\"subtype\" : \"success\" } "},
+		{"compact boundary", `{"type":"system","subtype":"compact_boundary","compactMetadata":{"trigger":"auto","preTokens":150000}}`},
+
+		// Truncated and malformed
+		{"truncated string", `{"type":"assistant","message":{"content":[{"type":"text","text":"hel`},
+		{"truncated object", `{"type":"summary","summary":"cut"`},
+		{"truncated after comma", `{"type":"summary","summary":"cut",`},
+		{"unterminated escape", `{"type":"summary","summary":"x\"}`},
+		{"missing colon", `{"type" "summary","summary":"x"}`},
+		{"missing comma", `{"type":"summary" "summary":"x"}`},
+		{"trailing data", `{"type":"summary","summary":"x"} {"type":"summary","summary":"y"}`},
+		{"trailing data in content", `{"type":"assistant","message":{"content":[{"type":"text","text":"a"}]x}}`},
+		{"not an object", `["type","summary"]`},
+		{"empty", ``},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			line := []byte(tt.line)
+			got := NewWatcher().parseLine(line)
+			want := unmarshalEvents(NewWatcher(), line)
+			if !reflect.DeepEqual(got, want) {
+				t.Errorf("events differ\n scan:      %+v\n unmarshal: %+v", got, want)
+			}
+			checkContent(t, line)
+		})
+	}
+}
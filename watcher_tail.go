@@ -0,0 +1,288 @@
+package main
+
+import (
+	"bufio"
+	"bytes"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"strings"
+	"time"
+
+	"github.com/fsnotify/fsnotify"
+)
+
+const (
+	// maxLineSize matches the old scanner limit; longer lines are skipped
+	maxLineSize = 10 * 1024 * 1024
+
+	// resyncInterval is a safety net for filesystems that drop notifications
+	resyncInterval = 5 * time.Second
+
+	// Polling fallback: back off from pollMin to pollMax while the file is idle
+	pollMin = 50 * time.Millisecond
+	pollMax = 2 * time.Second
+
+	// dirCheckInterval is how often polling mode checks the project directory
+	// for new conversations; a full rescan only happens if it changed, or every
+	// fullScanInterval to catch appends to older conversations
+	dirCheckInterval = 2 * time.Second
+	fullScanInterval = 30 * time.Second
+
+	// resumeMaxGap is the most unread data StartLive will catch up on from a
+	// saved offset; further behind than this, only new events matter
+	resumeMaxGap = 256 * 1024
+)
+
+// tailState is the open conversation file and the buffers reused across reads
+type tailState struct {
+	file    *os.File
+	reader  *bufio.Reader
+	line    []byte
+	partial bool      // line holds an unterminated tail still being written
+	active  time.Time // when the file was opened or last grew
+}
+
+// openTail opens path and positions it at offset
+func (w *Watcher) openTail(path string, offset int64) error {
+	w.closeTail()
+
+	file, err := os.Open(path)
+	if err != nil {
+		return err
+	}
+	if _, err := file.Seek(offset, io.SeekStart); err != nil {
+		file.Close()
+		return err
+	}
+	if w.tail.reader == nil {
+		w.tail.reader = bufio.NewReaderSize(file, 64*1024)
+	} else {
+		w.tail.reader.Reset(file)
+	}
+	w.tail.file = file
+	w.tail.line = w.tail.line[:0]
+	w.tail.partial = false
+	w.tail.active = time.Now()
+	w.lastPos = offset
+	return nil
+}
+
+// closeTail closes the open file and saves its offset unthrottled, so a
+// switch or shutdown doesn't lose the last read position
+func (w *Watcher) closeTail() {
+	if w.tail.file != nil {
+		w.tail.file.Close()
+		w.tail.file = nil
+	}
+	w.offsets.Flush()
+}
+
+// emit sends an event unless the watcher has been stopped, so a full channel
+// nobody reads any more can't block shutdown
+func (w *Watcher) emit(evt Event) {
+	select {
+	case w.Events <- evt:
+	case <-w.stop:
+	}
+}
+
+// resumeOffset returns where to start reading path: its saved offset when
+// that is still valid and no more than maxGap behind size, else fallback
+func (w *Watcher) resumeOffset(path string, size, maxGap, fallback int64) int64 {
+	if off, ok := w.offsets.Get(path); ok && off <= size && size-off <= maxGap {
+		return off
+	}
+	return fallback
+}
+
+// tailFile follows the conversation file. It sleeps until fsnotify reports a
+// write in the project directory, and falls back to polling with backoff only
+// when notifications are unavailable.
+func (w *Watcher) tailFile() {
+	defer w.closeTail()
+
+	fw, err := fsnotify.NewWatcher()
+	if err == nil {
+		if err = fw.Add(w.watchDir()); err != nil {
+			fw.Close()
+		}
+	}
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Warning: file notifications unavailable (%v), polling instead\n", err)
+		w.pollFile()
+		return
+	}
+	defer fw.Close()
+
+	resync := time.NewTicker(resyncInterval)
+	defer resync.Stop()
+
+	for {
+		select {
+		case <-w.stop:
+			return
+
+		case event, ok := <-fw.Events:
+			if !ok {
+				return
+			}
+			if event.Op&(fsnotify.Write|fsnotify.Create) == 0 {
+				continue
+			}
+			if filepath.Clean(event.Name) == filepath.Clean(w.FilePath) {
+				w.readNew()
+			} else if isConversationFile(event.Name) {
+				w.considerSwitch(event.Name)
+			}
+
+		case err, ok := <-fw.Errors:
+			if !ok {
+				return
+			}
+			fmt.Fprintf(os.Stderr, "Warning: watcher error: %v\n", err)
+
+		case <-resync.C:
+			w.readNew()
+			w.offsets.MaybeSave()
+		}
+	}
+}
+
+// pollFile is the fallback tail loop. It polls quickly while the file is
+// growing and backs off towards pollMax while it is idle.
+func (w *Watcher) pollFile() {
+	interval := pollMin
+	var sinceDirCheck, sinceFullScan time.Duration
+
+	for {
+		select {
+		case <-w.stop:
+			return
+		case <-time.After(interval):
+		}
+
+		sinceDirCheck += interval
+		sinceFullScan += interval
+		if sinceDirCheck >= dirCheckInterval {
+			sinceDirCheck = 0
+			if sinceFullScan >= fullScanInterval || w.projectDirChanged() {
+				sinceFullScan = 0
+				if w.checkForNewerFile() {
+					interval = pollMin
+					continue
+				}
+			}
+		}
+
+		if w.readNew() {
+			interval = pollMin
+		} else if interval < pollMax {
+			interval = min(interval*2, pollMax)
+		}
+		w.offsets.MaybeSave()
+	}
+}
+
+// watchDir is the directory whose notifications drive the tail
+func (w *Watcher) watchDir() string {
+	if w.ProjectDir != "" {
+		return w.ProjectDir
+	}
+	return filepath.Dir(w.FilePath)
+}
+
+// isConversationFile reports whether path is a top-level conversation log
+func isConversationFile(path string) bool {
+	name := filepath.Base(path)
+	return strings.HasSuffix(name, ".jsonl") && !strings.HasPrefix(name, "agent-")
+}
+
+// considerSwitch switches to another conversation file that was just written,
+// if it is newer than the one being followed. The followed file is compared
+// by its live mtime: its own write event may not have been handled yet.
+func (w *Watcher) considerSwitch(path string) {
+	if w.ProjectDir == "" {
+		return
+	}
+	current := w.lastModTime
+	if cur, err := os.Stat(w.FilePath); err == nil && cur.ModTime().After(current) {
+		current = cur.ModTime()
+	}
+	info, err := os.Stat(path)
+	if err != nil || !info.ModTime().After(current) {
+		return
+	}
+	w.switchTo(path, info.ModTime())
+	w.readNew()
+}
+
+// readNew parses every complete line appended since the last read, reusing
+// the open handle and buffers. An unterminated last line (Claude Code is still
+// writing it) stays buffered and is parsed once its newline arrives; lastPos
+// only ever advances past complete lines. Returns true if the file had grown.
+func (w *Watcher) readNew() bool {
+	if w.tail.file == nil {
+		if err := w.openTail(w.FilePath, w.lastPos); err != nil {
+			return false
+		}
+	}
+
+	info, err := w.tail.file.Stat()
+	if err != nil {
+		return false
+	}
+	w.lastModTime = info.ModTime()
+	if info.Size() < w.lastPos {
+		// Truncated or replaced: start over from the beginning
+		if err := w.openTail(w.FilePath, 0); err != nil {
+			return false
+		}
+	}
+	if info.Size() == w.lastPos+int64(len(w.tail.line)) {
+		return false
+	}
+
+	for {
+		line, err := w.readLine()
+		if err != nil {
+			break
+		}
+		w.lastPos += int64(len(line))
+		if line = bytes.TrimRight(line, "\r\n"); len(line) > 0 && len(line) <= maxLineSize {
+			for _, evt := range w.parseLine(line) {
+				w.emit(evt)
+			}
+		}
+	}
+	if !w.tail.partial && cap(w.tail.line) > 1024*1024 {
+		w.tail.line = nil // don't pin a huge tool-output line's buffer
+	}
+	w.offsets.Set(w.FilePath, w.lastPos)
+	w.tail.active = time.Now()
+	return true
+}
+
+// readLine returns the next complete line including its newline. At end of
+// file it returns io.EOF and keeps any unterminated bytes, so the next call
+// continues the same line. The returned slice is reused by the next call.
+func (w *Watcher) readLine() ([]byte, error) {
+	if !w.tail.partial {
+		w.tail.line = w.tail.line[:0]
+	}
+	for {
+		chunk, err := w.tail.reader.ReadSlice('\n')
+		w.tail.line = append(w.tail.line, chunk...)
+		switch err {
+		case nil:
+			w.tail.partial = false
+			return w.tail.line, nil
+		case bufio.ErrBufferFull:
+			continue
+		default:
+			w.tail.partial = len(w.tail.line) > 0
+			return nil, err
+		}
+	}
+}
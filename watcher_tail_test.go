@@ -0,0 +1,153 @@
+package main
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+// toolLine is a conversation line that produces one event naming tool
+func toolLine(tool string) string {
+	return `{"type":"assistant","message":{"content":[{"type":"tool_use","id":"` + tool + `","name":"` + tool + `","input":{}}]}}` + "\n"
+}
+
+// tempOffsets points the offsets file (and the exercise log) at a temp dir
+func tempOffsets(t *testing.T) {
+	t.Helper()
+	dir := t.TempDir()
+	t.Setenv("HOME", dir)
+	t.Setenv("XDG_CONFIG_HOME", dir)
+}
+
+// newTailWatcher follows path from offset without starting the tail loop, so
+// each test drives readNew itself
+func newTailWatcher(t *testing.T, path string, offset int64) *Watcher {
+	t.Helper()
+	w := NewWatcher()
+	w.FilePath = path
+	if err := w.openTail(path, offset); err != nil {
+		t.Fatal(err)
+	}
+	t.Cleanup(w.closeTail)
+	return w
+}
+
+// appendFile writes s to the end of path
+func appendFile(t *testing.T, path, s string) {
+	t.Helper()
+	f, err := os.OpenFile(path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer f.Close()
+	if _, err := f.WriteString(s); err != nil {
+		t.Fatal(err)
+	}
+}
+
+// drainTools returns the tool names of the events sent so far
+func drainTools(w *Watcher) []string {
+	var tools []string
+	for {
+		select {
+		case evt := <-w.Events:
+			if evt.ToolName != "" {
+				tools = append(tools, evt.ToolName)
+			}
+		default:
+			return tools
+		}
+	}
+}
+
+func checkTools(t *testing.T, got []string, want ...string) {
+	t.Helper()
+	if len(got) != len(want) {
+		t.Fatalf("got tools %v, want %v", got, want)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Fatalf("got tools %v, want %v", got, want)
+		}
+	}
+}
+
+func TestReadNewCarriesSplitLine(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "session.jsonl")
+	appendFile(t, path, "")
+	w := newTailWatcher(t, path, 0)
+
+	line := toolLine("Split")
+	appendFile(t, path, toolLine("First")+line[:20])
+	w.readNew()
+	checkTools(t, drainTools(w), "First")
+	if want := int64(len(toolLine("First"))); w.lastPos != want {
+		t.Fatalf("lastPos = %d past a partial line, want %d", w.lastPos, want)
+	}
+
+	appendFile(t, path, line[20:40])
+	w.readNew()
+	checkTools(t, drainTools(w))
+
+	appendFile(t, path, line[40:])
+	w.readNew()
+	checkTools(t, drainTools(w), "Split")
+	if info, _ := os.Stat(path); w.lastPos != info.Size() {
+		t.Fatalf("lastPos = %d, want %d", w.lastPos, info.Size())
+	}
+}
+
+func TestReadNewRestartsAfterTruncation(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "session.jsonl")
+	appendFile(t, path, toolLine("Old")+toolLine("Older"))
+	w := newTailWatcher(t, path, 0)
+	w.readNew()
+	checkTools(t, drainTools(w), "Old", "Older")
+
+	if err := os.WriteFile(path, []byte(toolLine("New")), 0644); err != nil {
+		t.Fatal(err)
+	}
+	w.readNew()
+	checkTools(t, drainTools(w), "New")
+	if want := int64(len(toolLine("New"))); w.lastPos != want {
+		t.Fatalf("lastPos = %d, want %d", w.lastPos, want)
+	}
+}
+
+func TestTailResumesFromSavedOffset(t *testing.T) {
+	tempOffsets(t)
+	path := filepath.Join(t.TempDir(), "session.jsonl")
+	appendFile(t, path, toolLine("Seen"))
+
+	// First run: read everything, then close, which must save unthrottled
+	w := NewWatcher()
+	w.FilePath = path
+	w.offsets = LoadTailOffsets()
+	w.offsets.lastSave = time.Now() // so only an unthrottled save writes
+	if err := w.openTail(path, 0); err != nil {
+		t.Fatal(err)
+	}
+	w.readNew()
+	w.closeTail()
+	checkTools(t, drainTools(w), "Seen")
+
+	// Written while not running
+	appendFile(t, path, toolLine("Missed"))
+
+	w = NewWatcher()
+	w.FilePath = path
+	w.ProjectDir = filepath.Dir(path)
+	if err := w.startTail(LoadTailOffsets()); err != nil {
+		t.Fatal(err)
+	}
+	if want := int64(len(toolLine("Seen"))); w.lastPos != want {
+		t.Fatalf("resumed at %d, want saved offset %d", w.lastPos, want)
+	}
+	if err := w.openTail(path, w.lastPos); err != nil {
+		t.Fatal(err)
+	}
+	t.Cleanup(w.closeTail)
+	w.readNew()
+	checkTools(t, drainTools(w), "Missed")
+}